@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+import warnings
+
+from ansys.aedt.core.aedt_logger import pyaedt_logger as logger
+from ansys.aedt.toolkits.radar_explorer.rcs_visualization import MonostaticRCSData
+from ansys.aedt.toolkits.radar_explorer.rcs_visualization import RCSProductCache
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    warnings.warn(
+        "The NumPy module is required to use the 'rcs_library.py' module.\nInstall with \n\npip install numpy"
+    )
+    np = None
+
+try:
+    import tables
+except ImportError:  # pragma: no cover
+    warnings.warn(
+        "The PyTables module is required to use the 'rcs_library.py' module.\nInstall with \n\npip install tables"
+    )
+    tables = None
+
+LIBRARY_PRODUCTS = ("range_profile", "isar_2d")
+
+# RCS data of the worker process, keyed by the input file and the settings
+_worker_data = {}
+
+
+def export_rcs_library(
+    input_file,
+    output_file,
+    products=LIBRARY_PRODUCTS,
+    settings=None,
+    block_size=8,
+    processes=None,
+    complevel=5,
+    resume=True,
+):
+    """Export the range profiles and ISAR images of all the aspects of a monostatic RCS simulation.
+
+    Range profiles are computed for every incident wave (phi, theta) pair. ISAR images are computed for every cut
+    of the aspect range: one per incident wave theta for ``"Horizontal"`` and one per incident wave phi for
+    ``"Vertical"``. The aspects are split into blocks that a pool of processes computes, and the results are written
+    to a chunked and compressed HDF5 file together with the aspect angles and the settings.
+
+    Each block is flagged in the file once it is written, so an interrupted export resumes with the missing blocks
+    when it runs again with the same arguments and the same input files.
+
+    When a pool of processes is used and the monostatic file is not chunked, it is converted once to a temporary
+    chunked file next to the output file, so that each process reads only the blocks it needs instead of loading the
+    whole table.
+
+    Parameters
+    ----------
+    input_file : str or :class:`pathlib.Path`
+        Metadata information in a JSON file.
+    output_file : str or :class:`pathlib.Path`
+        Full path of the HDF5 file.
+    products : tuple, optional
+        Products to export. Options are ``"range_profile"`` and ``"isar_2d"``. The default is both.
+    settings : dict, optional
+        Values keyed by the name of a :class:`MonostaticRCSData
+        <ansys.aedt.toolkits.radar_explorer.rcs_visualization.MonostaticRCSData>` property, such as ``window`` or
+        ``upsample_range``. The default is ``None``, in which case the default settings are used.
+    block_size : int, default: ``8``
+        Number of incident wave phi angles or ISAR cuts computed per task.
+    processes : int, optional
+        Number of worker processes. The default is ``None``, in which case the number of CPUs is used.
+        If ``1``, the blocks are computed in this process.
+    complevel : int, default: ``5``
+        Compression level from ``0`` to ``9``.
+    resume : bool, default: ``True``
+        Whether to resume an existing export. If ``False``, the output file is overwritten.
+
+    Returns
+    -------
+    dict or bool
+        Throughput report of this run keyed by product name, with the number of ``"images"``, the elapsed
+        ``"seconds"``, and the ``"images_per_second"``. The products are computed one after the other, so each
+        product is timed on its own. ``False`` when failed.
+
+    Examples
+    --------
+    >>> from ansys.aedt.toolkits.radar_explorer.rcs_library import export_rcs_library
+    >>> report = export_rcs_library("rcs_metadata.json", "library.h5", settings={"window": "Hann"})
+    >>> report["isar_2d"]["images_per_second"]
+    """
+    if tables is None:  # pragma: no cover
+        logger.error("The PyTables module is required to export RCS libraries.")
+        return False
+    settings = dict(settings or {})
+    for name in settings:
+        if not isinstance(getattr(MonostaticRCSData, name, None), property):
+            logger.error(f"Setting '{name}' is not available.")
+            return False
+    for product in products:
+        if product not in LIBRARY_PRODUCTS:
+            logger.error(f"Product '{product}' is not available for libraries.")
+            return False
+    if not isinstance(block_size, int) or block_size < 1:
+        logger.error("Block size must be a positive integer.")
+        return False
+
+    input_file = str(Path(input_file).resolve())
+    output_file = Path(output_file)
+    rcs_data = _rcs_data(input_file, settings)
+    nphi = rcs_data.available_incident_wave_phi.size
+    ntheta = rcs_data.available_incident_wave_theta.size
+    cut_name = "IWaveTheta" if rcs_data.aspect_range == "Horizontal" else "IWavePhi"
+    sizes = {"range_profile": nphi, "isar_2d": ntheta if cut_name == "IWaveTheta" else nphi}
+    sizes = {product: sizes[product] for product in products}
+    config = json.dumps(
+        {
+            "input_file": input_file,
+            "source": _source_signature(rcs_data),
+            "products": list(products),
+            "settings": settings,
+            "block_size": block_size,
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+    h5 = _open_library(output_file, config, rcs_data, sizes, cut_name, block_size, resume)
+    if h5 is None:
+        return False
+
+    report = {product: {"images": 0, "seconds": 0.0, "images_per_second": 0.0} for product in products}
+    filters = tables.Filters(complevel=complevel, complib="zlib", shuffle=True)
+    processes = os.cpu_count() if processes is None else processes
+    scratch_files = []
+    try:
+        blocks = {}
+        for product in products:
+            done = getattr(h5.root, product).done
+            blocks[product] = [
+                (product, start, min(start + block_size, sizes[product]))
+                for block, start in enumerate(range(0, sizes[product], block_size))
+                if not done[block]
+            ]
+
+        source_file = input_file
+        if processes > 1 and sum(len(value) for value in blocks.values()) > 1 and not rcs_data.is_chunked:
+            scratch_files = _chunked_source(rcs_data, output_file)
+            source_file = str(scratch_files[-1])
+            _worker_data.clear()
+
+        for product, product_blocks in blocks.items():
+            if not product_blocks:
+                continue
+            start_time = time.perf_counter()
+            tasks = [(source_file, settings) + block for block in product_blocks]
+            for task, (data, axes) in _run_tasks(tasks, processes):
+                start, stop = task[3:]
+                _write_block(h5, product, start, stop, data, axes, sizes[product], filters)
+                getattr(h5.root, product).done[start // block_size] = True
+                h5.flush()
+                images = data.shape[0] * data.shape[1] if product == "range_profile" else data.shape[0]
+                report[product]["images"] += images
+            report[product]["seconds"] = time.perf_counter() - start_time
+    finally:
+        h5.close()
+        _worker_data.clear()
+        for scratch_file in scratch_files:
+            Path(scratch_file).unlink(missing_ok=True)
+
+    for product, values in report.items():
+        if values["seconds"] > 0.0:
+            values["images_per_second"] = values["images"] / values["seconds"]
+        logger.info(
+            f"Exported {values['images']} {product} images in {values['seconds']:.2f} s "
+            f"({values['images_per_second']:.1f} images/s)."
+        )
+    return report
+
+
+def _source_signature(rcs_data):
+    """Get the size and modification time of the input files, which must not change while an export resumes."""
+    files = {"input_file": rcs_data.input_file}
+    if rcs_data.metadata["monostatic_file"]:
+        files["monostatic_file"] = rcs_data.output_dir / rcs_data.metadata["monostatic_file"]
+    signature = {}
+    for name, file_name in files.items():
+        stat = Path(file_name).stat()
+        signature[name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    return signature
+
+
+def _chunked_source(rcs_data, output_file):
+    """Convert the monostatic data to a temporary chunked file next to the output file.
+
+    Returns
+    -------
+    list
+        Temporary chunked file and its metadata file.
+    """
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    scratch_files = []
+    for suffix in [".h5", ".json"]:
+        handle, file_name = tempfile.mkstemp(
+            suffix=suffix, prefix=f"{output_file.stem}_source_", dir=output_file.parent
+        )
+        os.close(handle)
+        scratch_files.append(Path(file_name))
+    try:
+        rcs_data.convert_to_chunked(output_file=scratch_files[0], metadata_file=scratch_files[1])
+    except Exception:
+        for scratch_file in scratch_files:
+            scratch_file.unlink(missing_ok=True)
+        raise
+    return scratch_files
+
+
+def _open_library(output_file, config, rcs_data, sizes, cut_name, block_size, resume):
+    """Open a library to resume it, or create it with the aspect angles and the block flags."""
+    if resume and output_file.is_file():
+        h5 = tables.open_file(output_file, mode="a")
+        if h5.root._v_attrs["config"] != config:
+            h5.close()
+            logger.error("Library was exported with other arguments. Set resume to False to overwrite it.")
+            return None
+        return h5
+
+    phi = np.asarray(rcs_data.available_incident_wave_phi, dtype=float)
+    theta = np.asarray(rcs_data.available_incident_wave_theta, dtype=float)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    h5 = tables.open_file(output_file, mode="w")
+    h5.root._v_attrs["config"] = config
+    h5.root._v_attrs["solution"] = rcs_data.solution
+    h5.root._v_attrs["name"] = rcs_data.name
+    h5.root._v_attrs["frequency_units"] = rcs_data.frequency_units
+    h5.create_array("/", "Freq", np.asarray(rcs_data.frequencies, dtype=float))
+    h5.create_array("/", "IWavePhi", phi)
+    h5.create_array("/", "IWaveTheta", theta)
+    for product, size in sizes.items():
+        group = h5.create_group("/", product)
+        h5.create_array(group, "done", np.zeros(-(-size // block_size), dtype=bool))
+        if product == "isar_2d":
+            group._v_attrs["cut"] = cut_name
+            h5.create_array(group, cut_name, theta if cut_name == "IWaveTheta" else phi)
+    return h5
+
+
+def _run_tasks(tasks, processes):
+    """Compute the blocks of the tasks and yield them as they complete."""
+    if processes <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield task, _compute_block(*task)
+        return
+    with ProcessPoolExecutor(max_workers=min(processes, len(tasks))) as executor:
+        futures = {executor.submit(_compute_block, *task): task for task in tasks}
+        for future in as_completed(futures):
+            yield futures.pop(future), future.result()
+
+
+def _rcs_data(input_file, settings):
+    """Get the RCS data of this process for an input file and settings."""
+    key = (input_file, json.dumps(settings, sort_keys=True, default=str))
+    rcs_data = _worker_data.get(key)
+    if rcs_data is None:
+        # Each image of a library is computed once, so its products and stages are not cached
+        rcs_data = MonostaticRCSData(
+            input_file=input_file, product_cache=RCSProductCache(max_bytes=0), stage_cache=RCSProductCache(max_bytes=0)
+        )
+        for name, value in settings.items():
+            setattr(rcs_data, name, value)
+        _worker_data.clear()
+        _worker_data[key] = rcs_data
+    return rcs_data
+
+
+def _compute_block(input_file, settings, product, start, stop):
+    """Compute a block of a library product.
+
+    Returns
+    -------
+    tuple
+        Images with the aspects along the first axis and their axes.
+    """
+    rcs_data = _rcs_data(input_file, settings)
+    if product == "range_profile":
+        slab = rcs_data.range_profile_slab(start, stop)
+        return np.moveaxis(slab.data, 0, -1), {"Range": slab.axes["Range"]}
+
+    images = []
+    axes = None
+    for index in range(start, stop):
+        if rcs_data.aspect_range == "Horizontal":
+            rcs_data.incident_wave_theta = rcs_data.available_incident_wave_theta[index]
+        else:
+            rcs_data.incident_wave_phi = rcs_data.available_incident_wave_phi[index]
+        isar = rcs_data.isar_2d
+        images.append(isar.data)
+        axes = isar.axes
+    return np.stack(images), axes
+
+
+def _write_block(h5, product, start, stop, data, axes, size, filters):
+    """Write a block of a library product, creating the chunked array on the first block."""
+    group = getattr(h5.root, product)
+    if "data" not in group:
+        for name, values in axes.items():
+            h5.create_array(group, name.replace("-", "_"), np.asarray(values))
+        group._v_attrs["axes"] = [name.replace("-", "_") for name in axes]
+        h5.create_carray(
+            group,
+            "data",
+            atom=tables.Atom.from_dtype(data.dtype),
+            shape=(size,) + data.shape[1:],
+            chunkshape=(1,) + data.shape[1:],
+            filters=filters,
+        )
+    group.data[start:stop] = data
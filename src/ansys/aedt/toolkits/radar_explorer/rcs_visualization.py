@@ -16,11 +16,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from enum import Enum
+from functools import lru_cache
+from functools import partial
+import hashlib
+import itertools
 import json
+import os
 from pathlib import Path
 import sys
+import tempfile
+import threading
+import tracemalloc
 import warnings
+import weakref
 
 from ansys.aedt.core.aedt_logger import pyaedt_logger as logger
 from ansys.aedt.core.generic.constants import AEDT_UNITS
@@ -39,7 +51,11 @@ if current_python_version < (3, 10):  # pragma: no cover
     raise Exception("Python 3.10 or later is required for radar postprocessing.")
 
 try:
+    from scipy import fft as scipy_fft
     from scipy.interpolate import RegularGridInterpolator
+    from scipy.signal import windows as scipy_windows
+    from scipy.sparse import csr_matrix
+    from scipy.spatial import cKDTree
 except ImportError:  # pragma: no cover
     warnings.warn(
         "The SciPy module is required to use the 'rcs_visualization.py' module.\nInstall with \n\npip install scipy"
@@ -74,6 +90,276 @@ except ImportError:  # pragma: no cover
     )
     pd = None
 
+try:
+    import tables
+except ImportError:  # pragma: no cover
+    warnings.warn(
+        "The PyTables module is required to use the 'rcs_visualization.py' module.\nInstall with \n\npip install tables"
+    )
+    tables = None
+
+try:
+    import pyfftw
+    import pyfftw.interfaces.numpy_fft as pyfftw_fft
+
+    pyfftw.interfaces.cache.enable()
+except ImportError:  # pragma: no cover
+    pyfftw = None
+
+try:
+    import platformdirs
+except ImportError:  # pragma: no cover
+    platformdirs = None
+
+
+class RCSProductCache(object):
+    """Provides a least recently used cache for derived RCS products.
+
+    Products such as range profiles and ISAR images are stored under a key built from the settings
+    used to compute them. When the total size of the stored products exceeds the byte budget, the
+    least recently used products are evicted.
+
+    Parameters
+    ----------
+    max_bytes : int, default: ``536870912``
+        Maximum number of bytes held by the cache. Use ``0`` to disable caching.
+
+    Examples
+    --------
+    >>> from ansys.aedt.toolkits.radar_explorer.rcs_visualization import RCSProductCache
+    >>> cache = RCSProductCache(max_bytes=1024**3)
+    """
+
+    def __init__(self, max_bytes=512 * 1024**2):
+        self.__items = OrderedDict()
+        self.__nbytes = 0
+        self.__max_bytes = int(max_bytes)
+        self.__hits = 0
+        self.__misses = 0
+
+    def __len__(self):
+        """Get the number of cached products."""
+        return len(self.__items)
+
+    def __contains__(self, key):
+        """Check whether a product key is cached."""
+        return key in self.__items
+
+    @property
+    def max_bytes(self):
+        """Maximum number of bytes held by the cache."""
+        return self.__max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, val):
+        self.__max_bytes = max(int(val), 0)
+        self.__evict()
+
+    @property
+    def nbytes(self):
+        """Number of bytes currently held by the cache."""
+        return self.__nbytes
+
+    @property
+    def hits(self):
+        """Number of lookups that found a cached product."""
+        return self.__hits
+
+    @property
+    def misses(self):
+        """Number of lookups that did not find a cached product."""
+        return self.__misses
+
+    def get(self, key):
+        """Get a cached product.
+
+        Parameters
+        ----------
+        key : tuple
+            Product key.
+
+        Returns
+        -------
+        object
+            Cached product, or ``None`` if the key is not cached.
+        """
+        if key in self.__items:
+            self.__hits += 1
+            self.__items.move_to_end(key)
+            return self.__items[key][0]
+        self.__misses += 1
+        return None
+
+    def put(self, key, value):
+        """Store a product.
+
+        Products larger than the byte budget are not stored.
+
+        Parameters
+        ----------
+        key : tuple
+            Product key.
+        value : object
+            Product to store.
+
+        Returns
+        -------
+        bool
+            ``True`` when the product is stored, ``False`` otherwise.
+        """
+        self.pop(key)
+        size = self.sizeof(value)
+        if value is None or size > self.__max_bytes:
+            return False
+        self.__items[key] = (value, size)
+        self.__nbytes += size
+        self.__evict()
+        return True
+
+    def pop(self, key):
+        """Remove a product from the cache.
+
+        Parameters
+        ----------
+        key : tuple
+            Product key.
+
+        Returns
+        -------
+        object
+            Removed product, or ``None`` if the key is not cached.
+        """
+        if key not in self.__items:
+            return None
+        value, size = self.__items.pop(key)
+        self.__nbytes -= size
+        return value
+
+    def discard(self, owner):
+        """Remove all the products of an owner.
+
+        Parameters
+        ----------
+        owner : int
+            Identifier of the owner, which is the first item of the keys of its products.
+
+        Returns
+        -------
+        int
+            Number of removed products.
+        """
+        keys = [key for key in self.__items if isinstance(key, tuple) and key and key[0] == owner]
+        for key in keys:
+            self.pop(key)
+        return len(keys)
+
+    def clear(self):
+        """Remove all products and reset the hit and miss counters."""
+        self.__items.clear()
+        self.__nbytes = 0
+        self.__hits = 0
+        self.__misses = 0
+
+    @staticmethod
+    def sizeof(value):
+        """Estimate the memory used by a product.
+
+        Parameters
+        ----------
+        value : object
+            Product.
+
+        Returns
+        -------
+        int
+            Size in bytes.
+        """
+        if pd is not None and isinstance(value, (pd.DataFrame, pd.Series)):
+            return int(np.sum(value.memory_usage(index=True, deep=False)))
+        if hasattr(value, "nnz"):
+            # Sparse matrix
+            return int(sum(getattr(value, name).nbytes for name in ["data", "indices", "indptr"]))
+        if hasattr(value, "nbytes"):
+            return int(value.nbytes)
+        if isinstance(value, (tuple, list)):
+            return sum(RCSProductCache.sizeof(item) for item in value)
+        if isinstance(value, dict):
+            return sum(RCSProductCache.sizeof(item) for item in value.values())
+        return sys.getsizeof(value)
+
+    def __evict(self):
+        while self.__items and self.__nbytes > self.__max_bytes:
+            _, (_, size) = self.__items.popitem(last=False)
+            self.__nbytes -= size
+
+
+class MonostaticRCSResult(object):
+    """Provides a monostatic RCS result on a regular grid.
+
+    Waterfall and ISAR results are images. This class stores the image as an N-D array together with the vector of
+    each axis, so that consumers can use the image directly instead of rebuilding it from a flattened table.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Image with one dimension per axis.
+    axes : dict
+        Axis vectors keyed by axis name, in the order of the image dimensions.
+
+    Examples
+    --------
+    >>> from ansys.aedt.toolkits.radar_explorer.rcs_visualization import MonostaticRCSData
+    >>> rcs_data = MonostaticRCSData(input_file=metadata_file)
+    >>> isar_2d = rcs_data.isar_2d
+    >>> isar_2d.data.shape
+    >>> isar_2d.axes["Down-range"]
+    >>> df = isar_2d.to_dataframe()
+    """
+
+    def __init__(self, data, axes):
+        self.__data = np.asanyarray(data)
+        self.__axes = {name: np.asarray(axis) for name, axis in axes.items()}
+        if tuple(axis.size for axis in self.__axes.values()) != self.__data.shape:
+            raise ValueError("Axes sizes do not match the data shape.")
+
+    @property
+    def data(self):
+        """Image data."""
+        return self.__data
+
+    @property
+    def axes(self):
+        """Axis vectors keyed by axis name."""
+        return self.__axes
+
+    @property
+    def shape(self):
+        """Image shape."""
+        return self.__data.shape
+
+    @property
+    def nbytes(self):
+        """Number of bytes held in memory by the image and its axes.
+
+        Memory-mapped images are not counted.
+        """
+        data_bytes = 0 if isinstance(self.__data, np.memmap) else self.__data.nbytes
+        return data_bytes + sum(axis.nbytes for axis in self.__axes.values())
+
+    @pyaedt_function_handler()
+    def to_dataframe(self):
+        """Flatten the result into a table.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            One column per axis and a ``"Data"`` column, with one row per image pixel in C order.
+        """
+        grids = np.meshgrid(*self.__axes.values(), indexing="ij")
+        df = pd.DataFrame({name: grid.ravel() for name, grid in zip(self.__axes, grids)})
+        df["Data"] = self.__data.ravel()
+        return df
+
 
 class MonostaticRCSData(object):
     """Provides monostatic RCS data.
@@ -87,6 +373,16 @@ class MonostaticRCSData(object):
     ----------
     input_file : str
         Metadata information in a JSON file.
+    binary_cache : bool, default: ``False``
+        Whether to keep the dense RCS data in a binary sidecar next to the monostatic file. The sidecar is written
+        the first time the data is loaded and memory-mapped on the next loads, which avoids parsing the HDF5 file.
+        The sidecar takes as much disk space as the dense data and its checksum is verified on each load.
+    product_cache : :class:`RCSProductCache`, default: ``None``
+        Cache of derived products. The default is ``None``, in which case the cache shared by all the instances
+        is used, so that the memory budget holds for all the loaded polarizations together.
+    stage_cache : :class:`RCSProductCache`, default: ``None``
+        Cache of the intermediate stages of the ISAR images. The default is ``None``, in which case the cache
+        shared by all the instances is used. Its memory budget is 1 GB.
 
     Examples
     --------
@@ -99,7 +395,24 @@ class MonostaticRCSData(object):
     >>> rcs_data = MonostaticRCSData(input_file=metadata_file)
     """
 
-    def __init__(self, input_file):
+    # Resampling operators only depend on the axes, so they are shared by all the instances
+    __resampling_cache = RCSProductCache(max_bytes=256 * 1024**2)
+    # Derived products of all the instances share one memory budget by default
+    __shared_product_cache = RCSProductCache()
+    # Intermediate stages of the ISAR images are larger than the images, so they have their own budget
+    __shared_stage_cache = RCSProductCache(max_bytes=1024**3)
+    # Identifiers that keep the products of the instances apart in a shared cache
+    __cache_ids = itertools.count()
+
+    # Increase when the layout of the binary sidecar changes
+    __binary_cache_version = 2
+    __window_defaults = {
+        "Taylor": {"nbar": 4, "sll": 30.0},
+        "Kaiser": {"beta": 8.6},
+        "Chebyshev": {"at": 60.0},
+    }
+
+    def __init__(self, input_file, binary_cache=False, product_cache=None, stage_cache=None):
         input_file = Path(input_file)
         # Public
         self.output_dir = input_file.parent
@@ -111,6 +424,11 @@ class MonostaticRCSData(object):
         self.__logger = logger
         self.__input_file = input_file
         self.__raw_data = {}
+        self.__rcs_cube = None
+        self.__data_version = 0
+        self.__chunked = False
+        self.__binary_cache = binary_cache
+        self.__binary_cache_header = None
         self.__frequency = None
         self.__name = None
         self.__solution = None
@@ -119,6 +437,12 @@ class MonostaticRCSData(object):
         self.__incident_wave_phi = None
         self.__available_incident_wave_theta = None
         self.__available_incident_wave_phi = None
+        self.__frequency_axis = None
+        self.__axis_steps = {}
+        self.__frequency_index = 0
+        self.__incident_wave_phi_index = 0
+        self.__incident_wave_theta_index = 0
+        self.__snap_tolerance = 1e-3
 
         self.__frequencies = []
 
@@ -133,6 +457,9 @@ class MonostaticRCSData(object):
 
         self.__data_conversion_function = "dB20"
         self.__window = "Flat"
+        self.__window_parameters = {
+            window: dict(self.__window_defaults.get(window, {})) for window in self.available_windows()
+        }
         self.__window_size = 1024
         self.__aspect_range = "Horizontal"
         self.__upsample_range = 512
@@ -141,13 +468,29 @@ class MonostaticRCSData(object):
         self.__interpolation = "linear"
         self.__extrapolate = True
         self.__gridsize = "Middle"
+        self.__precision = "double"
+        self.__out_of_core = False
+        self.__scratch_directory = None
+        self.__slab_bytes = 128 * 1024**2
+        self.__peak_bytes = None
+        self.__measure_peak_memory = False
+        self.__fft_backend = "numpy"
+        self.__fft_workers = -1
+        self.__fast_length = False
+        self.__product_cache = self.__shared_product_cache if product_cache is None else product_cache
+        self.__stage_cache = self.__shared_stage_cache if stage_cache is None else stage_cache
+        self.__cache_id = next(self.__cache_ids)
+        # Products of a collected instance are never used again, so the shared caches release them
+        weakref.finalize(
+            self, MonostaticRCSData.__discard_products, (self.__product_cache, self.__stage_cache), self.__cache_id
+        )
 
         if self.__monostatic_file and not self.__monostatic_file.is_file():
             raise Exception("Monostatic file is invalid.")
 
         self.rcs_column_names = ["data"]
 
-        # Load farfield data
+        # Load the axes of the farfield data. The samples are read on first access.
         if self.__monostatic_file:
             is_rcs_loaded = self.__init_rcs()
         else:
@@ -162,9 +505,146 @@ class MonostaticRCSData(object):
 
     @property
     def raw_data(self):
-        """Antenna data."""
+        """Antenna data.
+
+        The monostatic file is read on first access.
+        """
+        self.__load_rcs()
+        if isinstance(self.__raw_data, dict) and self.__rcs_cube is not None:
+            # The samples come from the binary sidecar or from a chunked file, which have no pandas index
+            if self.__chunked:
+                freq, phi, theta = np.meshgrid(
+                    self.frequencies,
+                    self.available_incident_wave_phi,
+                    self.available_incident_wave_theta,
+                    indexing="ij",
+                )
+                index = pd.MultiIndex.from_arrays(
+                    [freq.ravel(), phi.ravel(), theta.ravel()], names=["Freq", "IWavePhi", "IWaveTheta"]
+                )
+                self.__raw_data = pd.DataFrame({self.name: self.__rcs_cube.ravel()}, index=index)
+            else:
+                self.__raw_data = pd.read_hdf(self.__monostatic_file, key="df", mode="r")
         return self.__raw_data
 
+    @property
+    def rcs_cube(self):
+        """Dense complex RCS data.
+
+        The array has shape ``(number of frequencies, number of phi angles, number of theta angles)`` and its
+        axes are sorted like ``frequencies``, ``available_incident_wave_phi``, and ``available_incident_wave_theta``.
+        The monostatic file is read on first access.
+        """
+        self.__load_rcs()
+        return self.__rcs_cube
+
+    @property
+    def data_version(self):
+        """Version of the RCS samples, which increases each time the samples are loaded."""
+        return self.__data_version
+
+    @property
+    def is_chunked(self):
+        """Flag indicating if the monostatic file has the chunked layout.
+
+        Accessors that only need some frequencies or angles read the corresponding chunks of these files instead of
+        the whole data. Use the ``convert_to_chunked()`` method to convert a file.
+        """
+        return self.__chunked
+
+    @property
+    def binary_cache(self):
+        """Flag indicating if the dense RCS data is kept in a binary sidecar next to the monostatic file."""
+        return self.__binary_cache
+
+    @property
+    def binary_cache_file(self):
+        """Binary sidecar of the dense RCS data.
+
+        The sidecar is a NumPy ``.npy`` file with a JSON header next to it. The header stores the format version,
+        the size and modification time of the monostatic file and of the sidecar, the axes, and a checksum. Only
+        the header, sizes, and modification times are checked when the sidecar is loaded, so the samples are read
+        on demand. Use the ``verify_binary_cache()`` method to check the samples against the checksum.
+        """
+        if not self.__monostatic_file:
+            return None
+        return self.__monostatic_file.with_name(f"{self.__monostatic_file.name}.cube.npy")
+
+    @pyaedt_function_handler()
+    def verify_binary_cache(self):
+        """Verify all the samples of the binary sidecar against the checksum of its header.
+
+        This reads the whole sidecar.
+
+        Returns
+        -------
+        bool
+            ``True`` when the sidecar is valid, ``False`` otherwise.
+        """
+        if not self.__monostatic_file:
+            return False
+        header = self.__read_binary_cache_header()
+        if header is None:
+            return False
+        try:
+            cube = np.load(self.binary_cache_file, mmap_mode="r")
+        except (OSError, ValueError):
+            return False
+        return self.__binary_cache_checksum(header, cube) == header["checksum"]
+
+    @property
+    def is_loaded(self):
+        """Flag indicating if the RCS samples are loaded.
+
+        Only the metadata and the axes are read when the object is created. The samples are read by the first
+        accessor that needs them.
+        """
+        return self.__rcs_cube is not None
+
+    @property
+    def product_cache(self):
+        """Cache of derived products.
+
+        Range profile, waterfall, and ISAR results are stored here and reused while the settings they depend on
+        do not change. Unless another cache is given at construction, all the instances share this cache and its
+        memory budget. The products of an instance are removed from the cache when the instance is garbage
+        collected. Set ``product_cache.max_bytes`` to change the memory budget.
+
+        Returns
+        -------
+        :class:`RCSProductCache`
+        """
+        return self.__product_cache
+
+    @property
+    def stage_cache(self):
+        """Cache of the intermediate stages of the ISAR images.
+
+        The resampled data and the complex images are stored here, so that changing a setting only recomputes the
+        stages from the first one that uses it. A stage is only kept if it fits in the memory budget of this cache,
+        which is separate from the one of ``product_cache`` because the stages are larger than the images. Unless
+        another cache is given at construction, all the instances share this cache. Set ``stage_cache.max_bytes``
+        to change the memory budget.
+
+        Returns
+        -------
+        :class:`RCSProductCache`
+        """
+        return self.__stage_cache
+
+    @property
+    def resampling_cache(self):
+        """Cache of ISAR resampling operators.
+
+        This cache is shared by all the instances because the operators only depend on the axes and the
+        interpolation settings.
+
+        Returns
+        -------
+        :class:`RCSProductCache`
+        """
+        return self.__resampling_cache
+
     @property
     def metadata(self):
         """Antenna metadata."""
@@ -173,8 +653,6 @@ class MonostaticRCSData(object):
     @property
     def name(self):
         """Data name."""
-        if isinstance(self.raw_data, pd.DataFrame):
-            self.__name = self.raw_data.columns[0]
         return self.__name
 
     @property
@@ -196,54 +674,49 @@ class MonostaticRCSData(object):
     @property
     def frequencies(self):
         """Available frequencies."""
-        if isinstance(self.raw_data, pd.DataFrame) and "Freq" in self.raw_data.index.names:
-            frequencies = np.unique(np.array(self.raw_data.index.get_level_values("Freq")))
-            self.__frequencies = frequencies.tolist()
         return self.__frequencies
 
     @property
     def available_incident_wave_theta(self):
         """Available incident wave theta."""
-        if isinstance(self.raw_data, pd.DataFrame) and "IWaveTheta" in self.raw_data.index.names:
-            self.__available_incident_wave_theta = np.unique(
-                np.array(self.raw_data.index.get_level_values("IWaveTheta"))
-            )
         return self.__available_incident_wave_theta
 
     @property
     def incident_wave_theta(self):
         """Active incident wave theta."""
-        if isinstance(self.raw_data, pd.DataFrame) and self.__incident_wave_theta is None:
-            self.__incident_wave_theta = self.available_incident_wave_theta[0]
+        if self.available_incident_wave_theta is not None and self.__incident_wave_theta is None:
+            self.__incident_wave_theta = self.available_incident_wave_theta[self.__incident_wave_theta_index]
         return self.__incident_wave_theta
 
     @incident_wave_theta.setter
     def incident_wave_theta(self, val):
         """Active incident wave theta."""
-        if val in self.available_incident_wave_theta:
-            self.__incident_wave_theta = val
+        idx = self.__snap(self.available_incident_wave_theta, "IWaveTheta", val)
+        if idx is not None:
+            self.__incident_wave_theta_index = idx
+            self.__incident_wave_theta = self.available_incident_wave_theta[idx]
         else:
             self.__logger.error("Value is not available.")
 
     @property
     def available_incident_wave_phi(self):
         """Available incident wave phi."""
-        if isinstance(self.raw_data, pd.DataFrame) and "IWavePhi" in self.raw_data.index.names:
-            self.__available_incident_wave_phi = np.unique(np.array(self.raw_data.index.get_level_values("IWavePhi")))
         return self.__available_incident_wave_phi
 
     @property
     def incident_wave_phi(self):
         """Active incident wave phi."""
-        if isinstance(self.raw_data, pd.DataFrame) and self.__incident_wave_phi is None:
-            self.__incident_wave_phi = self.available_incident_wave_phi[0]
+        if self.available_incident_wave_phi is not None and self.__incident_wave_phi is None:
+            self.__incident_wave_phi = self.available_incident_wave_phi[self.__incident_wave_phi_index]
         return self.__incident_wave_phi
 
     @incident_wave_phi.setter
     def incident_wave_phi(self, val):
         """Active incident wave phi."""
-        if val in self.available_incident_wave_phi:
-            self.__incident_wave_phi = val
+        idx = self.__snap(self.available_incident_wave_phi, "IWavePhi", val)
+        if idx is not None:
+            self.__incident_wave_phi_index = idx
+            self.__incident_wave_phi = self.available_incident_wave_phi[idx]
         else:
             self.__logger.error("Value is not available.")
 
@@ -256,14 +729,30 @@ class MonostaticRCSData(object):
     def frequency(self, val):
         if isinstance(val, str):
             frequency, units = decompose_variable_value(val)
-            unit_converter(frequency, "Freq", units, self.frequency_units)
-            val = frequency
-        if val in self.frequencies:
-            self.__frequency = val
-            # self.__freq_index = self.frequencies.index(val)
+            val = unit_converter(frequency, "Freq", units, self.frequency_units)
+        idx = self.__snap(self.__frequency_axis, "Freq", val)
+        if idx is not None:
+            self.__frequency_index = idx
+            self.__frequency = self.frequencies[idx]
         else:
             self.__logger.error("Frequency not available.")
 
+    @property
+    def snap_tolerance(self):
+        """Tolerance of the active frequency and incident wave angle setters.
+
+        A value is snapped to the nearest available sample if its distance to the sample is within this fraction
+        of the axis spacing. The default is ``1e-3``.
+        """
+        return self.__snap_tolerance
+
+    @snap_tolerance.setter
+    def snap_tolerance(self, val):
+        if isinstance(val, (int, float)) and not isinstance(val, bool) and val >= 0:
+            self.__snap_tolerance = float(val)
+        else:
+            self.__logger.error("Snap tolerance must be a non-negative number.")
+
     @property
     def data_conversion_function(self):
         """RCS data conversion function.
@@ -278,6 +767,8 @@ class MonostaticRCSData(object):
         - ``"norm"``: Normalizes the data to have values between 0 and 1.
         - ``"ang"``: Computes the phase angle of the data in radians.
         - ``"ang_deg"``: Computes the phase angle of the data in degrees.
+
+        If it is ``None``, ``"dB10"`` is used.
         """
         return self.__data_conversion_function
 
@@ -324,21 +815,210 @@ class MonostaticRCSData(object):
         else:
             self.__logger.error("Value for `gridsize` is invalid. The value must be 'Inside', 'Outside', or 'Middle'.")
 
+    @property
+    def precision(self):
+        """Floating point precision of the range profile, waterfall, and ISAR computations.
+
+        Options are ``"double"`` and ``"single"``. Single precision runs interpolation, windowing, and FFT
+        in ``complex64`` and ``float32``, which roughly halves the memory of large 3D ISAR images.
+        """
+        return self.__precision
+
+    @precision.setter
+    def precision(self, val):
+        if val in ["single", "double"]:
+            self.__precision = val
+        else:
+            self.__logger.error("Value for `precision` is invalid. The value must be 'single' or 'double'.")
+
+    @property
+    def out_of_core(self):
+        """Out-of-core flag for ISAR 3D.
+
+        If ``True``, the 3D inverse FFT runs over slabs of a memory-mapped scratch file, and ``isar_3d`` returns
+        a memory-mapped image. This allows images larger than the available memory, and plane cuts only read
+        the slices they need.
+        """
+        return self.__out_of_core
+
+    @out_of_core.setter
+    def out_of_core(self, val):
+        if isinstance(val, bool):
+            self.__out_of_core = val
+        else:
+            self.__logger.error("Out-of-core flag must be a boolean value.")
+
+    @property
+    def scratch_directory(self):
+        """Directory of the out-of-core scratch files.
+
+        The default is ``None``, in which case the system temporary directory is used.
+        """
+        return self.__scratch_directory
+
+    @scratch_directory.setter
+    def scratch_directory(self, val):
+        self.__scratch_directory = val
+
+    @property
+    def slab_bytes(self):
+        """Approximate size in bytes of the slabs processed at once in out-of-core mode."""
+        return self.__slab_bytes
+
+    @slab_bytes.setter
+    def slab_bytes(self, val):
+        if isinstance(val, int) and val > 0:
+            self.__slab_bytes = val
+        else:
+            self.__logger.error("Slab size must be a positive integer.")
+
+    @property
+    def measure_peak_memory(self):
+        """Flag indicating if the peak memory of the computed products is measured in ``peak_bytes``.
+
+        The measurement traces all the allocations with ``tracemalloc``, which slows the computations down.
+        """
+        return self.__measure_peak_memory
+
+    @measure_peak_memory.setter
+    def measure_peak_memory(self, val):
+        if isinstance(val, bool):
+            self.__measure_peak_memory = val
+        else:
+            self.__logger.error("Peak memory measurement flag must be a boolean.")
+
+    @property
+    def peak_bytes(self):
+        """Peak memory in bytes allocated by the last computed range profile, waterfall, or ISAR.
+
+        The value is measured with ``tracemalloc`` when the product is computed and ``measure_peak_memory`` is
+        enabled, and it is ``None`` otherwise. It is not updated when the product is taken from ``product_cache``.
+        If ``tracemalloc`` is already tracing, its peak is not reset and the value is a lower bound when the
+        computation does not exceed the previous peak.
+        """
+        return self.__peak_bytes
+
+    @property
+    def fft_backend(self):
+        """FFT backend of the range profile, waterfall, and ISAR computations.
+
+        Options are ``"numpy"``, ``"scipy"``, and ``"pyfftw"``. The ``"scipy"`` and ``"pyfftw"`` backends run
+        the transforms on ``fft_workers`` threads. The ``"pyfftw"`` backend is only available if pyFFTW is
+        installed.
+        """
+        return self.__fft_backend
+
+    @fft_backend.setter
+    def fft_backend(self, val):
+        if val == "pyfftw" and pyfftw is None:
+            self.__logger.error("The pyFFTW module is required to use the 'pyfftw' FFT backend.")
+        elif val in self.available_fft_backends():
+            self.__fft_backend = val
+        else:
+            self.__logger.error("Value for `fft_backend` is invalid. The value must be 'numpy', 'scipy', or 'pyfftw'.")
+
+    @staticmethod
+    def available_fft_backends():
+        """List the FFT backends available in the current environment.
+
+        Returns
+        -------
+        list
+            Names of the available FFT backends.
+        """
+        backends = ["numpy", "scipy"]
+        if pyfftw is not None:  # pragma: no cover
+            backends.append("pyfftw")
+        return backends
+
+    @property
+    def fft_workers(self):
+        """Number of threads of the ``"scipy"`` and ``"pyfftw"`` FFT backends.
+
+        The default is ``-1``, in which case all the available cores are used.
+        """
+        return self.__fft_workers
+
+    @fft_workers.setter
+    def fft_workers(self, val):
+        if isinstance(val, int) and not isinstance(val, bool) and (val > 0 or val == -1):
+            self.__fft_workers = val
+        else:
+            self.__logger.error("FFT workers must be a positive integer or -1.")
+
+    @property
+    def fast_length(self):
+        """Fast length flag.
+
+        If ``True``, the window size and the upsample sizes are rounded up to the next length that the FFT
+        computes efficiently, which is a product of small prime factors. The range and cross-range vectors
+        of the products follow the rounded sizes.
+        """
+        return self.__fast_length
+
+    @fast_length.setter
+    def fast_length(self, val):
+        if isinstance(val, bool):
+            self.__fast_length = val
+        else:
+            self.__logger.error("Fast length flag must be a boolean value.")
+
     @property
     def window(self):
         """Window function.
 
-        The available functions are ``"Flat"``, ``"Hamming"``, and ``"Hann"``.
+        The available functions are ``"Flat"``, ``"Hamming"``, ``"Hann"``, ``"Taylor"``, ``"Blackman-Harris"``,
+        ``"Kaiser"``, and ``"Chebyshev"``.
         """
         return self.__window
 
     @window.setter
     def window(self, val):
-        available_functions = ["Flat", "Hamming", "Hann"]
-        if val in available_functions:
+        if val in self.available_windows():
             self.__window = val
         else:
-            self.__logger.error("Value for `window` is invalid. The value must be 'Flat', 'Hamming', or 'Hann'.")
+            self.__logger.error(f"Value for `window` is invalid. The value must be one of {self.available_windows()}.")
+
+    @staticmethod
+    def available_windows():
+        """Get the available window functions.
+
+        Returns
+        -------
+        list
+            Window function names.
+        """
+        return ["Flat", "Hamming", "Hann", "Taylor", "Blackman-Harris", "Kaiser", "Chebyshev"]
+
+    @property
+    def window_parameters(self):
+        """Parameters of the active window function.
+
+        ``"Taylor"`` takes the number of nearly constant sidelobes ``nbar`` and the sidelobe level ``sll`` in dB
+        below the main lobe, ``"Kaiser"`` takes the shape parameter ``beta``, and ``"Chebyshev"`` takes the sidelobe
+        attenuation ``at`` in dB. The other windows take no parameters. Setting a subset of the parameters keeps the
+        others.
+        """
+        return dict(self.__window_parameters[self.window])
+
+    @window_parameters.setter
+    def window_parameters(self, val):
+        defaults = self.__window_defaults.get(self.window, {})
+        if (
+            isinstance(val, dict)
+            and set(val) <= set(defaults)
+            # A Kaiser window with a zero shape parameter is a rectangular window
+            and all(
+                isinstance(value, (int, float)) and (value > 0 or (name == "beta" and value == 0))
+                for name, value in val.items()
+            )
+        ):
+            parameters = {name: type(defaults[name])(value) for name, value in val.items()}
+            self.__window_parameters[self.window] = {**self.__window_parameters[self.window], **parameters}
+        else:
+            self.__logger.error(
+                f"Window parameters must be positive values of {list(defaults)}. The Kaiser beta can also be zero."
+            )
 
     @property
     def window_size(self):
@@ -389,508 +1069,1864 @@ class MonostaticRCSData(object):
     def rcs(self):
         """RCS data for active frequency, theta, and phi."""
         rcs_value = None
-        if isinstance(self.raw_data, pd.DataFrame):
-            data = self.rcs_active_theta_phi
-            data = data[data["Freq"] == self.frequency]
-            data = data.drop(columns=["Freq"])
-            value = data.values
-            rcs_value = value[0][0]
+        if self.__has_rcs():
+            freq_idx = self.__frequency_index
+            phi_idx = self.__incident_wave_phi_index
+            theta_idx = self.__incident_wave_theta_index
+            rcs_value = self.__read_rcs(freq_idx, phi_idx, theta_idx)[()]
         return rcs_value
 
     @property
     def rcs_active_theta_phi(self):
         """RCS data for active theta and phi."""
         rcs_value = None
-        if isinstance(self.rcs_active_theta, pd.DataFrame):
-            data = self.rcs_active_theta
-            data = data[data["IWavePhi"] == self.incident_wave_phi]
-            rcs_value = data.drop(columns=["IWavePhi"])
+        if self.__has_rcs():
+            phi_idx = self.__incident_wave_phi_index
+            theta_idx = self.__incident_wave_theta_index
+            rcs_value = pd.DataFrame(
+                {"Freq": self.frequencies, "Data": self.__read_rcs(slice(None), phi_idx, theta_idx)}
+            )
         return rcs_value
 
     @property
     def rcs_active_frequency(self):
         """RCS data for active frequency."""
         value = None
-        if isinstance(self.raw_data, pd.DataFrame):
-            data = self.raw_data.xs(key=self.frequency, level="Freq")
-            data_converted = conversion_function(data[self.name], self.data_conversion_function)
-            df = data_converted.reset_index()
-            df.columns = ["IWavePhi", "IWaveTheta", "Data"]
-            value = df
+        if self.__has_rcs():
+            freq_idx = self.__frequency_index
+            phi, theta = np.meshgrid(
+                self.available_incident_wave_phi, self.available_incident_wave_theta, indexing="ij"
+            )
+            data = self.__converted_rcs(freq_idx).ravel()
+            value = pd.DataFrame({"IWavePhi": phi.ravel(), "IWaveTheta": theta.ravel(), "Data": data})
         return value
 
     @property
     def rcs_active_theta(self):
         """RCS data for active incident wave theta."""
         value = None
-        if isinstance(self.raw_data, pd.DataFrame):
-            data = self.raw_data.xs(key=self.incident_wave_theta, level="IWaveTheta")
-            df = data.reset_index()
-            df.columns = ["Freq", "IWavePhi", "Data"]
-            value = df
+        if self.__has_rcs():
+            theta_idx = self.__incident_wave_theta_index
+            freq, phi = np.meshgrid(self.frequencies, self.available_incident_wave_phi, indexing="ij")
+            data = self.__read_rcs(slice(None), slice(None), theta_idx)
+            value = pd.DataFrame({"Freq": freq.ravel(), "IWavePhi": phi.ravel(), "Data": data.ravel()})
         return value
 
     @property
     def rcs_active_phi(self):
         """RCS data for active incident wave phi."""
         value = None
-        if isinstance(self.raw_data, pd.DataFrame):
-            data = self.raw_data.xs(key=self.incident_wave_phi, level="IWavePhi")
-            df = data.reset_index()
-            df.columns = ["Freq", "IWaveTheta", "Data"]
-            value = df
+        if self.__has_rcs():
+            phi_idx = self.__incident_wave_phi_index
+            freq, theta = np.meshgrid(self.frequencies, self.available_incident_wave_theta, indexing="ij")
+            data = self.__read_rcs(slice(None), phi_idx)
+            value = pd.DataFrame({"Freq": freq.ravel(), "IWaveTheta": theta.ravel(), "Data": data.ravel()})
         return value
 
     @property
-    def range_profile(self):
-        """Range profile."""
+    def rcs_active_theta_converted(self):
+        """RCS data for active incident wave theta converted with ``data_conversion_function``."""
         value = None
-        if isinstance(self.raw_data, pd.DataFrame):
-            data = self.rcs_active_theta_phi["Data"]
-            # Take needed properties
-            size = self.window_size
-            nfreq = len(self.frequencies)
+        if self.__has_rcs():
+            theta_idx = self.__incident_wave_theta_index
+            freq, phi = np.meshgrid(self.frequencies, self.available_incident_wave_phi, indexing="ij")
+            data = self.__converted_rcs(slice(None), slice(None), theta_idx)
+            value = pd.DataFrame({"Freq": freq.ravel(), "IWavePhi": phi.ravel(), "Data": data.ravel()})
+        return value
 
-            # Compute window
-            win_range, _ = self.window_function(self.window, nfreq)
-            windowed_data = data * win_range
+    @property
+    def rcs_active_phi_converted(self):
+        """RCS data for active incident wave phi converted with ``data_conversion_function``."""
+        value = None
+        if self.__has_rcs():
+            phi_idx = self.__incident_wave_phi_index
+            freq, theta = np.meshgrid(self.frequencies, self.available_incident_wave_theta, indexing="ij")
+            data = self.__converted_rcs(slice(None), phi_idx)
+            value = pd.DataFrame({"Freq": freq.ravel(), "IWaveTheta": theta.ravel(), "Data": data.ravel()})
+        return value
 
-            # Perform FFT
-            sf_upsample = self.window_size / nfreq
-            windowed_data = np.fft.fftshift(sf_upsample * np.fft.ifft(windowed_data.to_numpy(), n=size))
+    @property
+    def converted_cube(self):
+        """Dense RCS data converted with ``data_conversion_function``.
 
-            data_converted = conversion_function(windowed_data, self.data_conversion_function)
+        The converted cube is computed once per conversion function and kept in ``product_cache``, so switching
+        between conversion functions does not convert the data again. A converted cube larger than the memory
+        budget of ``product_cache`` is converted again on each access. The ``"norm"`` conversion is normalized by
+        the maximum of the whole cube. Treat the result as read-only.
+        """
+        if not self.__has_rcs():
+            return None
+        return self.__converted_cube(self.data_conversion_function)
 
-            df = unit_converter((self.frequencies[1] - self.frequencies[0]), "Freq", self.frequency_units, "Hz")
-            pd_t = 1.0 / df
-            dt = pd_t / size
-            range_norm = dt * np.linspace(start=-0.5 * size, stop=0.5 * size - 1, num=size) / 2 * SpeedOfLight
+    @property
+    def range_profile(self):
+        """Range profile.
 
-            index_names = ["Range", "Data"]
-            df = pd.DataFrame(columns=index_names)
-            df["Range"] = range_norm
-            df["Data"] = data_converted
-            value = df
+        The result is cached in ``product_cache`` for the current settings. Treat it as read-only.
+        """
+        return self.__cached_product("range_profile", self.__compute_range_profile)
+
+    def __compute_range_profile(self, cube=None):
+        value = None
+        if self.__has_rcs():
+            phi_idx = self.__incident_wave_phi_index
+            theta_idx = self.__incident_wave_theta_index
+            block = (slice(None), phi_idx, theta_idx)
+            range_norm, data_converted = self.__range_profiles(self.__read_rcs(*block) if cube is None else cube[block])
+
+            def range_profile(data):
+                index_names = ["Range", "Data"]
+                df = pd.DataFrame(columns=index_names)
+                df["Range"] = range_norm
+                df["Data"] = data
+                return df
+
+            value = self.__unstack(data_converted, cube is not None, range_profile)
 
         return value
 
+    @property
+    def range_profile_cube(self):
+        """Range profiles of all the available incident wave angles.
+
+        All the range profiles are computed with one inverse FFT along the frequency axis. The result is cached in
+        ``product_cache`` for the current settings. Treat it as read-only.
+
+        Returns
+        -------
+        :class:`MonostaticRCSResult`
+            Converted range profiles with axes ``"Range"``, ``"IWavePhi"``, and ``"IWaveTheta"``.
+        """
+        return self.__cached_product("range_profile_cube", self.__compute_range_profile_cube)
+
+    def __compute_range_profile_cube(self):
+        return self.range_profile_slab()
+
+    @pyaedt_function_handler()
+    def range_profile_slab(self, start=0, stop=None):
+        """Compute the range profiles of a slab of incident wave phi angles.
+
+        Parameters
+        ----------
+        start : int, default: ``0``
+            Position of the first incident wave phi angle.
+        stop : int, optional
+            Position after the last incident wave phi angle. The default is ``None``, in which case the slab
+            extends to the last angle.
+
+        Returns
+        -------
+        :class:`MonostaticRCSResult`
+            Converted range profiles with axes ``"Range"``, ``"IWavePhi"``, and ``"IWaveTheta"``.
+        """
+        phi_idx = slice(start, stop)
+        range_norm, data_converted = self.__range_profiles(self.__read_rcs(slice(None), phi_idx))
+        axes = {
+            "Range": range_norm,
+            "IWavePhi": self.available_incident_wave_phi[phi_idx],
+            "IWaveTheta": self.available_incident_wave_theta,
+        }
+        return MonostaticRCSResult(data_converted, axes)
+
+    @pyaedt_function_handler()
+    def export_range_profile_cube(self, output_file):
+        """Compute the range profiles of all the available incident wave angles and stream them to a file.
+
+        The RCS data is processed in slabs of incident wave phi angles of about ``slab_bytes`` bytes, so neither the
+        RCS data of chunked files nor the range profiles are held in memory at once. The range profiles are written
+        to a NumPy ``.npy`` file, and their axes and settings to a JSON file with the same name.
+
+        Parameters
+        ----------
+        output_file : str or :class:`pathlib.Path`
+            Full path of the NPY file.
+
+        Returns
+        -------
+        :class:`MonostaticRCSResult` or bool
+            Range profiles memory-mapped from the output file with axes ``"Range"``, ``"IWavePhi"``, and
+            ``"IWaveTheta"``, ``False`` when failed.
+        """
+        if not self.__has_rcs():
+            self.__logger.error("Monostatic RCS data is not available.")
+            return False
+        output_file = Path(output_file)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        complex_dtype, _ = self.__dtypes()
+        size = self.__fast_size(self.window_size)
+        nphi = self.available_incident_wave_phi.size
+        ntheta = self.available_incident_wave_theta.size
+        itemsize = np.dtype(complex_dtype).itemsize
+        step = max(1, self.slab_bytes // (max(size, len(self.frequencies)) * ntheta * itemsize))
+
+        cube = np.lib.format.open_memmap(
+            output_file, mode="w+", dtype=self.__converted_dtype(), shape=(size, nphi, ntheta)
+        )
+        range_norm = None
+        for start in range(0, nphi, step):
+            slab = self.range_profile_slab(start, start + step)
+            cube[:, start : start + step] = slab.data
+            range_norm = slab.axes["Range"]
+        cube.flush()
+        del cube
+
+        axes = {
+            "Range": range_norm,
+            "IWavePhi": self.available_incident_wave_phi,
+            "IWaveTheta": self.available_incident_wave_theta,
+        }
+        header = {
+            "solution": self.solution,
+            "name": self.name,
+            "frequency_units": self.frequency_units,
+            "window": self.window,
+            "window_parameters": self.window_parameters,
+            "window_size": size,
+            "data_conversion_function": self.data_conversion_function,
+            "axes": {name: values.tolist() for name, values in axes.items()},
+        }
+        with output_file.with_suffix(".json").open("w") as f:
+            json.dump(header, f, indent=4)
+        return MonostaticRCSResult(np.load(output_file, mmap_mode="r"), axes)
+
     @property
     def waterfall(self):
-        """Waterfall."""
-        waterfall_df = None
-        if isinstance(self.raw_data, pd.DataFrame):
-            waterfall_data = []
+        """Waterfall.
+
+        The result is cached in ``product_cache`` for the current settings. Treat it as read-only.
+
+        Returns
+        -------
+        :class:`MonostaticRCSResult`
+            Range profiles of all the available angles of the cut, with axes ``"IWavePhi"`` or
+        ``"IWaveTheta"`` and ``"Range"``.
+        """
+        return self.__cached_product("waterfall", self.__compute_waterfall)
+
+    def __compute_waterfall(self, cube=None):
+        waterfall = None
+        if self.__has_rcs():
+            # All the range profiles of the cut are computed at once from the (frequency, angle) slab, so the
+            # active incident wave angles are never modified.
             if self.aspect_range == "Horizontal":
-                original_phi = self.incident_wave_phi
-                for phi in self.available_incident_wave_phi:
-                    self.incident_wave_phi = phi
-                    range_profile = self.range_profile
-                    new_data = {
-                        "Range": range_profile["Range"],
-                        "Data": range_profile["Data"],
-                        "IWavePhi": np.full(range_profile["Range"].size, phi),
-                    }
-                    waterfall_data.append(pd.DataFrame(new_data))
-                self.incident_wave_phi = original_phi
+                block = (slice(None), slice(None), self.__incident_wave_theta_index)
+                angles = self.available_incident_wave_phi
+                angle_name = "IWavePhi"
             else:
-                original_theta = self.incident_wave_theta
-                for theta in self.available_incident_wave_theta:
-                    self.incident_wave_theta = theta
-                    range_profile = self.range_profile
-                    new_data = {
-                        "Range": range_profile["Range"],
-                        "Data": range_profile["Data"],
-                        "IWaveTheta": np.full(range_profile["Range"].size, theta),
-                    }
-                    waterfall_data.append(pd.DataFrame(new_data))
-                self.incident_wave_theta = original_theta
-            waterfall_df = pd.concat(waterfall_data, ignore_index=True)
-        return waterfall_df
+                block = (slice(None), self.__incident_wave_phi_index)
+                angles = self.available_incident_wave_theta
+                angle_name = "IWaveTheta"
+            slab = self.__read_rcs(*block) if cube is None else cube[block]
+            range_norm, data_converted = self.__range_profiles(slab)
+
+            # One range profile per angle
+            axes = {angle_name: angles, "Range": range_norm}
+            waterfall = self.__unstack(
+                data_converted, cube is not None, lambda data: MonostaticRCSResult(np.ascontiguousarray(data.T), axes)
+            )
+        return waterfall
+
+    def __range_profiles(self, data):
+        """Compute the range profiles of frequency sweeps.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            Complex data with frequencies along the first axis. Any other axes are batch axes.
+
+        Returns
+        -------
+        tuple
+            Range vector and converted range profiles with ranges along the first axis.
+        """
+        # Take needed properties
+        size = self.__fast_size(self.window_size)
+        nfreq = len(self.frequencies)
+
+        # Compute window
+        complex_dtype, real_dtype = self.__dtypes()
+        win_range, _ = self.__cached_window(self.window, nfreq, **self.window_parameters)
+        win_range = win_range.reshape((-1,) + (1,) * (data.ndim - 1)).astype(real_dtype)
+        windowed_data = data.astype(complex_dtype, copy=False) * win_range
+
+        # Perform FFT
+        sf_upsample = size / nfreq
+        windowed_data = self.__fft("ifft", windowed_data, n=size, axis=0).astype(complex_dtype, copy=False)
+        windowed_data = np.fft.fftshift(sf_upsample * windowed_data, axes=0)
+
+        if self.data_conversion_function == "norm":
+            # Each range profile is normalized on its own
+            magnitude = np.abs(windowed_data)
+            data_converted = magnitude / np.max(magnitude, axis=0, keepdims=True)
+        else:
+            data_converted = self.__convert(windowed_data, self.data_conversion_function)
+
+        df = unit_converter((self.frequencies[1] - self.frequencies[0]), "Freq", self.frequency_units, "Hz")
+        pd_t = 1.0 / df
+        dt = pd_t / size
+        range_norm = dt * np.linspace(start=-0.5 * size, stop=0.5 * size - 1, num=size) / 2 * SpeedOfLight
+        return range_norm, data_converted
 
     @staticmethod
     def phase_shift(data, slice_idx, num_after_fft, num_before_fft):
-        """Apply phase shift to the data if the output has an even number of points in the ``slice_idx`` direction."""
+        """Apply phase shift to the data if the output has an even number of points in the ``slice_idx`` direction.
+
+        The data is modified in place by broadcasting a phase ramp over the ``slice_idx`` axis.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            Complex data with ``num_before_fft`` points along the ``slice_idx`` axis.
+        slice_idx : int
+            Axis to shift.
+        num_after_fft : int
+            Number of points along the axis after the FFT.
+        num_before_fft : int
+            Number of points along the axis before the FFT.
+
+        Returns
+        -------
+        numpy.ndarray
+            Shifted data.
+        """
         if num_after_fft % 2 == 0:
-            d_arg = np.pi / num_after_fft
-            tmp = np.floor(-0.5 * num_before_fft) * d_arg
-            rng_shift_base = complex(np.cos(tmp), np.sin(tmp))
-            rng_shift_delta = complex(np.cos(d_arg), np.sin(d_arg))
-            for i in range(num_before_fft):
-                idx = [slice(None)] * data.ndim
-                idx[slice_idx] = i  # this will pick [:, i] or [i, :] based on slice_idx
-                data[tuple(idx)] *= rng_shift_base
-                rng_shift_base *= rng_shift_delta
+            ramp = MonostaticRCSData.__phase_ramp(num_after_fft, num_before_fft)
+            shape = [1] * data.ndim
+            shape[slice_idx] = num_before_fft
+            data *= ramp.astype(data.dtype, copy=False).reshape(shape)
         return data
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def __phase_ramp(num_after_fft, num_before_fft):
+        """Get the phase ramp that centers an even-length FFT output."""
+        d_arg = np.pi / num_after_fft
+        ramp = np.exp(1j * (np.floor(-0.5 * num_before_fft) + np.arange(num_before_fft)) * d_arg)
+        ramp.flags.writeable = False
+        return ramp
+
     @property
     def isar_2d(self):
-        """ISAR 2D."""
-        df = None
-        if isinstance(self.raw_data, pd.DataFrame):
-            # output size
-            ndrng = self.upsample_range
-
-            # get the input data
-            freqs = np.array(unit_converter(self.frequencies, "Freq", self.frequency_units, "Hz"))
-            nfreq = len(freqs)
-            freqs = freqs
-
-            avail_phi = np.array(self.available_incident_wave_phi)
-            avail_theta = np.array(self.available_incident_wave_theta)
-
-            # We are trying to create a 2D ISAR CUT potentially based off 3D ISAR data. When we choose
-            # a cut other than the main cuts, either for phi = 0 or theta = 90, we need to
-            # interpolate the data to the desired cut, which lies on a great arc. Given that potentially
-            # we'd have to extrapolate data over a large portion of the cut, we choose to disable
-            # extrapolation by default, and just zero pad, except if the data lies explicitly on one
-            # of the two main cuts. Because of numerical precision, even on the main cuts the resulting
-            # interpolants won't line up precisely with the original data, but we can forgive that for the sake of
-            # result accuracy and allow extrapolation.
-            if self.aspect_range == "Horizontal":
-                # Great arc (equatorial) cut, rotated by theta0 about y-axis
-                # We choose an arc with the same length and spacing as the original data, to preserve the
-                # original data's resolution and image extents.
-                el0 = np.deg2rad(90.0 - self.incident_wave_theta)
-                nangles = len(avail_phi)
-                arc_angles = np.deg2rad(avail_phi)
-                # Start with equatorial great circle (theta=90, phi=arc_angles)
-                x0 = np.cos(arc_angles)
-                y0 = np.sin(arc_angles)
-                # Rotate by el0 about y-axis
-                x = x0 * np.cos(el0)
-                y = y0
-                z = x0 * np.sin(el0)
-                # Convert to (theta, phi)
-                thetas = np.arccos(np.clip(z, -1.0, 1.0))
-                phis = np.arctan2(y, x)
-                theta_deg = np.rad2deg(thetas)
-                phi_deg = np.rad2deg(phis)
-
-                interp = RegularGridInterpolator(
-                    (freqs, avail_phi, avail_theta),
-                    self.raw_data.to_numpy().reshape((nfreq, len(avail_phi), len(avail_theta))),
-                    method=self.interpolation,
-                    bounds_error=False,
-                    fill_value=None if self.incident_wave_theta == 90.0 else 0.0,
-                )
-                azel_samples = -arc_angles  # convert from phi to azimuth
-                nxrng = nangles
-            else:
-                # Great arc (equatorial) cut logic for elevation
-                # We choose an arc with the same length and spacing as the original data, to preserve the
-                # original data's resolution and image extents.
-                phi0 = np.deg2rad(self.incident_wave_phi)
-                nangles = len(avail_theta)
-                arc_angles = np.deg2rad(avail_theta)
-                # Start with equatorial great circle (phi=0, theta=arc_angles)
-                x0 = np.sin(arc_angles)
-                z0 = np.cos(arc_angles)
-                # Rotate by phi0 about z-axis
-                x = x0 * np.cos(phi0)
-                y = x0 * np.sin(phi0)
-                z = z0
-                # Convert to (theta, phi)
-                thetas = np.arccos(np.clip(z, -1.0, 1.0))
-                phis = np.arctan2(y, x)
-                theta_deg = np.rad2deg(thetas)
-                phi_deg = np.rad2deg(phis)
-
-                interp = RegularGridInterpolator(
-                    (freqs, avail_phi, avail_theta),
-                    self.raw_data.to_numpy().reshape((nfreq, len(avail_phi), len(avail_theta))),
-                    method=self.interpolation,
-                    bounds_error=False,
-                    fill_value=None if self.incident_wave_phi == 0.0 else 0.0,
-                )
-                azel_samples = np.pi / 2 - arc_angles  # convert from theta to elevation
-                nxrng = nangles
-
-            # Interpolate for all frequencies over the points in the line el_deg, az_deg to obtain
-            # data along the desired cut.
-            data = np.empty((nfreq, nangles), dtype=np.complex128)
-            for i, freq in enumerate(freqs):
-                freq_points = np.column_stack([np.full_like(theta_deg, freq), phi_deg, theta_deg])
-                data[i, :] = interp(freq_points)
-
-            # center the cut samples, just in case
-            azel_samples = np.unwrap(azel_samples)
-            azel_samples -= np.mean(azel_samples)
-
-            fxmin = np.min(freqs)
-            fxmax = np.max(freqs)
-            if self.gridsize == "Inside":
-                f_ref = freqs[0]
-            elif self.gridsize == "Outside":
-                f_ref = freqs[-1]
-            else:  # self.gridsize == "Middle" which matches the extents
-                f_ref = freqs[len(freqs) // 2]
-            fymax = np.sin(np.max(azel_samples)) * f_ref
-            fymin = np.sin(np.min(azel_samples)) * f_ref
-
-            fx = np.linspace(fxmin, fxmax, nfreq)  # desired downrange frequencies
-            fy = np.linspace(fymin, fymax, nangles)  # desired crossrange frequencies
+        """ISAR 2D.
+
+        The result is cached in ``product_cache`` for the current settings. Treat it as read-only.
+
+        Returns
+        -------
+        :class:`MonostaticRCSResult`
+            Image with axes ``"Down-range"`` and ``"Cross-range"``.
+        """
+        return self.__cached_product("isar_2d", self.__compute_isar_2d)
+
+    def __compute_isar_2d(self, cube=None, suffix=()):
+        isar = None
+        if self.__has_rcs():
+            batched = cube is not None
+            isar_image, axes = self.__cached_stage("isar_2d_image", lambda: self.__isar_2d_image(cube, suffix), suffix)
+            # Conversion stage, which is the only one computed again when data_conversion_function changes
+            isar_image = self.__convert_image(isar_image, batched)
+            isar = self.__unstack(isar_image, batched, lambda image: MonostaticRCSResult(image, axes))
+
+        return isar
+
+    def __isar_2d_resampled(self, cube):
+        """Compute the resampling stage of the ISAR 2D image.
+
+        Returns
+        -------
+        tuple
+            Data of the cut on the regular grid of down-range and cross-range frequencies, and the frequency vectors.
+        """
+        cube = self.rcs_cube if cube is None else cube
+
+        # get the input data
+        freqs = np.array(unit_converter(self.frequencies, "Freq", self.frequency_units, "Hz"))
+        nfreq = len(freqs)
+        freqs = freqs
+
+        avail_phi = np.array(self.available_incident_wave_phi)
+        avail_theta = np.array(self.available_incident_wave_theta)
+        # (phi, theta, frequency) view of the data
+        cube = np.moveaxis(cube, 0, 2)
+
+        # We are trying to create a 2D ISAR CUT potentially based off 3D ISAR data. When we choose
+        # a cut other than the main cuts, either for phi = 0 or theta = 90, we need to
+        # interpolate the data to the desired cut, which lies on a great arc. Given that potentially
+        # we'd have to extrapolate data over a large portion of the cut, we choose to disable
+        # extrapolation by default, and just zero pad, except if the data lies explicitly on one
+        # of the two main cuts. Because of numerical precision, even on the main cuts the resulting
+        # interpolants won't line up precisely with the original data, but we can forgive that for the sake of
+        # result accuracy and allow extrapolation.
+        if self.aspect_range == "Horizontal":
+            # Great arc (equatorial) cut, rotated by theta0 about y-axis
+            # We choose an arc with the same length and spacing as the original data, to preserve the
+            # original data's resolution and image extents.
+            el0 = np.deg2rad(90.0 - self.incident_wave_theta)
+            nangles = len(avail_phi)
+            arc_angles = np.deg2rad(avail_phi)
+            # Start with equatorial great circle (theta=90, phi=arc_angles)
+            x0 = np.cos(arc_angles)
+            y0 = np.sin(arc_angles)
+            # Rotate by el0 about y-axis
+            x = x0 * np.cos(el0)
+            y = y0
+            z = x0 * np.sin(el0)
+            # Convert to (theta, phi)
+            thetas = np.arccos(np.clip(z, -1.0, 1.0))
+            phis = np.arctan2(y, x)
+            theta_deg = np.rad2deg(thetas)
+            phi_deg = np.rad2deg(phis)
+
+            cut_fill_value = None if self.incident_wave_theta == 90.0 else 0.0
+            cut_settings = (self.aspect_range, self.incident_wave_theta)
+            azel_samples = -arc_angles  # convert from phi to azimuth
+        else:
+            # Great arc (equatorial) cut logic for elevation
+            # We choose an arc with the same length and spacing as the original data, to preserve the
+            # original data's resolution and image extents.
+            phi0 = np.deg2rad(self.incident_wave_phi)
+            nangles = len(avail_theta)
+            arc_angles = np.deg2rad(avail_theta)
+            # Start with equatorial great circle (phi=0, theta=arc_angles)
+            x0 = np.sin(arc_angles)
+            z0 = np.cos(arc_angles)
+            # Rotate by phi0 about z-axis
+            x = x0 * np.cos(phi0)
+            y = x0 * np.sin(phi0)
+            z = z0
+            # Convert to (theta, phi)
+            thetas = np.arccos(np.clip(z, -1.0, 1.0))
+            phis = np.arctan2(y, x)
+            theta_deg = np.rad2deg(thetas)
+            phi_deg = np.rad2deg(phis)
+
+            cut_fill_value = None if self.incident_wave_phi == 0.0 else 0.0
+            cut_settings = (self.aspect_range, self.incident_wave_phi)
+            azel_samples = np.pi / 2 - arc_angles  # convert from theta to elevation
+
+        # Interpolate for all frequencies over the points in the line el_deg, az_deg to obtain
+        # data along the desired cut. The cut only depends on the angles, so all the frequencies are
+        # interpolated at once as trailing values.
+        data = self.__interpolate(
+            "isar_2d_cut",
+            (avail_phi, avail_theta),
+            cube,
+            lambda: (phi_deg, theta_deg),
+            cut_fill_value,
+            cut_settings,
+        ).swapaxes(0, 1)
+
+        # center the cut samples, just in case
+        azel_samples = np.unwrap(azel_samples)
+        azel_samples -= np.mean(azel_samples)
+
+        fxmin = np.min(freqs)
+        fxmax = np.max(freqs)
+        if self.gridsize == "Inside":
+            f_ref = freqs[0]
+        elif self.gridsize == "Outside":
+            f_ref = freqs[-1]
+        else:  # self.gridsize == "Middle" which matches the extents
+            f_ref = freqs[len(freqs) // 2]
+        fymax = np.sin(np.max(azel_samples)) * f_ref
+        fymin = np.sin(np.min(azel_samples)) * f_ref
+
+        fx = np.linspace(fxmin, fxmax, nfreq)  # desired downrange frequencies
+        fy = np.linspace(fymin, fymax, nangles)  # desired crossrange frequencies
+
+        def polar_points():
             f_x, f_y = np.meshgrid(fx, fy, indexing="ij")
 
             # convert to equivalent freq and azimuthinterpolation points,
             # so we can use the regular interpolator directly from freqs, az
             fi = np.sqrt(f_x**2 + f_y**2)
             azi = np.arctan2(f_y, f_x)
+            return fi, azi
+
+        rdata = self.__interpolate(
+            "isar_2d",
+            (freqs, azel_samples),
+            data,
+            polar_points,
+            None if self.extrapolate else 0.0,
+            (self.gridsize,),
+        )
+        return rdata, fx, fy
 
+    def __isar_2d_image(self, cube, suffix):
+        """Compute the window and FFT stages of the ISAR 2D image.
+
+        Returns
+        -------
+        tuple
+            Complex image and its axes.
+        """
+        rdata, fx, fy = self.__cached_stage("isar_2d_resampled", lambda: self.__isar_2d_resampled(cube), suffix)
+        nfreq, nangles = rdata.shape[:2]
+        ndrng = self.upsample_range
+        nxrng = nangles
+
+        # Zero padding
+        if ndrng < nfreq:
+            # Warning('nx should be at least as large as the length of f -- increasing nx')
+            self.__logger.warning("nx should be at least as large as the number of frequencies.")
+            ndrng = nfreq
+        if nxrng < nangles:  # pragma: no cover
+            # warning('ny should be at least as large as the length of az -- increasing ny');
+            self.__logger.warning("ny should be at least as large as the number of azimuth angles.")
+            nxrng = nangles
+        ndrng = self.__fast_size(ndrng)
+        nxrng = self.__fast_size(nxrng)
+
+        #  Compute the image plane downrange and cross-range distance vectors (in
+        #  meters)
+        dfx = fx[1] - fx[0]  # difference in x-frequencies
+        dfy = fy[1] - fy[0]  # difference in y-frequencies
+        dx = SpeedOfLight / (2 * dfx) / ndrng
+        dy = SpeedOfLight / (2 * dfy) / nxrng
+        x = np.linspace(start=0, stop=ndrng * dx, num=ndrng)  # ndrng
+        y = np.linspace(start=0, stop=nxrng * dy, num=nxrng)  # nxrng
+
+        # We want the physical extents of the image to be centered at the global origin, because
+        # that's how we draw the extents of the 2D ISAR domain.
+        # The center of the first pixel in the second half of each domain is centered at zero
+        # if the domain has odd length, but it is at dx/2 otherwise.
+        complex_dtype, _ = self.__dtypes()
+        window, window_sum = self.window_tensor(self.window, (nfreq, nangles), **self.window_parameters)
+        # The phase shift is applied to the window, so the resampled data, which can be cached, is not copied
+        window = window.astype(complex_dtype)
+        fft_domain_sizes = ((ndrng, nfreq), (nxrng, nangles))
+        for islide, fft_domain_size in enumerate(fft_domain_sizes):
+            window = MonostaticRCSData.phase_shift(window, islide, *fft_domain_size)
+
+        batch_shape = rdata.shape[2:]
+        window = window.reshape(window.shape + (1,) * len(batch_shape))
+
+        iq = np.zeros((ndrng, nxrng) + batch_shape, dtype=complex_dtype)
+        xshift = (ndrng - nfreq) // 2
+        yshift = (nxrng - nangles) // 2
+        iq[xshift : xshift + nfreq, yshift : yshift + nangles] = np.multiply(rdata, window)
+
+        # Normalize so that unit amplitude scatterers have about unit amplitude in
+        # the image (normalized for the windows).  The "about" comes because of the
+        # truncation of the polar shape into a rectangular shape.
+        #
+        iq *= float(ndrng * nxrng / window_sum)
+        iq = np.fft.fftshift(iq, axes=(0, 1))
+        isar_image = self.__fft("ifft2", iq, axes=(0, 1)).astype(complex_dtype, copy=False)
+        isar_image = np.fft.fftshift(isar_image, axes=(0, 1))
+        # Nx x Ny
+
+        # isar_image = isar_image.transpose()
+        # isar_image = isar_image[::-1, :]  # this used to be flipped, but it matched range/cross range defs now
+
+        # bring the center of the PHYSICAL image to 0, which means the first pixel on the
+        # second half is not at 0 for even length domains
+        range_values = x - 0.5 * (x[-1] - x[0])
+        cross_range_values = y - 0.5 * (y[-1] - y[0])
+
+        axes = {"Down-range": range_values, "Cross-range": cross_range_values}
+        return isar_image, axes
+
+    @property
+    def isar_3d(self):
+        """ISAR 3D.
+
+        The result is cached in ``product_cache`` for the current settings. Treat it as read-only.
+
+        Returns
+        -------
+        :class:`MonostaticRCSResult`
+            Image with axes ``"Down-range"``, ``"Cross-range-az"``, and ``"Cross-range-el"``.
+        """
+        return self.__cached_product("isar_3d", self.__compute_isar_3d)
+
+    def __compute_isar_3d(self, cube=None, suffix=()):
+        isar = None
+        if self.__has_rcs():
+            batched = cube is not None
+            if self.out_of_core and not batched:
+                # The streamed image is converted slab by slab, so it is not cached as a complex image
+                isar_image, axes = self.__isar_3d_image(cube, suffix)
+            else:
+                isar_image, axes = self.__cached_stage(
+                    "isar_3d_image", lambda: self.__isar_3d_image(cube, suffix), suffix
+                )
+                # Conversion stage, which is the only one computed again when data_conversion_function changes
+                isar_image = self.__convert_image(isar_image, batched)
+            isar = self.__unstack(isar_image, batched, lambda image: MonostaticRCSResult(image, axes))
+
+        return isar
+
+    def __isar_3d_resampled(self, cube):
+        """Compute the resampling stage of the ISAR 3D image.
+
+        Returns
+        -------
+        tuple
+            Data on the regular grid of down-range and cross-range frequencies, and the frequency vectors.
+        """
+        cube = self.rcs_cube if cube is None else cube
+        # get the input data
+        freqs = np.array(unit_converter(self.frequencies, "Freq", self.frequency_units, "Hz"))
+        nfreq = len(freqs)
+        az = np.unwrap(np.radians(-self.available_incident_wave_phi))
+        az -= np.mean(az)
+        nphi = len(az)
+        el = np.unwrap(np.radians(90.0 - self.available_incident_wave_theta))
+        el -= np.mean(el)
+        ntheta = len(el)
+
+        fxmin = np.min(freqs)
+        fxmax = np.max(freqs)
+        if self.gridsize == "Inside":
+            f_ref = freqs[0]
+        elif self.gridsize == "Outside":
+            f_ref = freqs[-1]
+        else:  # self.gridsize == "Middle" which matches the extents
+            f_ref = freqs[len(freqs) // 2]
+        fymin = np.sin(np.min(az)) * f_ref
+        fymax = np.sin(np.max(az)) * f_ref
+        fzmin = np.sin(np.min(el)) * f_ref
+        fzmax = np.sin(np.max(el)) * f_ref
+
+        fx = np.linspace(fxmin, fxmax, nfreq)  # desired downrange frequencies
+        fy = np.linspace(fymin, fymax, nphi)  # desired crossrange frequencies
+        fz = np.linspace(fzmin, fzmax, ntheta)  # desired crossrange frequencies
+
+        def polar_points():
+            f_x, f_y, f_z = np.meshgrid(fx, fy, fz, indexing="ij")
+
+            # convert to equivalent freq, azimuth, and elevation interpolation points,
+            # so we can use the regular interpolator directly from freqs, az and el
+            fi = np.sqrt(f_x**2 + f_y**2 + f_z**2)
+            azi = np.arctan2(f_y, f_x)
+            with np.errstate(invalid="ignore"):
+                eli = np.arcsin(np.where(fi != 0, -f_z / fi, 0.0))
+            return fi, azi, eli
+
+        rdata = self.__interpolate(
+            "isar_3d",
+            (freqs, az, el),
+            cube,
+            polar_points,
+            None if self.extrapolate else 0.0,
+            (self.gridsize,),
+        )
+        return rdata, fx, fy, fz
+
+    def __isar_3d_image(self, cube, suffix):
+        """Compute the window and FFT stages of the ISAR 3D image.
+
+        Returns
+        -------
+        tuple
+            Complex image and its axes. In out-of-core mode, the image is already converted.
+        """
+        rdata, fx, fy, fz = self.__cached_stage("isar_3d_resampled", lambda: self.__isar_3d_resampled(cube), suffix)
+        nfreq, nphi, ntheta = rdata.shape[:3]
+        batched = rdata.ndim > 3
+
+        # output size
+        ndrng = self.upsample_range
+        nxrng1 = self.upsample_azimuth
+        nxrng2 = self.upsample_elevation
+
+        if ndrng < nfreq:
+            # Warning('nx should be at least as large as the length of f -- increasing nx')
+            self.__logger.warning("nx should be at least as large as the number of frequencies.")
+            ndrng = nfreq
+        if nxrng1 < nphi:
+            # warning('ny should be at least as large as the length of az -- increasing ny');
+            self.__logger.warning("ny should be at least as large as the number of azimuth angles.")
+            nxrng1 = nphi
+        if nxrng2 < ntheta:
+            # warning('nz should be at least as large as the length of el -- increasing nz');
+            self.__logger.warning("nz should be at least as large as the number of elevation angles.")
+            nxrng2 = ntheta
+        ndrng = self.__fast_size(ndrng)
+        nxrng1 = self.__fast_size(nxrng1)
+        nxrng2 = self.__fast_size(nxrng2)
+
+        # We want the physical extents of the image to be centered at the global origin, because
+        # that's how we draw the extents of the 3D ISAR domain.
+        # The center of the first pixel in the second half of each domain is centered at zero
+        # if the domain has odd length, but it is at dx/2 otherwise.
+        #
+        # add windowing
+        #
+        complex_dtype, _ = self.__dtypes()
+        # The window is separable. The phase shift is applied to the window of each axis, so the resampled data,
+        # which can be cached, is not copied.
+        windows = []
+        window_sum = 1.0
+        for num_after_fft, num_before_fft in ((ndrng, nfreq), (nxrng1, nphi), (nxrng2, ntheta)):
+            win, win_sum = self.__cached_window(self.window, num_before_fft, **self.window_parameters)
+            windows.append(MonostaticRCSData.phase_shift(win.astype(complex_dtype), 0, num_after_fft, num_before_fft))
+            window_sum *= win_sum
+
+        xshift = (ndrng - nfreq) // 2
+        yshift = (nxrng1 - nphi) // 2
+        zshift = (nxrng2 - ntheta) // 2
+        #
+        # normalize so that unit amplitude scatterers have about unit amplitude in
+        # the image (normalized for the windows).  The "about" comes because of the
+        # truncation of the polar shape into a rectangular shape.
+        #
+        scale = float(ndrng * nxrng1 * nxrng2 / window_sum)
+        if self.out_of_core and not batched:
+            isar_image = self.__stream_isar_3d((ndrng, nxrng1, nxrng2), (xshift, yshift, zshift), rdata, windows, scale)
+        else:
+            window = np.multiply.outer(np.multiply.outer(windows[0], windows[1]), windows[2])
+            window = window.reshape(window.shape + (1,) * (rdata.ndim - 3))
+            iq = np.zeros((ndrng, nxrng1, nxrng2) + rdata.shape[3:], dtype=complex_dtype)
+            iq[xshift : xshift + nfreq, yshift : yshift + nphi, zshift : zshift + ntheta] = np.multiply(rdata, window)
+            # Scale and shift without keeping more than two copies of the image alive.
+            iq *= scale
+            iq = np.fft.fftshift(iq, axes=(0, 1, 2))
+            isar_image = self.__fft("ifftn", iq, axes=(0, 1, 2)).astype(complex_dtype, copy=False)
+            del iq
+            isar_image = np.fft.fftshift(isar_image, axes=(0, 1, 2))  # Nx x Ny x Nz
+        #
+        #  compute the image plane downrange and crossrange distance vectors (in
+        #  meters)
+        #
+        dfx = fx[1] - fx[0]  # difference in x-frequencies
+        dfy = fy[1] - fy[0]  # difference in y-frequencies
+        dfz = fz[1] - fz[0]  # difference in z-frequencies
+        dx = SpeedOfLight / (2 * dfx) / ndrng
+        dy = SpeedOfLight / (2 * dfy) / nxrng1
+        dz = SpeedOfLight / (2 * dfz) / nxrng2
+        x = np.linspace(start=0, stop=ndrng * dx, num=ndrng)
+        y = np.linspace(start=0, stop=nxrng1 * dy, num=nxrng1)
+        z = np.linspace(start=0, stop=nxrng2 * dz, num=nxrng2)
+        #
+        # bring the center of the PHYSICAL image to 0, which means the first pixel on the
+        # second half is not at 0 for even length domains
+        range_values = x - 0.5 * (x[-1] - x[0])
+        cross_range1_values = y - 0.5 * (y[-1] - y[0])
+        cross_range2_values = z - 0.5 * (z[-1] - z[0])
+
+        axes = {
+            "Down-range": range_values,
+            "Cross-range-az": cross_range1_values,
+            "Cross-range-el": cross_range2_values,
+        }
+        return isar_image, axes
+
+    def __stream_isar_3d(self, shape, offset, data, windows, scale):
+        """Compute the 3D ISAR image out of core.
+
+        The frequency-domain data is windowed and scaled over azimuth slabs while it is written to a zero-padded
+        memory-mapped scratch file, which is inverse transformed with separable passes over slabs: the down-range
+        axis first, then the two cross-range axes. The converted image is written to another memory-mapped file,
+        which is removed when the image is released.
+
+        Parameters
+        ----------
+        shape : tuple
+            Image shape.
+        offset : tuple
+            Position of the data in the zero-padded cube.
+        data : numpy.ndarray
+            Frequency-domain data.
+        windows : list
+            Complex window of each axis.
+        scale : float
+            Normalization of the image.
+
+        Returns
+        -------
+        numpy.memmap
+            Converted image.
+        """
+        complex_dtype, _ = self.__dtypes()
+        directory = Path(self.scratch_directory) if self.scratch_directory else Path(tempfile.gettempdir())
+        scratch_file = self.__scratch_file(directory, "isar_3d_scratch_")
+        image_file = self.__scratch_file(directory, "isar_3d_")
+        itemsize = np.dtype(complex_dtype).itemsize
+        try:
+            iq = np.memmap(scratch_file, dtype=complex_dtype, mode="w+", shape=shape)
+            range_slice, _, elevation_slice = (slice(start, start + size) for start, size in zip(offset, data.shape))
+            window_range = windows[0].reshape((-1, 1, 1)) * scale
+            step = max(1, self.slab_bytes // (data.shape[0] * data.shape[2] * itemsize))
+            for start in range(0, data.shape[1], step):
+                slab = data[:, start : start + step, :] * windows[1][start : start + step].reshape((1, -1, 1))
+                slab *= window_range
+                slab *= windows[2]
+                azimuth_start = offset[1] + start
+                iq[range_slice, azimuth_start : azimuth_start + slab.shape[1], elevation_slice] = slab
+
+            # Down-range pass over azimuth slabs
+            step = max(1, self.slab_bytes // (shape[0] * shape[2] * itemsize))
+            for start in range(0, shape[1], step):
+                slab = np.fft.fftshift(iq[:, start : start + step, :], axes=0)
+                iq[:, start : start + step, :] = np.fft.fftshift(self.__fft("ifft", slab, axis=0), axes=0)
+
+            # Cross-range passes over down-range slabs
+            image = np.memmap(image_file, dtype=self.__converted_dtype(), mode="w+", shape=shape)
+            weakref.finalize(image, self.__remove_file, image_file)
+            step = max(1, self.slab_bytes // (shape[1] * shape[2] * itemsize))
+            normalize = self.data_conversion_function == "norm"
+            max_value = 0.0
+            for start in range(0, shape[0], step):
+                slab = np.fft.fftshift(iq[start : start + step], axes=(1, 2))
+                slab = np.fft.fftshift(self.__fft("ifft2", slab, axes=(1, 2)), axes=(1, 2))
+                if normalize:
+                    # The normalization needs the maximum of the whole image
+                    slab = np.abs(slab)
+                    max_value = max(max_value, float(np.max(slab)))
+                    image[start : start + step] = slab
+                else:
+                    image[start : start + step] = self.__convert(slab, self.data_conversion_function)
+            if normalize:
+                for start in range(0, shape[0], step):
+                    image[start : start + step] /= max_value
+            image.flush()
+            del iq
+        finally:
+            self.__remove_file(scratch_file)
+        return image
+
+    @staticmethod
+    def __scratch_file(directory, prefix, suffix=".dat"):
+        """Create an empty scratch file with a unique name."""
+        directory.mkdir(parents=True, exist_ok=True)
+        handle, file_name = tempfile.mkstemp(suffix=suffix, prefix=prefix, dir=directory)
+        os.close(handle)
+        return Path(file_name)
+
+    @staticmethod
+    def __remove_file(file_name):
+        """Remove a scratch file if the operating system allows it."""
+        try:
+            Path(file_name).unlink(missing_ok=True)
+        except OSError:  # pragma: no cover
+            pass
+
+    @pyaedt_function_handler()
+    def convert_to_chunked(self, output_file=None, chunk_shape=None, metadata_file=None):
+        """Convert the monostatic file to the chunked layout.
+
+        The chunked layout stores the dense ``(Freq, IWavePhi, IWaveTheta)`` cube as an HDF5 dataset split in blocks
+        of frequencies and angles, next to its axes. Accessors that only need one frequency or one aspect, such as
+        ``rcs_active_frequency`` and ``range_profile``, then read only the blocks they need. A metadata file
+        pointing to the converted file is written next to the input metadata file.
+
+        Parameters
+        ----------
+        output_file : str or :class:`pathlib.Path`, optional
+            Full path of the converted HDF5 file. The default is ``None``, in which case the name of the monostatic
+            file with the ``"_chunked"`` suffix is used.
+        chunk_shape : tuple, optional
+            Number of frequencies, phi angles, and theta angles of each block. The default is ``None``, in which
+            case blocks of one frequency and up to 64 by 64 angles are used.
+        metadata_file : str or :class:`pathlib.Path`, optional
+            Full path of the metadata file of the converted data. The default is ``None``, in which case the name of
+            the input metadata file with the ``"_chunked"`` suffix is used.
+
+        Returns
+        -------
+        :class:`pathlib.Path`
+            Full path of the metadata file of the converted data. Returns ``False`` if there is no monostatic data.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.radar_explorer.rcs_visualization import MonostaticRCSData
+        >>> rcs_data = MonostaticRCSData(input_file="rcs_metadata.json")
+        >>> chunked_data = MonostaticRCSData(input_file=rcs_data.convert_to_chunked())
+        """
+        if not self.__has_rcs():
+            self.__logger.error("There is no monostatic RCS data to convert.")
+            return False
+        if output_file is None:
+            output_file = self.__monostatic_file.with_name(f"{self.__monostatic_file.stem}_chunked.h5")
+        output_file = Path(output_file)
+        cube = self.rcs_cube
+        if chunk_shape is None:
+            chunk_shape = (1, 64, 64)
+        chunk_shape = tuple(max(1, min(int(block), size)) for block, size in zip(chunk_shape, cube.shape))
+
+        with tables.open_file(output_file, mode="w") as h5:
+            group = h5.create_group("/", "rcs")
+            group._v_attrs.name = self.name
+            h5.create_array(group, "Freq", np.asarray(self.frequencies, dtype=float))
+            h5.create_array(group, "IWavePhi", np.asarray(self.available_incident_wave_phi, dtype=float))
+            h5.create_array(group, "IWaveTheta", np.asarray(self.available_incident_wave_theta, dtype=float))
+            dataset = h5.create_carray(
+                group, "data", atom=tables.ComplexAtom(itemsize=16), shape=cube.shape, chunkshape=chunk_shape
+            )
+            for start in range(0, cube.shape[0], chunk_shape[0]):
+                dataset[start : start + chunk_shape[0]] = cube[start : start + chunk_shape[0]]
+
+        metadata = dict(self.metadata)
+        if metadata_file is None:
+            metadata_file = self.input_file.with_name(f"{self.input_file.stem}_chunked.json")
+        metadata_file = Path(metadata_file)
+        if output_file.parent.resolve() == metadata_file.parent.resolve():
+            metadata["monostatic_file"] = output_file.name
+        else:
+            metadata["monostatic_file"] = str(output_file.resolve())
+        with metadata_file.open("w") as file:
+            json.dump(metadata, file, indent=2)
+        return metadata_file
+
+    @pyaedt_function_handler()
+    def stacked_product(self, product, cube, key=None):
+        """Compute a derived product of several data sets in one pass.
+
+        The data sets are stacked along the last axis of ``cube`` and share the axes and the settings of this object.
+        Windowing, resampling, and FFTs run once for all of them, which is how :class:`MonostaticRCSPolarizations`
+        processes the polarizations of a simulation. The out-of-core mode is not used.
+
+        Parameters
+        ----------
+        product : str
+            Product name. Options are ``"range_profile"``, ``"waterfall"``, ``"isar_2d"``, and ``"isar_3d"``.
+        cube : numpy.ndarray
+            Complex data with shape ``(number of frequencies, number of phi angles, number of theta angles,
+            number of data sets)``.
+        key : tuple, optional
+            Identifier of the stacked data. If given, the results are cached in ``product_cache`` for the current
+            settings and this identifier. The default is ``None``, in which case the results are not cached.
+
+        Returns
+        -------
+        list
+            One result per data set, of the same type as the corresponding property.
+        """
+        computes = {
+            "range_profile": self.__compute_range_profile,
+            "waterfall": self.__compute_waterfall,
+            "isar_2d": self.__compute_isar_2d,
+            "isar_3d": self.__compute_isar_3d,
+        }
+        if product not in computes:
+            self.__logger.error(f"Product '{product}' is not available for stacked data.")
+            return False
+        if not self.__has_rcs():
+            return None
+        shape = (len(self.frequencies), self.available_incident_wave_phi.size, self.available_incident_wave_theta.size)
+        if cube.ndim != 4 or cube.shape[:3] != shape:
+            self.__logger.error("Stacked data must have the axes of this data and one trailing axis.")
+            return False
+        suffix = None if key is None else ("stacked",) + tuple(key)
+        # Only the ISAR images have cached stages
+        stages = {"suffix": suffix} if product in ["isar_2d", "isar_3d"] else {}
+        if key is None:
+            value, self.__peak_bytes = self.__measure_peak(lambda: computes[product](cube, **stages))
+            return value
+        return self.__cached_product(product, lambda: computes[product](cube, **stages), suffix)
+
+    @staticmethod
+    def window_function(window="Flat", size=512, **parameters):
+        """Apply a window function.
+
+        The coefficients are cached for each window, size, and parameters. A writable copy is returned.
+
+        Parameters
+        ----------
+        window : str, default: ``"Flat"``
+            Window function with a peak of one. Options are ``"Flat"``, ``"Hamming"``, ``"Hann"``, ``"Taylor"``,
+            ``"Blackman-Harris"``, ``"Kaiser"``, and ``"Chebyshev"``.
+        size : int, default: ``512``
+            Window size.
+        **parameters
+            Parameters of the window function. The defaults are the ones of ``window_parameters``.
+
+        Returns
+        -------
+        tuple
+            Data windowed and data sum.
+        """
+        win, win_sum = MonostaticRCSData.__cached_window(window, size, **parameters)
+        return win.copy(), win_sum
+
+    @staticmethod
+    def window_tensor(window="Flat", shape=(512,), **parameters):
+        """Get a separable N-D window function.
+
+        The window is the outer product of the window functions of each axis.
+
+        Parameters
+        ----------
+        window : str, default: ``"Flat"``
+            Window function. Options are the ones of the ``window_function()`` method.
+        shape : tuple, default: ``(512,)``
+            Window size along each axis.
+        **parameters
+            Parameters of the window function.
+
+        Returns
+        -------
+        tuple
+            Window with the given shape and its sum.
+        """
+        tensor = np.ones(())
+        tensor_sum = 1.0
+        for size in shape:
+            win, win_sum = MonostaticRCSData.__cached_window(window, size, **parameters)
+            tensor = np.multiply.outer(tensor, win)
+            tensor_sum *= win_sum
+        return tensor, tensor_sum
+
+    @staticmethod
+    def __cached_window(window, size, **parameters):
+        """Get the cached read-only coefficients of a window function and their sum."""
+        return MonostaticRCSData.__window_coefficients(window, int(size), tuple(sorted(parameters.items())))
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def __window_coefficients(window, size, parameters):
+        """Get the read-only coefficients of a window function and their sum."""
+        parameters = {**MonostaticRCSData.__window_defaults.get(window, {}), **dict(parameters)}
+        if window == "Hann":
+            win = np.hanning(size)
+        elif window == "Hamming":
+            win = np.hamming(size)
+        elif window == "Taylor":
+            win = scipy_windows.taylor(size, nbar=int(parameters["nbar"]), sll=parameters["sll"])
+        elif window == "Blackman-Harris":
+            win = scipy_windows.blackmanharris(size)
+        elif window == "Kaiser":
+            win = np.kaiser(size, parameters["beta"])
+        elif window == "Chebyshev":
+            win = scipy_windows.chebwin(size, at=parameters["at"])
+        else:
+            win = np.ones(size)
+        win.flags.writeable = False
+        return win, np.sum(win)
+
+    @pyaedt_function_handler()
+    def __init_rcs(self):
+        """Load the name and the axes of the monostatic radar cross-section data.
+
+        Only the index of the HDF5 table is read. The samples are read by ``__load_rcs``.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+        """
+        level_names = ["Freq", "IWavePhi", "IWaveTheta"]
+        header = self.__read_binary_cache_header() if self.binary_cache else None
+        if header:
+            self.__binary_cache_header = header
+            self.__chunked = header["chunked"]
+            self.__name = header["name"]
+            self.__set_axes(*(header["axes"][level_name] for level_name in level_names))
+            return True
+
+        with tables.open_file(self.__monostatic_file, mode="r") as h5:
+            if "/rcs/data" in h5:
+                group = h5.root.rcs
+                self.__chunked = True
+                self.__name = str(group._v_attrs.name)
+                self.__set_axes(group.Freq.read(), group.IWavePhi.read(), group.IWaveTheta.read())
+                return True
+
+        try:
+            with pd.HDFStore(self.__monostatic_file, mode="r") as store:
+                storer = store.get_storer("df")
+                if storer.is_table:
+                    names = [name for name in storer.non_index_axes[0][1] if name not in storer.levels]
+                    levels = self.__read_table_levels(storer.table, storer.levels)
+                else:
+                    names = list(storer.read_index("axis0"))
+                    index = storer.read_index("axis1").remove_unused_levels()
+                    levels = dict(zip(index.names, index.levels))
+        except ImportError as e:  # pragma: no cover
+            self.__logger.error(f"Failed to load monostatic RCS data: {e}")
+            return False
+
+        axes = []
+        for level_name in level_names:
+            if level_name not in levels:  # pragma: no cover
+                self.__logger.error(f"Monostatic RCS data does not contain '{level_name}'.")
+                return False
+            axes.append(np.unique(np.asarray(levels[level_name], dtype=float)))
+
+        self.__name = names[0]
+        self.__set_axes(*axes)
+        return True
+
+    @staticmethod
+    def __read_table_levels(table, level_names, block_size=4096):
+        """Read the index levels of a table without reading every row.
+
+        Monostatic tables are written as a regular grid in which each level repeats with a constant stride. The rows
+        are read in growing blocks until every level has changed once, which gives the stride of the slowest level.
+        The slowest level is then read with that stride and the other levels are taken from the first block. Tables
+        with a single value in one level are read entirely. The levels are checked against the samples in
+        ``__load_rcs``.
+
+        Parameters
+        ----------
+        table : tables.Table
+            Table of the data frame.
+        level_names : list
+            Names of the index levels, which are columns of the table.
+        block_size : int, optional
+            Number of rows of the first block. The default is ``4096``.
+
+        Returns
+        -------
+        dict
+            Values of each level.
+        """
+        nrows = table.nrows
+        stop = min(block_size, nrows)
+        while True:
+            rows = table.read(0, stop)
+            columns = {name: rows[name] for name in level_names}
+            changes = {name: np.flatnonzero(column != column[0]) for name, column in columns.items()}
+            if stop == nrows:
+                return columns
+            if all(change.size for change in changes.values()):
+                break
+            stop = min(2 * stop, nrows)
+
+        stride = max(int(change[0]) for change in changes.values())
+        levels = {name: column[:stride] for name, column in columns.items()}
+        slowest = max(changes, key=lambda name: changes[name][0])
+        levels[slowest] = table.read(0, nrows, stride, field=slowest)
+        if np.prod([np.unique(level).size for level in levels.values()]) != nrows:
+            # Not a regular grid, so every row is read
+            return {name: table.read(field=name) for name in level_names}
+        return levels
+
+    def __set_axes(self, frequencies, phi, theta):
+        """Store the sorted axes and their spacing, which are computed once per data file."""
+        self.__frequency_axis = np.asarray(frequencies, dtype=float)
+        self.__frequencies = self.__frequency_axis.tolist()
+        self.__available_incident_wave_phi = np.asarray(phi, dtype=float)
+        self.__available_incident_wave_theta = np.asarray(theta, dtype=float)
+        axes = {
+            "Freq": self.__frequency_axis,
+            "IWavePhi": self.__available_incident_wave_phi,
+            "IWaveTheta": self.__available_incident_wave_theta,
+        }
+        for level_name, axis in axes.items():
+            if axis.size > 1:
+                self.__axis_steps[level_name] = float(np.min(np.diff(axis)))
+            else:
+                self.__axis_steps[level_name] = max(abs(float(axis[0])), 1.0) if axis.size else 0.0
+
+    def __snap(self, axis, level_name, val):
+        """Find the position of the available sample matching a value within ``snap_tolerance``.
+
+        Parameters
+        ----------
+        axis : numpy.ndarray
+            Sorted axis.
+        level_name : str
+            Name of the axis.
+        val : float
+            Value to look up.
+
+        Returns
+        -------
+        int or None
+            Position of the sample, or ``None`` if no sample is close enough.
+        """
+        if axis is None or not axis.size:
+            return None
+        try:
+            val = float(val)
+        except (TypeError, ValueError):
+            return None
+        idx = int(np.searchsorted(axis, val))
+        if idx == axis.size or (idx > 0 and val - axis[idx - 1] < axis[idx] - val):
+            idx -= 1
+        if abs(axis[idx] - val) <= self.snap_tolerance * self.__axis_steps[level_name]:
+            return idx
+        return None
+
+    @pyaedt_function_handler()
+    def __load_rcs(self):
+        """Load the monostatic radar cross-section samples if they are not loaded yet.
+
+        Returns
+        -------
+        bool
+            ``True`` when the samples are available, ``False`` otherwise.
+        """
+        if self.__rcs_cube is not None:
+            return True
+        if not self.__monostatic_file:
+            return False
+        if self.__binary_cache_header:
+            cube = self.__read_binary_cache()
+            if cube is not None:
+                self.__rcs_cube = cube
+                self.__data_version += 1
+                return True
+        if self.__chunked:
+            self.__rcs_cube = self.__read_rcs()
+            self.__data_version += 1
+            self.__write_binary_cache()
+            return True
+        try:
+            raw_data = pd.read_hdf(self.__monostatic_file, key="df", mode="r")
+        except ImportError as e:  # pragma: no cover
+            self.__logger.error(f"Failed to load monostatic RCS data: {e}")
+            return False
+
+        # Scatter the samples once into a dense (Freq, IWavePhi, IWaveTheta) cube so that every accessor
+        # is an index or a slice instead of a MultiIndex lookup.
+        index = raw_data.index.remove_unused_levels()
+        level_names = ["Freq", "IWavePhi", "IWaveTheta"]
+        levels = [np.sort(np.asarray(index.levels[index.names.index(name)], dtype=float)) for name in level_names]
+        axes = [self.__frequency_axis, self.available_incident_wave_phi, self.available_incident_wave_theta]
+        if not all(np.array_equal(level, axis) for level, axis in zip(levels, axes)):
+            # The axes read from the first rows of the table do not match the samples
+            self.__set_axes(*levels)
+            axes = levels
+        positions = []
+        for level_name, axis in zip(level_names, axes):
+            level_number = index.names.index(level_name)
+            level_positions = np.searchsorted(axis, np.asarray(index.levels[level_number], dtype=float))
+            positions.append(level_positions[index.codes[level_number]])
+
+        cube = np.zeros([axis.size for axis in axes], dtype=np.complex128)
+        cube[tuple(positions)] = raw_data.iloc[:, 0].to_numpy()
+
+        self.__raw_data = raw_data
+        self.__rcs_cube = cube
+        self.__data_version += 1
+        self.__write_binary_cache()
+        return True
+
+    def __binary_cache_source(self):
+        """Get the signature of the monostatic file stored in the binary sidecar header."""
+        return self.__file_signature(self.__monostatic_file)
+
+    @staticmethod
+    def __file_signature(file_name):
+        """Get the name, size, and modification time of a file."""
+        stat = file_name.stat()
+        return {"name": file_name.name, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    @staticmethod
+    def __binary_cache_checksum(header, cube, chunk_size=2**22):
+        """Compute the checksum of a binary sidecar from its header and all the samples.
+
+        The samples are hashed in chunks of ``chunk_size`` samples, so a memory-mapped sidecar is not copied.
+        """
+        content = {key: value for key, value in header.items() if key != "checksum"}
+        digest = hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8"))
+        flat = np.ascontiguousarray(cube).reshape(-1)
+        for start in range(0, flat.size, chunk_size):
+            digest.update(flat[start : start + chunk_size])
+        return digest.hexdigest()
+
+    def __read_binary_cache_header(self):
+        """Read the binary sidecar header if it matches the monostatic file, the sidecar, and the format version."""
+        header_file = self.binary_cache_file.with_suffix(".json")
+        if not header_file.is_file() or not self.binary_cache_file.is_file():
+            return None
+        try:
+            with header_file.open("r") as file:
+                header = json.load(file)
+            if (
+                header.get("version") != self.__binary_cache_version
+                or header.get("source") != self.__binary_cache_source()
+                or header.get("cache") != self.__file_signature(self.binary_cache_file)
+            ):
+                return None
+        except (OSError, ValueError):
+            return None
+        return header
+
+    def __read_binary_cache(self):
+        """Memory-map the binary sidecar.
+
+        Returns
+        -------
+        numpy.memmap or None
+            Read-only dense RCS data, or ``None`` if the sidecar is invalid.
+        """
+        header = self.__binary_cache_header
+        self.__binary_cache_header = None
+        try:
+            cube = np.load(self.binary_cache_file, mmap_mode="r")
+        except (OSError, ValueError):
+            cube = None
+        # The samples are not hashed, so that they are only read when they are used
+        if cube is None or list(cube.shape) != header["shape"] or cube.dtype.str != header["dtype"]:
+            self.__logger.warning("Binary cache of the monostatic RCS data is invalid. Reading the monostatic file.")
+            return None
+        return cube
+
+    def __write_binary_cache(self):
+        """Write the binary sidecar of the loaded dense RCS data."""
+        if not self.binary_cache:
+            return False
+        cube = self.__rcs_cube
+        header = {
+            "version": self.__binary_cache_version,
+            "source": self.__binary_cache_source(),
+            "chunked": self.__chunked,
+            "name": self.name,
+            "shape": list(cube.shape),
+            "dtype": cube.dtype.str,
+            "axes": {
+                "Freq": [float(value) for value in self.frequencies],
+                "IWavePhi": self.available_incident_wave_phi.tolist(),
+                "IWaveTheta": self.available_incident_wave_theta.tolist(),
+            },
+        }
+        cache_file = self.binary_cache_file
+        header_file = cache_file.with_suffix(".json")
+        temporary_files = []
+        try:
+            # Other instances can write the same sidecar at the same time, so each one writes its own files and
+            # replaces the sidecar atomically. The header is replaced last and stores the size and modification
+            # time of its own data file, so a header that does not match the data is rejected.
+            for target, write in [
+                (cache_file, lambda file: np.save(file, cube)),
+                (header_file, lambda file: file.write(json.dumps(header).encode("utf-8"))),
+            ]:
+                temporary_files.append(self.__scratch_file(target.parent, f"{target.name}_", ".tmp"))
+                with temporary_files[-1].open("wb") as file:
+                    write(file)
+                if target == cache_file:
+                    header["cache"] = dict(self.__file_signature(temporary_files[-1]), name=cache_file.name)
+                    header["checksum"] = self.__binary_cache_checksum(header, cube)
+                temporary_files[-1].replace(target)
+        except OSError as e:
+            self.__logger.warning(f"Binary cache of the monostatic RCS data cannot be written: {e}")
+            for temporary_file in temporary_files:
+                self.__remove_file(temporary_file)
+            return False
+        return True
+
+    def __read_rcs(self, freq_idx=slice(None), phi_idx=slice(None), theta_idx=slice(None)):
+        """Read a block of the RCS cube.
+
+        Chunked files are read partially while the whole cube is not loaded. Otherwise, the block is taken from
+        ``rcs_cube``.
+
+        Parameters
+        ----------
+        freq_idx : int or slice, optional
+            Frequency positions.
+        phi_idx : int or slice, optional
+            Incident wave phi positions.
+        theta_idx : int or slice, optional
+            Incident wave theta positions.
+
+        Returns
+        -------
+        numpy.ndarray
+            Complex RCS data.
+        """
+        block = (freq_idx, phi_idx, theta_idx)
+        if self.__rcs_cube is None and self.__chunked:
+            with tables.open_file(self.__monostatic_file, mode="r") as h5:
+                return h5.root.rcs.data[block]
+        return self.rcs_cube[block]
+
+    @staticmethod
+    def __convert(data, function):
+        """Apply a conversion function to complex data, using ``"dB10"`` if the function is ``None``."""
+        return conversion_function(data, function or "dB10")
+
+    def __converted_cube(self, function):
+        """Get the dense RCS data converted with a conversion function from the cache or compute it."""
+        cube = self.rcs_cube
+        function = function or "dB10"
+        # The data version invalidates the converted cubes if the samples are loaded again
+        key = (self.__cache_id, "converted_cube", function, self.__data_version)
+        value = self.__product_cache.get(key)
+        if value is None:
+            value = self.__convert(cube, function)
+            value.flags.writeable = False
+            self.__product_cache.put(key, value)
+        return value
+
+    def __converted_rcs(self, freq_idx=slice(None), phi_idx=slice(None), theta_idx=slice(None)):
+        """Get a block of the RCS data converted with ``data_conversion_function``.
+
+        The block is taken from the cached converted cube when the samples are loaded and the converted cube fits
+        in the memory budget of ``product_cache``. Otherwise, only the block is read and converted.
+        """
+        block = (freq_idx, phi_idx, theta_idx)
+        function = self.data_conversion_function
+        if not self.is_loaded or self.__converted_nbytes() > self.__product_cache.max_bytes:
+            return self.__convert(self.__read_rcs(*block), function)
+        if function == "norm":
+            # Blocks are normalized on their own
+            magnitude = self.__converted_cube("abs")[block]
+            return magnitude / np.max(magnitude)
+        return self.__converted_cube(function)[block]
+
+    def __converted_nbytes(self):
+        """Get the size of the dense RCS data converted to real values."""
+        cube = self.rcs_cube
+        return cube.size * np.finfo(cube.dtype).dtype.itemsize
+
+    def __has_rcs(self):
+        """Check if monostatic RCS data is available."""
+        return self.__monostatic_file is not None and self.__available_incident_wave_phi is not None
+
+    def __interpolate(self, name, grid, values, points, fill_value, settings=()):
+        """Interpolate data on a regular grid.
+
+        Linear and nearest interpolations are applied as a sparse operator that only depends on the grid, the target
+        points, and the interpolation settings. The operator is cached in ``resampling_cache`` and shared by all
+        the data objects with the same axes, such as the polarizations of one simulation. If the operator does not
+        fit in the memory budget of the cache, the data is interpolated directly instead.
+
+        Parameters
+        ----------
+        name : str
+            Name of the resampling.
+        grid : tuple
+            Grid axes.
+        values : numpy.ndarray
+            Data on the grid. Trailing axes are interpolated together.
+        points : callable
+            Function returning the target points as a tuple of arrays, one per grid axis.
+        fill_value : float or None
+            Value outside the grid. If ``None``, the data is extrapolated.
+        settings : tuple, optional
+            Settings that define the target points besides the grid axes.
+
+        Returns
+        -------
+        numpy.ndarray
+            Interpolated data.
+        """
+        complex_dtype, real_dtype = self.__dtypes()
+        values = values.astype(complex_dtype, copy=False)
+
+        def interpolate(target):
             interp = RegularGridInterpolator(
-                (freqs, azel_samples),
-                data,
-                method=self.interpolation,
-                bounds_error=False,
-                fill_value=None if self.extrapolate else 0.0,
+                grid, values, method=self.interpolation, bounds_error=False, fill_value=fill_value
             )
-            rdata = interp((fi, azi))
-
-            # Zero padding
-            if ndrng < nfreq:
-                # Warning('nx should be at least as large as the length of f -- increasing nx')
-                self.__logger.warning("nx should be at least as large as the number of frequencies.")
-                ndrng = nfreq
-            if nxrng < nangles:  # pragma: no cover
-                # warning('ny should be at least as large as the length of az -- increasing ny');
-                self.__logger.warning("ny should be at least as large as the number of azimuth angles.")
-                nxrng = nangles
-
-            #  Compute the image plane downrange and cross-range distance vectors (in
-            #  meters)
-            dfx = fx[1] - fx[0]  # difference in x-frequencies
-            dfy = fy[1] - fy[0]  # difference in y-frequencies
-            dx = SpeedOfLight / (2 * dfx) / ndrng
-            dy = SpeedOfLight / (2 * dfy) / nxrng
-            x = np.linspace(start=0, stop=ndrng * dx, num=ndrng)  # ndrng
-            y = np.linspace(start=0, stop=nxrng * dy, num=nxrng)  # nxrng
-
-            # We want the physical extents of the image to be centered at the global origin, because
-            # that's how we draw the extents of the 2D ISAR domain.
-            # The center of the first pixel in the second half of each domain is centered at zero
-            # if the domain has odd length, but it is at dx/2 otherwise.
-            fft_domain_sizes = ((ndrng, nfreq), (nxrng, nangles))
-            for islide, fft_domain_size in enumerate(fft_domain_sizes):
-                rdata = MonostaticRCSData.phase_shift(rdata, islide, *fft_domain_size)
-
-            winx, winx_sum = self.window_function(self.window, nfreq)
-            winy, winy_sum = self.window_function(self.window, nangles)
-
-            winx = winx.reshape(-1, 1)
-            winy = winy.reshape(1, -1)
-
-            iq = np.zeros((ndrng, nxrng), dtype=np.complex128)
-            xshift = (ndrng - nfreq) // 2
-            yshift = (nxrng - nangles) // 2
-            iq[xshift : xshift + nfreq, yshift : yshift + nangles] = np.multiply(rdata, winx * winy)
-
-            # Normalize so that unit amplitude scatterers have about unit amplitude in
-            # the image (normalized for the windows).  The "about" comes because of the
-            # truncation of the polar shape into a rectangular shape.
-            #
-            iq = np.fft.fftshift(iq) * ndrng * nxrng / winx_sum / winy_sum
-            isar_image = np.fft.fftshift(np.fft.ifft2(iq))
-            # Nx x Ny
-            isar_image = conversion_function(isar_image, self.data_conversion_function)
-
-            # isar_image = isar_image.transpose()
-            # isar_image = isar_image[::-1, :]  # this used to be flipped, but it matched range/cross range defs now
-
-            # bring the center of the PHYSICAL image to 0, which means the first pixel on the
-            # second half is not at 0 for even length domains
-            range_values = x - 0.5 * (x[-1] - x[0])
-            cross_range_values = y - 0.5 * (y[-1] - y[0])
-
-            rr, xr = np.meshgrid(range_values, cross_range_values)
-
-            rr_flat = rr.ravel()
-            xr_flat = xr.ravel()
-            isar_image_flat = isar_image.ravel()
-
-            index_names = ["Down-range", "Cross-range", "Data"]
-            df = pd.DataFrame(columns=index_names)
-            df["Down-range"] = rr_flat
-            df["Cross-range"] = xr_flat
-            df["Data"] = isar_image_flat
+            return interp(target).astype(complex_dtype, copy=False)
+
+        if self.interpolation not in ["linear", "nearest"]:
+            return interpolate(points())
+
+        key = (name, self.interpolation, fill_value, np.dtype(real_dtype).name) + settings
+        key += tuple(np.asarray(axis).tobytes() for axis in grid)
+        operator = self.__resampling_cache.get(key)
+        if operator is None:
+            target = np.broadcast_arrays(*points())
+            # The operator is only worth building if it can be reused
+            corners = 2 ** len(grid) if self.interpolation == "linear" else 1
+            size = target[0].size * corners * (np.dtype(real_dtype).itemsize + np.dtype(np.int32).itemsize)
+            if size > self.__resampling_cache.max_bytes:
+                return interpolate(tuple(target))
+            matrix = self.resampling_operator(grid, target, self.interpolation, fill_value is None, real_dtype)
+            operator = (matrix, target[0].shape)
+            del target
+            self.__resampling_cache.put(key, operator)
+        matrix, shape = operator
+        ndim = len(grid)
+        result = matrix @ values.reshape((matrix.shape[1], -1))
+        return result.reshape(shape + values.shape[ndim:])
 
-        return df
+    @staticmethod
+    def resampling_operator(grid, points, method="linear", extrapolate=True, dtype=np.float64):
+        """Build the sparse operator of a linear or nearest interpolation on a regular grid.
+
+        The operator reproduces ``scipy.interpolate.RegularGridInterpolator`` with ``bounds_error=False``.
+        Points outside the grid are extrapolated or set to zero. Each row holds the same number of entries, so the
+        operator is built in place with 32-bit indices when they fit.
+
+        Parameters
+        ----------
+        grid : tuple
+            Strictly ascending or descending grid axes.
+        points : tuple
+            Target points as arrays of the same shape, one per grid axis.
+        method : str, default: ``"linear"``
+            Interpolation method. Options are ``"linear"`` and ``"nearest"``.
+        extrapolate : bool, default: ``True``
+            Whether to extrapolate outside the grid. If ``False``, the result is zero there.
+        dtype : numpy.dtype, default: ``numpy.float64``
+            Data type of the weights.
+
+        Returns
+        -------
+        :class:`scipy.sparse.csr_matrix`
+            Operator with one row per target point and one column per grid point in C order.
+        """
+        shape = tuple(len(axis) for axis in grid)
+        points = [np.asarray(point, dtype=float).ravel() for point in points]
+        npoints = points[0].size
+        ncolumns = int(np.prod(shape))
+        out_of_bounds = np.zeros(npoints, dtype=bool)
+        nans = np.zeros(npoints, dtype=bool)
+
+        # Corner indices and weights along each axis
+        corners = []
+        for axis, x in zip(grid, points):
+            axis = np.asarray(axis, dtype=float)
+            descending = axis.size > 1 and axis[0] > axis[-1]
+            if descending:
+                axis = axis[::-1]
+            out_of_bounds |= (x < axis[0]) | (x > axis[-1])
+            nans |= np.isnan(x)
+            if axis.size == 1:
+                axis_corners = [(np.zeros(npoints, dtype=np.intp), None)]
+            else:
+                idx = np.clip(np.searchsorted(axis, x, side="right") - 1, 0, axis.size - 2)
+                with np.errstate(invalid="ignore"):
+                    distance = (x - axis[idx]) / (axis[idx + 1] - axis[idx])
+                if method == "nearest":
+                    axis_corners = [(np.where(distance <= 0.5, idx, idx + 1), None)]
+                else:
+                    axis_corners = [(idx, 1 - distance), (idx + 1, distance)]
+            if descending:
+                axis_corners = [(axis.size - 1 - idx, weight) for idx, weight in axis_corners]
+            corners.append(axis_corners)
+
+        # One entry per row and corner, filled column by column without intermediate lists
+        ncorners = int(np.prod([len(axis_corners) for axis_corners in corners]))
+        index_dtype = np.int32 if max(ncolumns, npoints * ncorners) <= np.iinfo(np.int32).max else np.int64
+        strides = [int(np.prod(shape[dim + 1 :])) for dim in range(len(shape))]
+        indices = np.zeros((npoints, ncorners), dtype=index_dtype)
+        data = np.ones((npoints, ncorners), dtype=dtype)
+        for column, corner in enumerate(itertools.product(*corners)):
+            for stride, (idx, weight) in zip(strides, corner):
+                indices[:, column] += (idx * stride).astype(index_dtype, copy=False)
+                if weight is not None:
+                    data[:, column] *= weight
+        if not extrapolate:
+            data[out_of_bounds] = 0.0
+        data[nans] = np.nan
+
+        indptr = np.arange(0, npoints * ncorners + 1, ncorners, dtype=index_dtype)
+        return csr_matrix((data.ravel(), indices.ravel(), indptr), shape=(npoints, ncolumns))
+
+    def __product_key(self, product):
+        """Build the cache key of a derived product from the settings it depends on."""
+        if product == "range_profile":
+            settings = (self.incident_wave_theta, self.incident_wave_phi, self.__window_settings(), self.window_size)
+        elif product == "range_profile_cube":
+            settings = (self.__window_settings(), self.window_size)
+        elif product == "waterfall":
+            settings = (
+                self.incident_wave_theta,
+                self.incident_wave_phi,
+                self.aspect_range,
+                self.__window_settings(),
+                self.window_size,
+            )
+        elif product == "isar_2d":
+            settings = (
+                self.incident_wave_theta,
+                self.incident_wave_phi,
+                self.aspect_range,
+                self.__window_settings(),
+                self.upsample_range,
+                self.interpolation,
+                self.extrapolate,
+                self.gridsize,
+            )
+        else:
+            settings = (
+                self.__window_settings(),
+                self.upsample_range,
+                self.upsample_azimuth,
+                self.upsample_elevation,
+                self.interpolation,
+                self.extrapolate,
+                self.gridsize,
+                self.out_of_core,
+            )
+        return (product, self.data_conversion_function, self.precision, self.fast_length) + settings
+
+    @staticmethod
+    def __discard_products(caches, cache_id):
+        """Remove the products and the stages of an instance from the caches."""
+        for cache in caches:
+            cache.discard(cache_id)
+
+    def __cached_product(self, product, compute, suffix=()):
+        """Get a derived product from the cache or compute and store it."""
+        if not self.__has_rcs():
+            return None
+        key = (self.__cache_id,) + self.__product_key(product) + suffix
+        value = self.__product_cache.get(key)
+        if value is None:
+            value, self.__peak_bytes = self.__measure_peak(compute)
+            self.__product_cache.put(key, value)
+        return value
+
+    def __window_settings(self):
+        """Get the active window function and its parameters as a cache key."""
+        return (self.window,) + tuple(sorted(self.window_parameters.items()))
+
+    def __stage_key(self, stage):
+        """Build the cache key of a product stage from the settings of the stage and of the stages before it."""
+        resampling = (self.interpolation, self.extrapolate, self.gridsize, self.precision)
+        if stage == "isar_2d_resampled":
+            settings = (self.incident_wave_theta, self.incident_wave_phi, self.aspect_range) + resampling
+        elif stage == "isar_2d_image":
+            settings = self.__stage_key("isar_2d_resampled")[1:] + (
+                self.__window_settings(),
+                self.upsample_range,
+                self.fast_length,
+            )
+        elif stage == "isar_3d_resampled":
+            settings = resampling
+        else:
+            settings = resampling + (
+                self.__window_settings(),
+                self.upsample_range,
+                self.upsample_azimuth,
+                self.upsample_elevation,
+                self.fast_length,
+            )
+        return (stage,) + settings
+
+    def __cached_stage(self, stage, compute, suffix=()):
+        """Get the output of a product stage from the cache or compute and store it.
+
+        ISAR images are computed in stages: resampling, then windowing and FFT to the complex image, then
+        conversion. The outputs of the first stages are cached in ``stage_cache`` under the settings they depend
+        on, so changing a setting only recomputes the stages from the first one that uses it. If ``suffix`` is
+        ``None``, the output is not cached.
+        """
+        if suffix is None:
+            return compute()
+        key = (self.__cache_id,) + self.__stage_key(stage) + suffix
+        value = self.__stage_cache.get(key)
+        if value is None:
+            value = compute()
+            for item in value:
+                if isinstance(item, np.ndarray):
+                    item.flags.writeable = False
+            self.__stage_cache.put(key, value)
+        return value
+
+    def __measure_peak(self, compute):
+        """Run a computation and measure the peak memory it allocates if ``measure_peak_memory`` is enabled."""
+        if not self.measure_peak_memory:
+            return compute(), None
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        # The peak of a caller that is already tracing is not reset
+        start, previous_peak = tracemalloc.get_traced_memory()
+        try:
+            value = compute()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+        if peak <= previous_peak:
+            # The computation did not reach the previous peak, so only its retained memory is known
+            peak = current
+        return value, peak - start
+
+    def __fft(self, name, data, **kwargs):
+        """Run a transform of the ``numpy.fft`` interface with the active FFT backend."""
+        if self.fft_backend == "scipy":
+            return getattr(scipy_fft, name)(data, workers=self.fft_workers, **kwargs)
+        if self.fft_backend == "pyfftw":  # pragma: no cover
+            threads = os.cpu_count() if self.fft_workers == -1 else self.fft_workers
+            return getattr(pyfftw_fft, name)(data, threads=threads, **kwargs)
+        return getattr(np.fft, name)(data, **kwargs)
+
+    def __fast_size(self, size):
+        """Round a transform size up to the next fast length if ``fast_length`` is enabled."""
+        if self.fast_length:
+            return int(scipy_fft.next_fast_len(int(size)))
+        return size
+
+    def __convert_image(self, image, batched):
+        """Apply ``data_conversion_function`` to an image, normalizing each image of a batch on its own."""
+        if batched and self.data_conversion_function == "norm":
+            magnitude = np.abs(image)
+            return magnitude / np.max(magnitude, axis=tuple(range(image.ndim - 1)), keepdims=True)
+        return self.__convert(image, self.data_conversion_function)
+
+    @staticmethod
+    def __unstack(data, batched, build):
+        """Build one result per index of the trailing batch axis, or a single result if there is no batch."""
+        if not batched:
+            return build(data)
+        return [build(data[..., index]) for index in range(data.shape[-1])]
+
+    def __dtypes(self):
+        """Get the complex and real data types of the active precision."""
+        if self.precision == "single":
+            return np.complex64, np.float32
+        return np.complex128, np.float64
+
+    def __converted_dtype(self):
+        """Get the data type of the converted products."""
+        return self.__dtypes()[1]
+
+
+class MonostaticRCSPolarizations(object):
+    """Provides the polarizations of a monostatic RCS simulation as one data set.
+
+    The polarizations are loaded together and must share the frequency and incident wave axes. Range profiles,
+    waterfalls, and ISAR images of all the polarizations are computed in one pass over the data stacked along a
+    trailing polarization axis, with the settings of the first polarization. Use the ``update_settings()`` method
+    to change the settings of all the polarizations at once.
+
+    Parameters
+    ----------
+    input_files : list
+        Metadata information in JSON files, one per polarization.
+    binary_cache : bool, default: ``False``
+        Whether to keep the dense RCS data of each polarization in a binary sidecar next to its monostatic file.
+    product_cache : :class:`RCSProductCache`, default: ``None``
+        Cache of derived products of all the polarizations. The default is ``None``, in which case the cache shared
+        by all the :class:`MonostaticRCSData` instances is used.
+    stage_cache : :class:`RCSProductCache`, default: ``None``
+        Cache of the intermediate stages of the ISAR images of all the polarizations. The default is ``None``, in
+        which case the cache shared by all the :class:`MonostaticRCSData` instances is used.
+
+    Examples
+    --------
+    >>> from ansys.aedt.toolkits.radar_explorer.rcs_visualization import MonostaticRCSPolarizations
+    >>> polarizations = MonostaticRCSPolarizations(["VV_metadata.json", "HH_metadata.json"])
+    >>> polarizations.update_settings(window="Hann", upsample_range=256)
+    >>> isar_2d = polarizations.isar_2d
+    >>> isar_2d["VV"].data
+    """
+
+    def __init__(self, input_files, binary_cache=False, product_cache=None, stage_cache=None):
+        self.__logger = logger
+        self.__data = {}
+        for input_file in input_files:
+            rcs_data = MonostaticRCSData(
+                input_file=input_file, binary_cache=binary_cache, product_cache=product_cache, stage_cache=stage_cache
+            )
+            if rcs_data.name in self.__data:
+                raise ValueError(f"Polarization '{rcs_data.name}' is duplicated.")
+            self.__data[rcs_data.name] = rcs_data
+
+        if not self.__data:
+            raise ValueError("At least one polarization is required.")
+
+        reference = self.reference
+        for name, rcs_data in self.__data.items():
+            if not (
+                np.array_equal(rcs_data.frequencies, reference.frequencies)
+                and np.array_equal(rcs_data.available_incident_wave_phi, reference.available_incident_wave_phi)
+                and np.array_equal(rcs_data.available_incident_wave_theta, reference.available_incident_wave_theta)
+            ):
+                raise ValueError(f"Axes of polarization '{name}' do not match the axes of '{reference.name}'.")
 
-    @property
-    def isar_3d(self):
-        """ISAR 3D."""
-        df = None
-        if isinstance(self.raw_data, pd.DataFrame):
-            # get the input data
-            freqs = np.array(unit_converter(self.frequencies, "Freq", self.frequency_units, "Hz"))
-            nfreq = len(freqs)
-            az = np.unwrap(np.radians(-self.available_incident_wave_phi))
-            az -= np.mean(az)
-            nphi = len(az)
-            el = np.unwrap(np.radians(90.0 - self.available_incident_wave_theta))
-            el -= np.mean(el)
-            ntheta = len(el)
-            data = self.__raw_data
-
-            # output size
-            ndrng = self.upsample_range
-            nxrng1 = self.upsample_azimuth
-            nxrng2 = self.upsample_elevation
-
-            fxmin = np.min(freqs)
-            fxmax = np.max(freqs)
-            if self.gridsize == "Inside":
-                f_ref = freqs[0]
-            elif self.gridsize == "Outside":
-                f_ref = freqs[-1]
-            else:  # self.gridsize == "Middle" which matches the extents
-                f_ref = freqs[len(freqs) // 2]
-            fymin = np.sin(np.min(az)) * f_ref
-            fymax = np.sin(np.max(az)) * f_ref
-            fzmin = np.sin(np.min(el)) * f_ref
-            fzmax = np.sin(np.max(el)) * f_ref
-
-            fx = np.linspace(fxmin, fxmax, nfreq)  # desired downrange frequencies
-            fy = np.linspace(fymin, fymax, nphi)  # desired crossrange frequencies
-            fz = np.linspace(fzmin, fzmax, ntheta)  # desired crossrange frequencies
-            f_x, f_y, f_z = np.meshgrid(fx, fy, fz, indexing="ij")
+        # Identifier of the stacked data in the product cache, which releases it when this object is collected
+        self.__cache_owner = object()
+        weakref.finalize(self, reference.product_cache.discard, self.__cache_owner)
 
-            # convert to equivalent freq, azimuth, and elevation interpolation points,
-            # so we can use the regular interpolator directly from freqs, az and el
-            fi = np.sqrt(f_x**2 + f_y**2 + f_z**2)
-            azi = np.arctan2(f_y, f_x)
-            with np.errstate(invalid="ignore"):
-                eli = np.arcsin(np.where(fi != 0, -f_z / fi, 0.0))
+    def __len__(self):
+        """Return the number of polarizations."""
+        return len(self.__data)
 
-            interp = RegularGridInterpolator(
-                (freqs, az, el),
-                data.to_numpy().reshape((nfreq, nphi, ntheta)),
-                method=self.interpolation,
-                bounds_error=False,
-                fill_value=None if self.extrapolate else 0.0,
-            )
-            rdata = interp((fi, azi, eli))
-
-            if ndrng < nfreq:
-                # Warning('nx should be at least as large as the length of f -- increasing nx')
-                self.__logger.warning("nx should be at least as large as the number of frequencies.")
-                ndrng = nfreq
-            if nxrng1 < nphi:
-                # warning('ny should be at least as large as the length of az -- increasing ny');
-                self.__logger.warning("ny should be at least as large as the number of azimuth angles.")
-                nxrng1 = nphi
-            if nxrng2 < ntheta:
-                # warning('nz should be at least as large as the length of el -- increasing nz');
-                self.__logger.warning("nz should be at least as large as the number of elevation angles.")
-                nxrng2 = ntheta
-
-            # We want the physical extents of the image to be centered at the global origin, because
-            # that's how we draw the extents of the 3D ISAR domain.
-            # The center of the first pixel in the second half of each domain is centered at zero
-            # if the domain has odd length, but it is at dx/2 otherwise.
-            fft_domain_sizes = ((ndrng, nfreq), (nxrng1, nphi), (nxrng2, ntheta))
-            for islide, fft_domain_size in enumerate(fft_domain_sizes):
-                rdata = MonostaticRCSData.phase_shift(rdata, islide, *fft_domain_size)
-
-            #
-            # add windowing
-            #
-            winx, winx_sum = self.window_function(self.window, nfreq)
-            winy, winy_sum = self.window_function(self.window, nphi)
-            winz, winz_sum = self.window_function(self.window, ntheta)
-            winx = winx.reshape(-1, 1, 1)
-            winy = winy.reshape(1, -1, 1)
-            winz = winz.reshape(1, 1, -1)
-
-            iq = np.zeros((ndrng, nxrng1, nxrng2), dtype=np.complex128)
-            xshift = (ndrng - nfreq) // 2
-            yshift = (nxrng1 - nphi) // 2
-            zshift = (nxrng2 - ntheta) // 2
-            window = winx * winy * winz
-            iq[xshift : xshift + nfreq, yshift : yshift + nphi, zshift : zshift + ntheta] = np.multiply(rdata, window)
-            #
-            # normalize so that unit amplitude scatterers have about unit amplitude in
-            # the image (normalized for the windows).  The "about" comes because of the
-            # truncation of the polar shape into a rectangular shape.
-            #
-            iq = np.fft.fftshift(iq) * ndrng * nxrng1 * nxrng2 / winx_sum / winy_sum / winz_sum
-            isar_image = np.fft.fftshift(np.fft.ifftn(iq))  # Nx x Ny x Nz
-            isar_image = conversion_function(isar_image, self.data_conversion_function)
-            #
-            #  compute the image plane downrange and crossrange distance vectors (in
-            #  meters)
-            #
-            dfx = fx[1] - fx[0]  # difference in x-frequencies
-            dfy = fy[1] - fy[0]  # difference in y-frequencies
-            dfz = fz[1] - fz[0]  # difference in z-frequencies
-            dx = SpeedOfLight / (2 * dfx) / ndrng
-            dy = SpeedOfLight / (2 * dfy) / nxrng1
-            dz = SpeedOfLight / (2 * dfz) / nxrng2
-            x = np.linspace(start=0, stop=ndrng * dx, num=ndrng)
-            y = np.linspace(start=0, stop=nxrng1 * dy, num=nxrng1)
-            z = np.linspace(start=0, stop=nxrng2 * dz, num=nxrng2)
-            #
-            # bring the center of the PHYSICAL image to 0, which means the first pixel on the
-            # second half is not at 0 for even length domains
-            range_values = x - 0.5 * (x[-1] - x[0])
-            cross_range1_values = y - 0.5 * (y[-1] - y[0])
-            cross_range2_values = z - 0.5 * (z[-1] - z[0])
-
-            rr, xr1, xr2 = np.meshgrid(range_values, cross_range1_values, cross_range2_values)
-
-            rr_flat = rr.ravel()
-            xr1_flat = xr1.ravel()
-            xr2_flat = xr2.ravel()
-            isar_image_flat = isar_image.ravel()
-
-            index_names = ["Down-range", "Cross-range-az", "Cross-range-el", "Data"]
-            df = pd.DataFrame(columns=index_names)
-            df["Down-range"] = rr_flat
-            df["Cross-range-az"] = xr1_flat
-            df["Cross-range-el"] = xr2_flat
-            df["Data"] = isar_image_flat
+    def __getitem__(self, name):
+        """Get the data of a polarization."""
+        return self.__data[name]
 
-        return df
+    def __iter__(self):
+        """Iterate over the polarization names."""
+        return iter(self.__data)
 
-    @staticmethod
-    def window_function(window="Flat", size=512):
-        """Apply a window function.
+    @property
+    def polarizations(self):
+        """Polarization names."""
+        return list(self.__data)
 
-        Parameters
-        ----------
-        window : str, default: ``"Flat"``
-            Unnormalized window function. Options are ``"Flat"``, ``"Hamming"``, and ``"Hann"``.
-        size : int, default: ``512``
-            Window size.
+    @property
+    def reference(self):
+        """Data of the first polarization, which provides the axes and the settings.
 
         Returns
         -------
-        tuple
-            Data windowed and data sum.
+        :class:`MonostaticRCSData`
         """
-        if window == "Hann":
-            win = np.hanning(size)
-        elif window == "Hamming":
-            win = np.hamming(size)
-        else:
-            win = np.ones(size)
-        win_sum = np.sum(win)
-        return win, win_sum
+        return next(iter(self.__data.values()))
+
+    @property
+    def solution(self):
+        """Data solution name."""
+        return self.reference.solution
+
+    @property
+    def rcs_cube(self):
+        """Dense complex RCS data of all the polarizations.
+
+        The array has shape ``(number of frequencies, number of phi angles, number of theta angles, number of
+        polarizations)``, and the last axis follows ``polarizations``. It is kept in the ``product_cache`` of the
+        first polarization if it fits in its memory budget, and stacked again on each access otherwise. Treat the
+        result as read-only.
+        """
+        cubes = [rcs_data.rcs_cube for rcs_data in self.__data.values()]
+        key = (self.__cache_owner, "rcs_cube") + tuple(
+            (name, rcs_data.data_version) for name, rcs_data in self.__data.items()
+        )
+        cache = self.reference.product_cache
+        cube = cache.get(key)
+        if cube is None:
+            cube = np.stack(cubes, axis=-1)
+            cube.flags.writeable = False
+            cache.put(key, cube)
+        return cube
 
     @pyaedt_function_handler()
-    def __init_rcs(self):
-        """Load monostatic radar cross-section data.
+    def update_settings(self, **settings):
+        """Update settings of all the polarizations.
+
+        Parameters
+        ----------
+        **settings
+            Values keyed by the name of a :class:`MonostaticRCSData` property, such as ``window``,
+            ``upsample_range``, or ``incident_wave_theta``.
 
         Returns
         -------
         bool
             ``True`` when successful, ``False`` when failed.
         """
-        try:
-            self.__raw_data = pd.read_hdf(self.__monostatic_file, key="df", mode="r")
-        except ImportError as e:  # pragma: no cover
-            self.__logger.error(f"Failed to load monostatic RCS data: {e}")
-            return False
+        for name in settings:
+            if not isinstance(getattr(MonostaticRCSData, name, None), property):
+                self.__logger.error(f"Setting '{name}' is not available.")
+                return False
+        for rcs_data in self.__data.values():
+            for name, value in settings.items():
+                setattr(rcs_data, name, value)
         return True
 
+    @property
+    def range_profile(self):
+        """Range profiles of all the polarizations keyed by polarization name."""
+        return self.__stacked_product("range_profile")
+
+    @property
+    def waterfall(self):
+        """Waterfalls of all the polarizations keyed by polarization name."""
+        return self.__stacked_product("waterfall")
+
+    @property
+    def isar_2d(self):
+        """ISAR 2D images of all the polarizations keyed by polarization name."""
+        return self.__stacked_product("isar_2d")
+
+    @property
+    def isar_3d(self):
+        """ISAR 3D images of all the polarizations keyed by polarization name."""
+        return self.__stacked_product("isar_3d")
+
+    def __stacked_product(self, product):
+        """Compute a product of all the polarizations in one pass."""
+        results = self.reference.stacked_product(product, self.rcs_cube, key=tuple(self.polarizations))
+        if not results:
+            return None
+        return dict(zip(self.polarizations, results))
+
 
 class MonostaticRCSPlotter(object):
     """Provides monostatic RCS plot functionalities.
@@ -899,6 +2935,12 @@ class MonostaticRCSPlotter(object):
     ----------
     rcs_data : :class:`ansys.aedt.toolkits.radar_explorer.rcs_visualization`, default: ``None``
         Monostatic RCS data object.
+    mesh_cache : bool, default: ``True``
+        Whether to keep the model meshes in a binary cache, so that opening the same geometry again does not parse
+        the OBJ files.
+    mesh_cache_directory : str or :class:`pathlib.Path`, default: ``None``
+        Directory of the binary mesh cache. The default is ``None``, in which case a ``meshes`` folder in the cache
+        directory of the user is used.
 
     Examples
     --------
@@ -913,9 +2955,21 @@ class MonostaticRCSPlotter(object):
     >>> rcs_plotter = MonostaticRCSPlotter(rcs_data)
     """
 
-    def __init__(self, rcs_data: MonostaticRCSData | None = None):
+    # Maximum number of projection surfaces and index maps kept in memory
+    __projection_cache_entries = 32
+    # Increase when the decimation of the cached levels of detail changes
+    __lod_cache_version = 1
+    # Increase when the layout of the binary mesh cache changes
+    __mesh_cache_version = 1
+
+    def __init__(self, rcs_data: MonostaticRCSData | None = None, mesh_cache=True, mesh_cache_directory=None):
         # Private
         self.__rcs_data = rcs_data
+        self.__mesh_cache = mesh_cache
+        if mesh_cache_directory is None:
+            mesh_cache_directory = self.__user_cache_directory() / "meshes"
+        self.__mesh_cache_directory = Path(mesh_cache_directory)
+        self.__mesh_cache_max_bytes = 1024**3
         self.__logger = logger
         self.__model_units = "meter"
 
@@ -925,6 +2979,16 @@ class MonostaticRCSPlotter(object):
         self.__x_max, self.__x_min, self.__y_max, self.__y_min, self.__z_max, self.__z_min = 1, -1, 1, -1, 1, -1
         self.__model_info = None
         self.__num_contours = 10
+        self.__projection_threads = 1
+        self.__projection_chunk_size = 262144
+        # Last ISAR 3D mesh stage: settings, image, volume, and contours
+        self.__isar_3d_mesh = None
+        # Projection surfaces and index maps of the model meshes, least recently used first
+        self.__projection_cache = OrderedDict()
+        self.__lod_fractions = (0.1, 0.01)
+        self.__lod_min_cells = 100000
+        # CAD file, scale factor to the model units, and content digest of each model mesh
+        self.__model_files = {}
 
         # Get geometries
         if self.__rcs_data and "model_info" in self.rcs_data.metadata.keys():
@@ -950,6 +3014,38 @@ class MonostaticRCSPlotter(object):
         """Model units."""
         return self.__model_units
 
+    @property
+    def mesh_cache(self):
+        """Flag indicating if the model meshes are kept in a binary cache."""
+        return self.__mesh_cache
+
+    @property
+    def mesh_cache_directory(self):
+        """Directory of the binary mesh cache.
+
+        The cache is shared by all the models of a user. An OBJ file is looked up by its path, size, and modification
+        time. Only when it is not found, the file is hashed, so that the same geometry exported to other folders is
+        read from the cache.
+        """
+        return self.__mesh_cache_directory
+
+    @property
+    def mesh_cache_max_bytes(self):
+        """Maximum number of bytes of the binary mesh cache.
+
+        When the cache grows larger, the least recently used files are removed. The default is 1 GB.
+        """
+        return self.__mesh_cache_max_bytes
+
+    @mesh_cache_max_bytes.setter
+    def mesh_cache_max_bytes(self, value):
+        if isinstance(value, int) and value >= 0:
+            self.__mesh_cache_max_bytes = value
+            if self.mesh_cache:
+                self.__evict_mesh_cache()
+        else:
+            self.__logger.error("Maximum number of bytes of the mesh cache must be a non-negative integer.")
+
     @property
     def all_scene_actors(self):
         """All scene actors."""
@@ -975,6 +3071,34 @@ class MonostaticRCSPlotter(object):
             [abs(a) for a in (self.__x_min, self.__x_max, self.__y_min, self.__y_max, self.__z_min, self.__z_max)]
         )
 
+    @property
+    def lod_fractions(self):
+        """Fractions of the model cells kept by the levels of detail, from the finest to the coarsest."""
+        return self.__lod_fractions
+
+    @lod_fractions.setter
+    def lod_fractions(self, value):
+        try:
+            fractions = tuple(sorted({float(fraction) for fraction in value}, reverse=True))
+        except (TypeError, ValueError):
+            fractions = None
+        if fractions is not None and all(0.0 < fraction < 1.0 for fraction in fractions):
+            self.__lod_fractions = fractions
+        else:
+            self.__logger.error("Level of detail fractions must be between 0 and 1.")
+
+    @property
+    def lod_min_cells(self):
+        """Minimum number of cells of a model mesh to build its levels of detail."""
+        return self.__lod_min_cells
+
+    @lod_min_cells.setter
+    def lod_min_cells(self, value):
+        if isinstance(value, int) and value >= 0:
+            self.__lod_min_cells = value
+        else:
+            self.__logger.error("Minimum number of cells must be a non-negative integer.")
+
     @property
     def num_contours(self) -> int:
         """Number of contours."""
@@ -984,6 +3108,34 @@ class MonostaticRCSPlotter(object):
     def num_contours(self, value):
         self.__num_contours = value
 
+    @property
+    def projection_threads(self):
+        """Number of threads that project the results on the model actors in projection plots.
+
+        Each thread searches the nearest result points of the vertices of one model actor. Range profile
+        projections also query the spatial index of the profile with this number of threads.
+        """
+        return self.__projection_threads
+
+    @projection_threads.setter
+    def projection_threads(self, value):
+        if isinstance(value, int) and value > 0:
+            self.__projection_threads = value
+        else:
+            self.__logger.error("Number of projection threads must be a positive integer.")
+
+    @property
+    def projection_chunk_size(self):
+        """Number of model vertices projected at once in projection plots, which bounds the memory used."""
+        return self.__projection_chunk_size
+
+    @projection_chunk_size.setter
+    def projection_chunk_size(self, value):
+        if isinstance(value, int) and value > 0:
+            self.__projection_chunk_size = value
+        else:
+            self.__logger.error("Projection chunk size must be a positive integer.")
+
     @pyaedt_function_handler()
     def plot_rcs(
         self,
@@ -1034,15 +3186,13 @@ class MonostaticRCSPlotter(object):
             if secondary_sweep == "IWaveTheta":
                 if all_secondary_sweep_value is None:
                     all_secondary_sweep_value = self.rcs_data.incident_wave_theta
-                data = self.rcs_data.rcs_active_phi
-                data["Data"] = conversion_function(data["Data"], self.rcs_data.data_conversion_function)
+                data = self.rcs_data.rcs_active_phi_converted
                 y_key = "IWaveTheta"
 
             else:
                 if all_secondary_sweep_value is None:
                     all_secondary_sweep_value = self.rcs_data.incident_wave_phi
-                data = self.rcs_data.rcs_active_theta
-                data["Data"] = conversion_function(data["Data"], self.rcs_data.data_conversion_function)
+                data = self.rcs_data.rcs_active_theta_converted
 
                 y_key = "IWavePhi"
         else:
@@ -1243,19 +3393,17 @@ class MonostaticRCSPlotter(object):
         """
         data_range_waterfall = self.rcs_data.waterfall
 
-        ranges = np.unique(data_range_waterfall["Range"])
+        ranges = data_range_waterfall.axes["Range"]
         if self.rcs_data.aspect_range == "Horizontal":
-            phis = np.unique(data_range_waterfall["IWavePhi"])
+            phis = data_range_waterfall.axes["IWavePhi"]
             ylabel = "Phi (deg)"
         else:
-            phis = np.unique(data_range_waterfall["IWaveTheta"])
+            phis = data_range_waterfall.axes["IWaveTheta"]
             ylabel = "Theta (deg)"
 
-        phis = np.deg2rad(phis.tolist()) if is_polar else phis
-        n_range = len(ranges)
-        n_phi = len(phis)
-        values = data_range_waterfall["Data"].to_numpy()
-        values = values.reshape((n_range, n_phi), order="F")
+        phis = np.deg2rad(phis) if is_polar else phis
+        # (number of ranges, number of angles)
+        values = data_range_waterfall.data.T
 
         ra, ph = np.meshgrid(ranges, phis)
 
@@ -1318,12 +3466,9 @@ class MonostaticRCSPlotter(object):
         """
         data_isar = self.rcs_data.isar_2d
 
-        ranges = np.unique(data_isar["Down-range"])
-        phis = np.unique(data_isar["Cross-range"])
-
-        n_range = len(ranges)
-        n_phi = len(phis)
-        values = data_isar["Data"].to_numpy().reshape((n_range, n_phi))
+        ranges = data_isar.axes["Down-range"]
+        phis = data_isar.axes["Cross-range"]
+        values = data_isar.data
 
         x, y = np.meshgrid(phis, ranges)  # important, do not use ij here
 
@@ -1389,18 +3534,10 @@ class MonostaticRCSPlotter(object):
 
         data_isar_3d = self.rcs_data.isar_3d
 
-        down_range = data_isar_3d["Down-range"].unique()
-        cross_range_az = data_isar_3d["Cross-range-az"].unique()
-        cross_range_el = data_isar_3d["Cross-range-el"].unique()
-
-        # The above pivot may need to be adjusted depending on the data layout
-        # For now, let's try to reshape the data
-        try:
-            values_3d = data_isar_3d["Data"].to_numpy()
-            values_3d = values_3d.reshape((len(down_range), len(cross_range_az), len(cross_range_el)))
-        except Exception:  # pragma: no cover
-            # fallback: fill with zeros
-            values_3d = np.zeros((len(down_range), len(cross_range_az), len(cross_range_el)))
+        down_range = data_isar_3d.axes["Down-range"]
+        cross_range_az = data_isar_3d.axes["Cross-range-az"]
+        cross_range_el = data_isar_3d.axes["Cross-range-el"]
+        values_3d = data_isar_3d.data
 
         if plane_cut.casefold() == "xy":
             idx_fixed_range = (np.abs(cross_range_el - plane_offset)).argmin()
@@ -2262,17 +4399,18 @@ class MonostaticRCSPlotter(object):
             rotation["azimuth"] = 0
             rotation["elevation"] = 90 - self.rcs_data.incident_wave_theta
             rotation["twist"] = 0
-            angles = np.unique(data_waterfall["IWavePhi"])  # negative azimuth
+            angles = data_waterfall.axes["IWavePhi"]  # negative azimuth
         elif self.rcs_data.aspect_range == "Vertical":
             rotation["azimuth"] = -self.rcs_data.incident_wave_phi
             rotation["elevation"] = 0
             rotation["twist"] = 90
-            angles = np.unique(data_waterfall["IWaveTheta"]) - 90  # negative elevation
+            angles = data_waterfall.axes["IWaveTheta"] - 90  # negative elevation
         else:
             raise ValueError("Plane selection is not supported. Please select 'Horizontal' or 'Vertical'.")
 
-        ranges = np.unique(data_waterfall["Range"])
-        values = data_waterfall["Data"].to_numpy()
+        ranges = data_waterfall.axes["Range"]
+        # Ranges vary fastest, as the structured grid points
+        values = data_waterfall.data.ravel()
 
         angles = np.deg2rad(angles)
 
@@ -2344,9 +4482,9 @@ class MonostaticRCSPlotter(object):
             raise ValueError("Plane selection is not supported. Please select 'Horizontal' or 'Vertical'.")
         data_isar_2d = self.rcs_data.isar_2d
 
-        down_range = data_isar_2d["Down-range"].unique()
-        cross_range = data_isar_2d["Cross-range"].unique()
-        values_2d = data_isar_2d["Data"].to_numpy().reshape((len(down_range), len(cross_range)))
+        down_range = data_isar_2d.axes["Down-range"]
+        cross_range = data_isar_2d.axes["Cross-range"]
+        values_2d = data_isar_2d.data
 
         if plot_type.casefold() in ["relief", "plane"]:
             # meshgrid must have one more pixel. In the other words, number of meshgrid points = number of values + 1
@@ -2407,21 +4545,23 @@ class MonostaticRCSPlotter(object):
             else:  # pragma: no cover
                 v = np.array([0.0, 1.0, 0.0])
             grid_shape = x.shape
-            for model_actor in scene_actors.values():
-                mesh = model_actor.custom_object.get_mesh()
-                target_points = mesh.points
-                all_indices = self.__find_nearest_neighbors(
-                    isar_points, target_points, grid_origin=grid_origin, u=u, v=v, grid_shape=grid_shape
-                )
-
-                mag_for_color = np.ndarray.flatten(cpos[all_indices])
-                if mesh.__class__.__name__ != "PolyData":  # pragma: no cover
-                    mesh_triangulated = mesh.triangulate()
-                    model_actor.custom_object.mesh = pv.PolyData(mesh_triangulated.points, mesh_triangulated.cells)
-                else:
-                    model_actor.custom_object.mesh.clear_data()
-                model_actor.custom_object.mesh[self.rcs_data.data_conversion_function] = mag_for_color
-                actor += model_actor.custom_object.mesh
+            grid_key = ("grid", grid_origin.tobytes(), u.tobytes(), v.tobytes(), grid_shape)
+            projections = self.__project_on_model(
+                scene_actors,
+                grid_key,
+                lambda points: self.__find_nearest_neighbors(
+                    isar_points,
+                    points,
+                    grid_origin=grid_origin,
+                    u=u,
+                    v=v,
+                    grid_shape=grid_shape,
+                    chunk_size=self.projection_chunk_size,
+                ),
+            )
+            for surface, indices in projections:
+                surface[self.rcs_data.data_conversion_function] = cpos[indices]
+                actor += surface
 
         all_results_actors = list(self.all_scene_actors["results"].keys())
 
@@ -2478,9 +4618,9 @@ class MonostaticRCSPlotter(object):
         """
         data_isar_3d = self.rcs_data.isar_3d
 
-        down_range = data_isar_3d["Down-range"].unique()
-        cross_range_az = data_isar_3d["Cross-range-az"].unique()
-        cross_range_el = data_isar_3d["Cross-range-el"].unique()
+        down_range = data_isar_3d.axes["Down-range"]
+        cross_range_az = data_isar_3d.axes["Cross-range-az"]
+        cross_range_el = data_isar_3d.axes["Cross-range-el"]
 
         dx = down_range[1] - down_range[0] if len(down_range) > 1 else 0
         dy = cross_range_az[1] - cross_range_az[0] if len(cross_range_az) > 1 else 0
@@ -2494,17 +4634,9 @@ class MonostaticRCSPlotter(object):
             cross_range_el[0] - dz / 2, cross_range_el[-1] + dz / 2, num=len(cross_range_el) + 1
         )
 
-        # The above pivot may need to be adjusted depending on the data layout
-        # For now, let's try to reshape the data
         # instead of modifying the direction of the down_range grid, we just flip the order of the data
         # isar 3d. down_range now means "x" axis.
-        try:
-            values_3d = data_isar_3d["Data"].to_numpy()
-            values_3d = values_3d.reshape((len(down_range), len(cross_range_az), len(cross_range_el)))
-            values_3d = values_3d[::-1, :, :]  # reverse down_range to match the original data orientation
-        except Exception:  # pragma: no cover
-            # fallback: fill with zeros
-            values_3d = np.zeros((len(down_range), len(cross_range_az), len(cross_range_el)))
+        values_3d = data_isar_3d.data[::-1, :, :]  # reverse down_range to match the original data orientation
 
         all_results_actors = list(self.all_scene_actors["results"].keys())
         if "isar_3d" not in all_results_actors:
@@ -2554,12 +4686,29 @@ class MonostaticRCSPlotter(object):
             else:
                 raise ValueError("Invalid plane cut. Choose 'xy', 'xz', or 'yz'.")
 
-        if plot_type.casefold() != "projection":
-            actor = pv.ImageData(dimensions=shape, spacing=spacing, origin=origin)
-            actor["scalars"] = values_3d.ravel(order="F")
-        else:
+        contours = None
+        mesh_settings = (plot_type.casefold(), plane_cut, plane_offset, self.num_contours)
+        if plot_type.casefold() == "projection":
             # configuration of this actor will happen in the relevant code block
             actor = pv.PolyData()
+        elif (
+            self.__isar_3d_mesh is not None
+            and self.__isar_3d_mesh[0] == mesh_settings
+            and self.__isar_3d_mesh[1] is data_isar_3d
+        ):
+            # Mesh stage: the image is unchanged, so the meshes are reused and only the display settings change
+            actor, contours = (mesh if mesh is None else mesh.copy() for mesh in self.__isar_3d_mesh[2:])
+        else:
+            actor = pv.ImageData(dimensions=shape, spacing=spacing, origin=origin)
+            actor["scalars"] = values_3d.ravel(order="F")
+            if plot_type.casefold() == "iso-surface":
+                contours = actor.contour(isosurfaces=np.linspace(vmin, vmax, self.num_contours))
+            self.__isar_3d_mesh = (
+                mesh_settings,
+                data_isar_3d,
+                actor.copy(),
+                contours if contours is None else contours.copy(),
+            )
 
         isar_object = SceneMeshObject()
         isar_object.name = isar_name
@@ -2569,19 +4718,15 @@ class MonostaticRCSPlotter(object):
         if plot_type.casefold() == "point cloud":
             isar_object.mesh = actor
             isar_object.object_type = SceneMeshObjectType.VOLUME
-            isar_object.opacity = "linear" if "dB" not in self.rcs_data.data_conversion_function else "geom"
+            isar_object.opacity = "linear" if "dB" not in (self.rcs_data.data_conversion_function or "dB10") else "geom"
         elif plot_type.casefold() == "plane cut":
             isar_object.mesh = actor
             isar_object.object_type = SceneMeshObjectType.MESH
             isar_object.opacity = 1.0
         elif plot_type.casefold() == "iso-surface":
-            contour_values = np.linspace(vmin, vmax, self.num_contours)
-
-            contours = actor.contour(isosurfaces=contour_values)
-
             isar_object.mesh = contours
             isar_object.object_type = SceneMeshObjectType.MESH
-            isar_object.opacity = "linear" if "dB" not in self.rcs_data.data_conversion_function else "geom"
+            isar_object.opacity = "linear" if "dB" not in (self.rcs_data.data_conversion_function or "dB10") else "geom"
         else:  # Projection
             scene_actors = self.all_scene_actors["model"]
             if scene_actors is None:  # pragma: no cover
@@ -2610,21 +4755,24 @@ class MonostaticRCSPlotter(object):
             else:  # pragma: no cover
                 w = np.array([0.0, 0.0, 1.0])
             grid_shape = x.shape
-            for model_actor in scene_actors.values():
-                mesh = model_actor.custom_object.get_mesh()
-                target_points = mesh.points
-                all_indices = self.__find_nearest_neighbors(
-                    isar_points, target_points, grid_origin=grid_origin, u=u, v=v, w=w, grid_shape=grid_shape
-                )
-
-                mag_for_color = np.ndarray.flatten(cpos[all_indices])
-                if mesh.__class__.__name__ != "PolyData":  # pragma: no cover
-                    mesh_triangulated = mesh.triangulate()
-                    model_actor.custom_object.mesh = pv.PolyData(mesh_triangulated.points, mesh_triangulated.cells)
-                else:
-                    model_actor.custom_object.mesh.clear_data()
-                model_actor.custom_object.mesh[self.rcs_data.data_conversion_function] = mag_for_color
-                actor += model_actor.custom_object.mesh
+            grid_key = ("grid", grid_origin.tobytes(), u.tobytes(), v.tobytes(), w.tobytes(), grid_shape)
+            projections = self.__project_on_model(
+                scene_actors,
+                grid_key,
+                lambda points: self.__find_nearest_neighbors(
+                    isar_points,
+                    points,
+                    grid_origin=grid_origin,
+                    u=u,
+                    v=v,
+                    w=w,
+                    grid_shape=grid_shape,
+                    chunk_size=self.projection_chunk_size,
+                ),
+            )
+            for surface, indices in projections:
+                surface[self.rcs_data.data_conversion_function] = cpos[indices]
+                actor += surface
             isar_object.mesh = actor
             isar_object.object_type = SceneMeshObjectType.MESH
             isar_object.opacity = 1.0
@@ -3037,19 +5185,22 @@ class MonostaticRCSPlotter(object):
             if scene_actors is None:  # pragma: no cover
                 return None
             actor = pv.PolyData()
-            for model_actor in scene_actors.values():
-                mesh = model_actor.custom_object.get_mesh()
-                xypoints = mesh.points
-                xpos_ypos = np.column_stack((xpos, ypos, plot_data))
-                all_indices = self.__find_nearest_neighbors(xpos_ypos, xypoints)
-                mag_for_color = np.ndarray.flatten(cpos[all_indices])
-                if not mesh.__class__.__name__ == "PolyData":  # pragma: no cover
-                    mesh_triangulated = mesh.triangulate()
-                    model_actor.custom_object.mesh = pv.PolyData(mesh_triangulated.points, mesh_triangulated.cells)
-                else:
-                    model_actor.custom_object.mesh.clear_data()
-                model_actor.custom_object.mesh[data_conversion_function] = mag_for_color
-                actor += model_actor.custom_object.mesh
+            profile_points = np.ascontiguousarray(np.column_stack((xpos, ypos, plot_data)), dtype=float)
+            profile_tree = None
+
+            def find(points):
+                # The spatial index of the profile is built once and shared by all the model actors
+                nonlocal profile_tree
+                if profile_tree is None:
+                    profile_tree = cKDTree(profile_points)
+                return self.__find_nearest_neighbors(
+                    profile_tree, points, chunk_size=self.projection_chunk_size, workers=self.projection_threads
+                )
+
+            grid_key = ("profile", hashlib.sha1(profile_points.tobytes()).hexdigest())
+            for surface, indices in self.__project_on_model(scene_actors, grid_key, find):
+                surface[data_conversion_function] = cpos[indices]
+                actor += surface
         else:  # pragma: no cover
             raise ValueError(f"Invalid plot type: {plot_type}.")
         return actor
@@ -3086,18 +5237,98 @@ class MonostaticRCSPlotter(object):
         """
         return (data - data.min()) / (data.max() - data.min()) * scaling_factor + offset
 
+    def __project_on_model(self, scene_actors, grid_key, find):
+        """Find the nearest result points of the vertices of each model actor.
+
+        The index maps are cached by model mesh and result grid, so that projecting other results on the same grid
+        only gathers their values. The model actors without a cached index map are processed in
+        ``projection_threads`` threads.
+
+        Parameters
+        ----------
+        scene_actors : dict
+            Model actors.
+        grid_key : tuple
+            Hashable description of the result points, such as the origin, basis vectors, and shape of their grid.
+        find : callable
+            Function returning the indices of the nearest result points of an array of vertices.
+
+        Returns
+        -------
+        list
+            Surface to color and indices of the nearest result points of each model actor. The surface is a
+            shallow copy of the triangulated model mesh without data arrays.
+        """
+        meshes = [model_actor.custom_object.get_mesh() for model_actor in scene_actors.values()]
+        surfaces = [
+            self.__projection_entry(mesh, None, lambda mesh=mesh: self.__projection_surface(mesh)) for mesh in meshes
+        ]
+        indices = [self.__projection_entry(mesh, grid_key) for mesh in meshes]
+        missing = [i for i, value in enumerate(indices) if value is None]
+        points = [np.asarray(surfaces[i].points) for i in missing]
+        if self.projection_threads > 1 and len(points) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.projection_threads, len(points))) as executor:
+                found = list(executor.map(find, points))
+        else:
+            found = [find(vertices) for vertices in points]
+        for i, value in zip(missing, found):
+            value.flags.writeable = False
+            indices[i] = self.__projection_entry(meshes[i], grid_key, lambda value=value: value)
+        return [(surface.copy(deep=False), value) for surface, value in zip(surfaces, indices)]
+
+    def __projection_entry(self, mesh, grid_key, compute=None):
+        """Get a projection cache entry of a model mesh, computing it when missing.
+
+        The entries are keyed by the identity and modification time of the mesh, so that editing the mesh
+        invalidates them. ``grid_key=None`` holds the projection surface of the mesh.
+        """
+        key = (id(mesh), mesh.GetMTime(), grid_key)
+        entry = self.__projection_cache.get(key)
+        if entry is not None and entry[0] is mesh:
+            self.__projection_cache.move_to_end(key)
+            return entry[1]
+        if compute is None:
+            return None
+        value = compute()
+        # The mesh is kept with the entry, so its identity is not reused while it is cached
+        self.__projection_cache[key] = (mesh, value)
+        while len(self.__projection_cache) > self.__projection_cache_entries:
+            self.__projection_cache.popitem(last=False)
+        return value
+
+    @staticmethod
+    def __projection_surface(mesh):
+        """Get the triangulated surface of a model mesh without its data arrays."""
+        if mesh.__class__.__name__ != "PolyData":  # pragma: no cover
+            mesh_triangulated = mesh.triangulate()
+            return pv.PolyData(mesh_triangulated.points, mesh_triangulated.cells)
+        surface = mesh.copy(deep=False)
+        surface.clear_data()
+        return surface
+
     @staticmethod
-    def __find_nearest_neighbors(orig_points, target_points, grid_origin=None, u=None, v=None, w=None, grid_shape=None):
+    def __find_nearest_neighbors(
+        orig_points,
+        target_points,
+        grid_origin=None,
+        u=None,
+        v=None,
+        w=None,
+        grid_shape=None,
+        chunk_size=262144,
+        workers=1,
+    ):
         """
         Fast nearest neighbor search for points on a 2D or 3D grid in 3D, using grid geometry.
 
         If grid_origin, u, v, (optionally w), and grid_shape are provided, uses projection-based search.
-        Otherwise, falls back to brute-force search.
+        Otherwise, falls back to a k-d tree search. The target points are processed in chunks.
 
         Parameters
         ----------
-        orig_points : numpy.ndarray
-            Array of shape (n, 3) representing the original grid points (x, y, z).
+        orig_points : numpy.ndarray or scipy.spatial.cKDTree
+            Array of shape (n, 3) representing the original grid points (x, y, z), or a k-d tree built
+            from them so that it is reused across searches.
         target_points : numpy.ndarray
             Array of shape (m, 3) representing the target points (x, y, z).
         grid_origin : numpy.ndarray, default: ``None``
@@ -3110,6 +5341,10 @@ class MonostaticRCSPlotter(object):
             3D basis vector for grid axis 2 (shape (3,)), for 3D grids.
         grid_shape : tuple, default: ``None``
             (n_i, n_j) or (n_i, n_j, n_k) shape of the grid.
+        chunk_size : int, default: ``262144``
+            Number of target points processed at once.
+        workers : int, default: ``1``
+            Number of threads that query the k-d tree.
 
         Returns
         -------
@@ -3118,45 +5353,34 @@ class MonostaticRCSPlotter(object):
             nearest neighbors in the ``orig_points`` parameter
             for each target point.
         """
+        target_points = np.asarray(target_points, dtype=float)
+        indices = np.empty(len(target_points), dtype=int)
         if grid_origin is not None and u is not None and v is not None and grid_shape is not None:
             if w is not None and len(grid_shape) == 3:
                 # 3D grid
-                u_ = np.column_stack((u, v, w))  # 3x3
-                u_pinv = np.linalg.pinv(u_)  # 3x3
-                n_i, n_j, n_k = grid_shape
-                indices = []
-                for p in target_points:
-                    ijk = u_pinv @ (p - grid_origin)
-                    i, j, k = np.round(ijk).astype(int)
-                    i = i % n_i
-                    j = j % n_j
-                    k = k % n_k
-                    idx = i * (n_j * n_k) + j * n_k + k  # flatten index
-                    indices.append(idx)
-                return np.array(indices)
+                u_pinv = np.linalg.pinv(np.column_stack((u, v, w)))  # 3x3
+                n = None
             else:
-                # 2D grid (original logic)
+                # 2D grid, the points are projected onto the grid plane
                 n = np.cross(u, v)
                 n = n / np.linalg.norm(n)
-                u_ = np.column_stack((u, v))  # 3x2
-                u_pinv = np.linalg.pinv(u_)  # 2x3
-                n_i, n_j = grid_shape
-                indices = []
-                for p in target_points:
-                    # Project onto grid plane
-                    p_proj = p - np.dot(p - grid_origin, n) * n
-                    # Get (i, j) coordinates
-                    ij = u_pinv @ (p_proj - grid_origin)
-                    i, j = np.round(ij).astype(int)
-                    i = i % n_i
-                    j = j % n_j
-                    idx = i * n_j + j  # flatten index
-                    indices.append(idx)
-                return np.array(indices)
-        else:  # pragma: no cover
-            # Fallback: brute-force search
-            distances = ((orig_points[:, np.newaxis] - target_points) ** 2).sum(axis=2)
-            return np.argmin(distances, axis=0)
+                u_pinv = np.linalg.pinv(np.column_stack((u, v)))  # 2x3
+                grid_shape = tuple(grid_shape[:2])
+            for start in range(0, len(target_points), chunk_size):
+                offsets = target_points[start : start + chunk_size] - grid_origin
+                if n is not None:
+                    offsets -= np.outer(offsets @ n, n)
+                # Grid coordinates of all the points of the chunk, wrapped into the grid
+                coordinates = np.round(offsets @ u_pinv.T).astype(int) % np.asarray(grid_shape)
+                indices[start : start + chunk_size] = np.ravel_multi_index(coordinates.T, grid_shape)
+        else:
+            # Fallback: k-d tree search
+            tree = orig_points if isinstance(orig_points, cKDTree) else cKDTree(np.asarray(orig_points, dtype=float))
+            for start in range(0, len(target_points), chunk_size):
+                _, indices[start : start + chunk_size] = tree.query(
+                    target_points[start : start + chunk_size], workers=workers
+                )
+        return indices
 
     @staticmethod
     def __add_mesh(mesh_object, plotter, mesh_type="results"):
@@ -3206,12 +5430,20 @@ class MonostaticRCSPlotter(object):
     @pyaedt_function_handler()
     @graphics_required
     def __get_geometry(self):
-        """Get 3D meshes."""
+        """Get 3D meshes.
+
+        The OBJ files are read in parallel threads, and their meshes are scaled to the units of the first model.
+        """
         model_info = self.model_info
 
         obj_meshes = {}
         first_value = next(iter(model_info.values()))
         self.__model_units = first_value[3]
+        try:
+            model_conv = AEDT_UNITS["Length"][self.__model_units]
+        except Exception:  # pragma: no cover
+            model_conv = 1
+        cad_objects = []
         for object_in in model_info.values():
             relative_cad_path, color, opacity, units = object_in
             relative_path = Path(relative_cad_path)
@@ -3219,28 +5451,217 @@ class MonostaticRCSPlotter(object):
             relative_path = Path("geometry") / relative_path
             cad_path = Path(self.rcs_data.output_dir) / relative_path
             try:
-                conv = AEDT_UNITS["Length"][units]
+                conv = AEDT_UNITS["Length"][units] / model_conv
             except Exception:  # pragma: no cover
                 conv = 1
-            if cad_path.exists():
-                mesh = pv.read(str(cad_path))
-                mesh.scale(conv)
-            else:  # pragma: no cover
+            if not cad_path.exists():  # pragma: no cover
                 self.__logger.warning(f"{cad_path} does not exist.")
                 return False
+            cad_objects.append((name, cad_path, conv, color, opacity))
 
+        with ThreadPoolExecutor(max_workers=max(1, min(len(cad_objects), os.cpu_count() or 1))) as executor:
+            meshes = list(executor.map(lambda cad_object: self.__read_cad_mesh(*cad_object[1:3]), cad_objects))
+        if self.mesh_cache:
+            self.__evict_mesh_cache()
+
+        for (name, cad_path, conv, color, opacity), (mesh, digest) in zip(cad_objects, meshes):
+            self.__model_files[name] = (cad_path, conv, digest)
             color_cad = [i / 255 for i in color]
             model_object = SceneMeshObject()
             model_object.color = color_cad
             model_object.opacity = opacity
             model_object.name = name
             model_object.mesh = mesh
+            # The levels of detail are built when a scene first needs them
+            model_object.lod_loader = partial(self.__model_lod_meshes, name)
 
             mesh_object = MeshObjectPlot(model_object, model_object.get_mesh())
             obj_meshes[model_object.name] = mesh_object
 
         return obj_meshes
 
+    def __read_cad_mesh(self, cad_path, conv):
+        """Read the scaled mesh of an OBJ file from the binary mesh cache, parsing the OBJ file if it is not cached.
+
+        Returns
+        -------
+        tuple
+            Mesh and SHA-256 digest of the OBJ file, which is ``None`` if the mesh cache is disabled.
+        """
+        if not self.mesh_cache:
+            return self.__parse_cad_mesh(cad_path, conv), None
+
+        # Cheap lookup of the content digest by path, size, and modification time
+        stat = cad_path.stat()
+        source = {"path": str(cad_path.resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "scale": conv}
+        key = hashlib.sha256(json.dumps(source, sort_keys=True).encode("utf-8")).hexdigest()
+        index_file = self.mesh_cache_directory / f"{key}_v{self.__mesh_cache_version}.json"
+        digest = None
+        try:
+            with index_file.open("r") as file:
+                index = json.load(file)
+            if index["source"] == source:
+                digest = index["digest"]
+                os.utime(index_file)
+        except (OSError, ValueError, KeyError, TypeError):
+            digest = None
+
+        if digest is None:
+            # The content is only hashed when the file is not indexed, to find the same geometry in other folders
+            content = hashlib.sha256()
+            with cad_path.open("rb") as file:
+                for block in iter(lambda: file.read(1 << 20), b""):
+                    content.update(block)
+            digest = content.hexdigest()
+            self.__write_mesh_cache_file(
+                index_file, lambda name: Path(name).write_text(json.dumps({"source": source, "digest": digest}))
+            )
+
+        mesh_file = self.mesh_cache_directory / f"{digest}_{conv:g}_v{self.__mesh_cache_version}.vtp"
+        mesh_source = json.dumps({"digest": digest, "scale": conv}, sort_keys=True)
+        mesh = self.__read_cached_mesh(mesh_file, "mesh_source", mesh_source)
+        if mesh is None:
+            mesh = self.__parse_cad_mesh(cad_path, conv)
+            self.__write_cached_mesh(mesh, mesh_file, "mesh_source", mesh_source)
+        return mesh, digest
+
+    @staticmethod
+    def __parse_cad_mesh(cad_path, conv):
+        """Parse an OBJ file and scale its mesh."""
+        mesh = pv.read(str(cad_path))
+        if conv != 1:
+            mesh.scale(conv, inplace=True)
+        return mesh
+
+    @staticmethod
+    def __user_cache_directory():
+        """Get the cache directory of the user."""
+        if platformdirs is not None:
+            return Path(platformdirs.user_cache_dir("radar_explorer", "Ansys"))
+        return Path.home() / ".cache" / "radar_explorer"  # pragma: no cover
+
+    def __read_cached_mesh(self, cache_file, field_name, source):
+        """Read a mesh from the binary mesh cache if its source matches.
+
+        The source is stored in the field data of the cached mesh, so a file that does not belong to the source is
+        not used. The file is touched, so that the least recently used files are removed first.
+
+        Returns
+        -------
+        :class:`pyvista.PolyData` or None
+            Mesh, or ``None`` if the file is missing or invalid.
+        """
+        if not cache_file.is_file():
+            return None
+        try:
+            mesh = pv.read(str(cache_file))
+            if field_name not in mesh.field_data or str(mesh.field_data[field_name][0]) != source:
+                raise ValueError("The source does not match.")
+            del mesh.field_data[field_name]
+            os.utime(cache_file)
+        except Exception:
+            self.__logger.warning(f"{cache_file} is invalid.")
+            return None
+        return mesh
+
+    def __write_cached_mesh(self, mesh, cache_file, field_name, source):
+        """Write a mesh to the binary mesh cache with its source."""
+        cached_mesh = mesh.copy(deep=False)
+        cached_mesh.field_data[field_name] = [source]
+        return self.__write_mesh_cache_file(cache_file, lambda name: cached_mesh.save(name, compression=None))
+
+    def __write_mesh_cache_file(self, cache_file, write):
+        """Write a file of the binary mesh cache.
+
+        Other plotters can cache the same file at the same time, so each one writes its own temporary file and
+        replaces the cache file atomically.
+        """
+        temporary_file = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            handle, temporary_file = tempfile.mkstemp(suffix=cache_file.suffix, prefix=".tmp_", dir=cache_file.parent)
+            os.close(handle)
+            write(temporary_file)
+            Path(temporary_file).replace(cache_file)
+        except OSError as e:
+            self.__logger.warning(f"{cache_file} cannot be written: {e}")
+            if temporary_file:
+                Path(temporary_file).unlink(missing_ok=True)
+            return False
+        return True
+
+    def __evict_mesh_cache(self):
+        """Remove the least recently used files of the binary mesh cache until it fits in its memory budget."""
+        try:
+            files = [
+                (file.stat(), file)
+                for file in self.mesh_cache_directory.iterdir()
+                if file.is_file() and not file.name.startswith(".tmp_")
+            ]
+        except OSError:
+            return
+        nbytes = sum(stat.st_size for stat, _ in files)
+        for stat, file in sorted(files, key=lambda item: item[0].st_mtime_ns):
+            if nbytes <= self.mesh_cache_max_bytes:
+                break
+            try:
+                file.unlink()
+                nbytes -= stat.st_size
+            except OSError:  # pragma: no cover
+                pass
+
+    @pyaedt_function_handler()
+    @graphics_required
+    def build_lod_meshes(self):
+        """Build the decimated levels of detail of the model meshes.
+
+        A level of detail keeps a ``lod_fractions`` fraction of the cells of a model mesh. Levels are built for the
+        meshes with at least ``lod_min_cells`` cells and are kept in the binary mesh cache, so that each model is
+        decimated once. The levels are stored in the ``lod_meshes`` attribute of the model objects, which 3D scenes
+        use to render large models within a facet budget.
+
+        The levels are otherwise built when a scene first needs them. Use this method to build them in advance, or
+        to build them again after changing ``lod_fractions`` or ``lod_min_cells``.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+        """
+        for name in self.__model_files:
+            self.all_scene_actors["model"][name].custom_object.lod_meshes = self.__model_lod_meshes(name)
+        return True
+
+    def __model_lod_meshes(self, name):
+        """Get the levels of detail of a model mesh from the binary mesh cache or decimate the mesh."""
+        _, conv, digest = self.__model_files[name]
+        mesh = self.all_scene_actors["model"][name].custom_object.mesh
+        lod_meshes = []
+        if mesh.n_cells >= self.lod_min_cells:
+            for fraction in self.lod_fractions:
+                lod_mesh = self.__get_lod_mesh(mesh, digest, conv, fraction)
+                # Levels that do not reduce the previous one are useless
+                if 0 < lod_mesh.n_cells < (lod_meshes[-1] if lod_meshes else mesh).n_cells:
+                    lod_meshes.append(lod_mesh)
+            if digest is not None:
+                self.__evict_mesh_cache()
+        return lod_meshes
+
+    def __get_lod_mesh(self, mesh, digest, conv, fraction):
+        """Get a level of detail of a model mesh from the binary mesh cache, decimating the mesh if it is not cached.
+
+        Without a digest, the mesh cache is disabled and the mesh is decimated.
+        """
+        if digest is None:
+            return mesh.triangulate().decimate(1.0 - fraction)
+        lod_file = self.mesh_cache_directory / f"{digest}_{conv:g}_lod{fraction:g}_v{self.__lod_cache_version}.vtp"
+        source = json.dumps({"digest": digest, "scale": conv, "fraction": fraction}, sort_keys=True)
+        lod_mesh = self.__read_cached_mesh(lod_file, "lod_source", source)
+        if lod_mesh is None:
+            lod_mesh = mesh.triangulate().decimate(1.0 - fraction)
+            self.__write_cached_mesh(lod_mesh, lod_file, "lod_source", source)
+        return lod_mesh
+
     @staticmethod
     def rotate_point(x1, y1, z1, rotation):
         """
@@ -3369,6 +5790,8 @@ class SceneMeshObject:
         self.show = True
         self.object_type = SceneMeshObjectType.MESH
         self.clim = None
+        # Callable that builds the decimated meshes the first time they are needed
+        self.lod_loader = None
 
         # Private
         self.__mesh = pv.Cube()
@@ -3378,12 +5801,29 @@ class SceneMeshObject:
         self.__default_clim = None
         self.__plot_type = None
         self.__default_mesh = self.mesh
+        self.__lod_meshes = None
+        self.__lod_lock = threading.Lock()
 
     @property
     def mesh(self):
         """Get the mesh object."""
         return self.__mesh
 
+    @property
+    def lod_meshes(self):
+        """Decimated meshes from the finest to the coarsest.
+
+        They are built with ``lod_loader`` on first access, which can happen in a background thread.
+        """
+        with self.__lod_lock:
+            if self.__lod_meshes is None:
+                self.__lod_meshes = self.lod_loader() if self.lod_loader else []
+            return self.__lod_meshes
+
+    @lod_meshes.setter
+    def lod_meshes(self, val):
+        self.__lod_meshes = list(val)
+
     @mesh.setter
     def mesh(self, val):
         self.__mesh = val
@@ -3469,6 +5909,27 @@ class SceneMeshObject:
         """
         return self.mesh
 
+    def get_lod_mesh(self, max_cells=None):
+        """Retrieve the finest level of detail of the mesh within a number of cells.
+
+        Parameters
+        ----------
+        max_cells : int, default: ``None``
+            Maximum number of cells. The default is ``None``, in which case the full mesh is retrieved.
+
+        Returns
+        -------
+        pyvista.PolyData or pyvista.UnstructuredGrid
+            Full mesh or decimated mesh. The coarsest level is retrieved when none is within the number of cells.
+        """
+        # The levels of detail are only built if the full mesh has too many cells
+        if max_cells is None or self.mesh.n_cells <= max_cells or not self.lod_meshes:
+            return self.mesh
+        for lod_mesh in self.lod_meshes:
+            if lod_mesh.n_cells <= max_cells:
+                return lod_mesh
+        return self.lod_meshes[-1]
+
     def get_model_options(self):
         """Retrieve the visualization options for the mesh.
 
@@ -3519,3 +5980,153 @@ class SceneMeshObject:
                 options["color"] = self.color
 
         return options
+
+
+class SceneLODSwitcher(object):
+    """Renders coarser levels of detail of the model meshes of a 3D scene while it is rotated.
+
+    The facet budgets are shared among the models in proportion to their number of facets. The interactive meshes
+    are built in a background thread when the scene is plotted, and the idle meshes are kept while they are not
+    ready, so that the first rotation does not wait for the decimation.
+
+    Parameters
+    ----------
+    facet_budget : int, default: ``2000000``
+        Number of model facets rendered when the scene is idle.
+    interactive_facet_budget : int, default: ``200000``
+        Number of model facets rendered while the scene is rotated.
+
+    Examples
+    --------
+    >>> from ansys.aedt.toolkits.radar_explorer.rcs_visualization import SceneLODSwitcher
+    >>> switcher = SceneLODSwitcher(interactive_facet_budget=100000)
+    >>> idle_ratio, interactive_ratio = switcher.ratios(5000000)
+    """
+
+    def __init__(self, facet_budget=2000000, interactive_facet_budget=200000):
+        # Public
+        self.facet_budget = facet_budget
+        self.interactive_facet_budget = interactive_facet_budget
+
+        # Private
+        self.__executor = None
+        # Actors with their idle mesh and the future of their interactive mesh
+        self.__actors = []
+        self.__swapped = []
+
+    def __len__(self):
+        """Get the number of actors with an interactive mesh."""
+        return len(self.__actors)
+
+    def ratios(self, facets):
+        """Get the fractions of the facets rendered when idle and while rotating.
+
+        Parameters
+        ----------
+        facets : int
+            Number of facets of the visible models.
+
+        Returns
+        -------
+        tuple
+            Idle and interactive fractions.
+        """
+        if not facets:
+            return 1.0, 1.0
+        return min(1.0, self.facet_budget / facets), min(1.0, self.interactive_facet_budget / facets)
+
+    def add(self, actor, model_object, idle_mesh, interactive_cells, transform=None):
+        """Add a model actor and start building its interactive mesh in the background.
+
+        Parameters
+        ----------
+        actor : object
+            Rendered actor, whose ``mapper.dataset`` is swapped.
+        model_object : :class:`SceneMeshObject`
+            Model object of the actor.
+        idle_mesh : pyvista.PolyData
+            Mesh rendered when the scene is idle.
+        interactive_cells : int
+            Maximum number of cells of the interactive mesh.
+        transform : numpy.ndarray, default: ``None``
+            Transformation matrix applied to the interactive mesh.
+
+        Returns
+        -------
+        bool
+            ``True`` when the actor has an interactive mesh, ``False`` when the idle mesh is within the budget.
+        """
+        if interactive_cells >= idle_mesh.n_cells:
+            return False
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(max_workers=1)
+        future = self.__executor.submit(self.__interactive_mesh, model_object, interactive_cells, idle_mesh, transform)
+        self.__actors.append((actor, idle_mesh, future))
+        return True
+
+    def start_interaction(self):
+        """Render the interactive meshes that are ready.
+
+        Returns
+        -------
+        bool
+            ``True`` when a mesh is swapped, ``False`` otherwise.
+        """
+        swapped = []
+        for actor, idle_mesh, future in self.__actors:
+            if not future.done() or future.cancelled() or future.exception() is not None:
+                continue
+            interactive_mesh = future.result()
+            if interactive_mesh is not idle_mesh:
+                actor.mapper.dataset = interactive_mesh
+                swapped.append((actor, idle_mesh))
+        self.__swapped = swapped
+        return bool(swapped)
+
+    def end_interaction(self):
+        """Render the idle meshes again.
+
+        Returns
+        -------
+        bool
+            ``True`` when a mesh is swapped back, ``False`` otherwise.
+        """
+        swapped = bool(self.__swapped)
+        for actor, idle_mesh in self.__swapped:
+            actor.mapper.dataset = idle_mesh
+        self.__swapped = []
+        return swapped
+
+    def wait(self, timeout=None):
+        """Wait until the interactive meshes are built.
+
+        Parameters
+        ----------
+        timeout : float, default: ``None``
+            Maximum time in seconds. The default is ``None``, in which case there is no limit.
+
+        Returns
+        -------
+        bool
+            ``True`` when all the meshes are built, ``False`` otherwise.
+        """
+        futures = [future for _, _, future in self.__actors]
+        return not wait(futures, timeout=timeout).not_done
+
+    def clear(self):
+        """Remove all the actors and cancel the interactive meshes that are not started."""
+        self.end_interaction()
+        for _, _, future in self.__actors:
+            future.cancel()
+        self.__actors = []
+
+    @staticmethod
+    def __interactive_mesh(model_object, max_cells, idle_mesh, transform):
+        """Build the transformed interactive mesh of a model object, which is the idle mesh if it is not coarser."""
+        mesh = model_object.get_lod_mesh(max_cells)
+        if mesh.n_cells >= idle_mesh.n_cells:
+            return idle_mesh
+        mesh = mesh.copy()
+        if transform is not None:
+            mesh.transform(transform, inplace=True)
+        return mesh
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+#
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+import multiprocessing
+import sys
+
+from ansys.aedt.toolkits.radar_explorer.rcs_library import LIBRARY_PRODUCTS
+from ansys.aedt.toolkits.radar_explorer.rcs_library import export_rcs_library
+
+
+def main(argv=None):
+    """Export a range-profile and ISAR library from the command line.
+
+    Parameters
+    ----------
+    argv : list, optional
+        Command line arguments. The default is ``None``, in which case ``sys.argv`` is used.
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(
+        description="Export the range profiles and ISAR images of all the aspects of a monostatic RCS simulation."
+    )
+    parser.add_argument("input_file", help="Metadata JSON file of the monostatic RCS data.")
+    parser.add_argument("output_file", help="HDF5 library file.")
+    parser.add_argument("--products", nargs="+", choices=LIBRARY_PRODUCTS, default=list(LIBRARY_PRODUCTS))
+    parser.add_argument(
+        "--settings", default="{}", help='JSON object of data settings, for example \'{"window": "Hann"}\'.'
+    )
+    parser.add_argument("--block-size", type=int, default=8, help="Aspects computed per task.")
+    parser.add_argument("--processes", type=int, default=None, help="Number of worker processes.")
+    parser.add_argument("--complevel", type=int, default=5, help="Compression level from 0 to 9.")
+    parser.add_argument("--restart", action="store_true", help="Overwrite the library instead of resuming it.")
+    args = parser.parse_args(argv)
+
+    report = export_rcs_library(
+        args.input_file,
+        args.output_file,
+        products=tuple(args.products),
+        settings=json.loads(args.settings),
+        block_size=args.block_size,
+        processes=args.processes,
+        complevel=args.complevel,
+        resume=not args.restart,
+    )
+    if not report:
+        return 1
+    for product, values in report.items():
+        print(
+            f"{product}: {values['images']} images in {values['seconds']:.2f} s "
+            f"({values['images_per_second']:.1f} images/s)"
+        )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -23,6 +23,7 @@ from PySide6.QtWidgets import QWidget
 from scipy.spatial.transform import Rotation as Rot
 
 from ansys.aedt.core.generic.numbers_utils import Quantity
+from ansys.aedt.toolkits.radar_explorer.rcs_visualization import SceneLODSwitcher
 from ansys.aedt.toolkits.radar_explorer.rcs_visualization import SceneMeshObjectType
 from ansys.aedt.toolkits.radar_explorer.ui.models import properties
 from ansys.tools.visualization_interface import Plotter
@@ -52,6 +53,10 @@ class Common3DPlotter(object):
         self.plotter = None
 
         self.window_placeholders = {}
+
+        # Model meshes rendered when idle and while rotating the scene, within their facet budgets
+        self.lod_switcher = SceneLODSwitcher(facet_budget=2000000, interactive_facet_budget=200000)
+
         self.initialize_plotter()
 
         self.rotation_active = True
@@ -75,6 +80,10 @@ class Common3DPlotter(object):
             # Disable 'q' key for exiting modeler
             self.plotter.iren.clear_events_for_key("q")
 
+            # Render coarse models while rotating and full models when idle
+            self.plotter.iren.add_observer("StartInteractionEvent", self.start_interaction)
+            self.plotter.iren.add_observer("EndInteractionEvent", self.end_interaction)
+
             self.plotter.set_background(color=self.app_color["bg_one"])
 
             # Default view
@@ -106,6 +115,14 @@ class Common3DPlotter(object):
         self.window_actors = []
         self.pv_backend.enable_widgets(dark_mode=self.dark_mode)
 
+    def start_interaction(self, *args):
+        # Interactive meshes that are still being built keep their idle mesh
+        self.lod_switcher.start_interaction()
+
+    def end_interaction(self, *args):
+        if self.lod_switcher.end_interaction():
+            self.plotter.render()
+
     def reparent_to_placeholder(self, window_name):
         if window_name in self.window_placeholders:
             placeholder = self.window_placeholders[window_name]
@@ -146,13 +163,21 @@ class Common3DPlotter(object):
 
         model = properties.radar_explorer.all_scene_actors["model"]
 
+        # The facet budgets are shared among the visible models in proportion to their facets
+        self.lod_switcher.clear()
+        facets = sum(actor.get_mesh().n_cells for scene in model.values() for actor in scene.values() if actor.show)
+        idle_ratio, interactive_ratio = self.lod_switcher.ratios(facets)
+
         for scene in model.values():
             for actor in scene.values():
                 options = actor.get_model_options() or {}
                 if actor.show:
                     try:
+                        n_cells = actor.get_mesh().n_cells
+                        idle_mesh = actor.get_lod_mesh(int(n_cells * idle_ratio))
+
                         # Apply transformation to actor's mesh
-                        transformed_mesh = actor.get_mesh().copy()
+                        transformed_mesh = idle_mesh.copy()
                         transformed_mesh.transform(t, inplace=True)  # Apply transformation
 
                         # Add the transformed mesh to the plotter
@@ -160,6 +185,9 @@ class Common3DPlotter(object):
                         actor.actor = actor_vtk
                         self.add_actor(actor_vtk)
 
+                        # The interactive mesh is built in the background
+                        self.lod_switcher.add(actor_vtk, actor, transformed_mesh, int(n_cells * interactive_ratio), t)
+
                     except Exception as e:  # pragma: no cover
                         print(f"Failed to add mesh for actor {actor.name}: {e}")
 
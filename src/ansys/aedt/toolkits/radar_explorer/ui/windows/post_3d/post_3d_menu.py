@@ -28,6 +28,7 @@ from ansys.aedt.core.generic.numbers_utils import Quantity
 from scipy.interpolate import RegularGridInterpolator
 from ansys.aedt.toolkits.radar_explorer.backend.rcs_utils.utils import unit_converter_rcs
 from ansys.aedt.toolkits.common.ui.utils.widgets import PyIconButton
+from ansys.aedt.toolkits.radar_explorer.rcs_visualization import MonostaticRCSData
 from ansys.aedt.toolkits.radar_explorer.rcs_visualization import MonostaticRCSPlotter
 from ansys.aedt.toolkits.radar_explorer.ui.models import properties
 from ansys.aedt.toolkits.radar_explorer.ui.windows.post_3d.post_3d_column import Ui_LeftColumn
@@ -54,6 +55,8 @@ class Plot3DThread(QThread):
         plot_type = self.main_window.post_3d_menu.plot_type_combobox.currentText()
         polarization = self.main_window.post_3d_menu.polarization_combobox.currentText()
         window = self.main_window.post_3d_menu.window_combobox.currentText()
+        fft_backend = self.main_window.post_3d_menu.fft_backend_combobox.currentText()
+        fast_length = self.main_window.post_3d_menu.fast_length.isChecked()
         upsample = self.main_window.post_3d_menu.upsample_textbox.text()
         upsample_az = self.main_window.post_3d_menu.upsample_az_textbox.text()
         upsample_el = self.main_window.post_3d_menu.upsample_el_textbox.text()
@@ -76,6 +79,8 @@ class Plot3DThread(QThread):
 
         if data:
             data.num_contours = properties.radar_explorer.num_contours
+            data.rcs_data.fft_backend = fft_backend
+            data.rcs_data.fast_length = fast_length
             if function_expression == "dB":
                 function_expression = "dB20"
             if function_expression == "phase":
@@ -288,6 +293,15 @@ class Post3DMenu(object):
         self.window_label = None
         self.window_combobox = None
 
+        # FFT backend
+        self.fft_backend_combo_widget = None
+        self.fft_backend_label = None
+        self.fft_backend_combobox = None
+
+        # Fast FFT length switch
+        self.fast_length_label = None
+        self.fast_length = None
+
         # Upsample
         self.upsample_text_widget = None
         self.upsample_label = None
@@ -566,7 +580,7 @@ class Post3DMenu(object):
             height=40,
             width=[135, 180],
             label="FFT Window",
-            combobox_list=["Flat", "Hann", "Hamming"],
+            combobox_list=["Flat", "Hann", "Hamming", "Taylor", "Blackman-Harris", "Kaiser", "Chebyshev"],
             font_size=self.combo_size,
         )
 
@@ -574,6 +588,36 @@ class Post3DMenu(object):
         self.window_label = row_returns[1]
         self.window_combobox = row_returns[2]
 
+        # FFT backend
+        row_returns = self.ui.add_combobox(
+            self.post_3d_column_vertical_layout,
+            height=40,
+            width=[135, 180],
+            label="FFT Backend",
+            combobox_list=MonostaticRCSData.available_fft_backends(),
+            font_size=self.combo_size,
+        )
+
+        self.fft_backend_combo_widget = row_returns[0]
+        self.fft_backend_label = row_returns[1]
+        self.fft_backend_combobox = row_returns[2]
+
+        # Fast FFT length switch
+        row_returns = self.ui.add_toggle(
+            self.post_3d_column_vertical_layout,
+            height=30,
+            width=[135, 180, 0],
+            label=["Fast FFT Size", " "],
+            font_size=self.combo_size,
+            bg_color=self.app_color["label_off"],
+            active_color=self.app_color["label_on"],
+            text_color_on=self.app_color["text_foreground"],
+            text_color_off=self.app_color["text_foreground"],
+            show_on_off=True,
+        )
+        self.fast_length_label = row_returns[1]
+        self.fast_length = row_returns[2]
+
         # Upsample
         row_returns = self.ui.add_textbox(
             self.post_3d_column_vertical_layout,
@@ -775,6 +819,10 @@ class Post3DMenu(object):
 
             self.window_combobox.setVisible(False)
             self.window_label.setVisible(False)
+            self.fft_backend_combobox.setVisible(False)
+            self.fft_backend_label.setVisible(False)
+            self.fast_length.setVisible(False)
+            self.fast_length_label.setVisible(False)
             self.upsample_textbox.setVisible(False)
             self.upsample_label.setVisible(False)
             self.upsample_az_textbox.setVisible(False)
@@ -837,6 +885,10 @@ class Post3DMenu(object):
 
             self.window_combobox.setVisible(True)
             self.window_label.setVisible(True)
+            self.fft_backend_combobox.setVisible(True)
+            self.fft_backend_label.setVisible(True)
+            self.fast_length.setVisible(True)
+            self.fast_length_label.setVisible(True)
             self.upsample_textbox.setVisible(True)
             self.upsample_label.setVisible(True)
 
@@ -904,6 +956,10 @@ class Post3DMenu(object):
 
             self.window_combobox.setVisible(True)
             self.window_label.setVisible(True)
+            self.fft_backend_combobox.setVisible(True)
+            self.fft_backend_label.setVisible(True)
+            self.fast_length.setVisible(True)
+            self.fast_length_label.setVisible(True)
             self.upsample_textbox.setVisible(True)
             self.upsample_label.setVisible(True)
 
@@ -945,6 +1001,10 @@ class Post3DMenu(object):
 
             self.window_combobox.setVisible(True)
             self.window_label.setVisible(True)
+            self.fft_backend_combobox.setVisible(True)
+            self.fft_backend_label.setVisible(True)
+            self.fast_length.setVisible(True)
+            self.fast_length_label.setVisible(True)
             self.upsample_textbox.setVisible(True)
             self.upsample_label.setVisible(True)
 
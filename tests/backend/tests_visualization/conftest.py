@@ -38,15 +38,18 @@ You can enable the API log file in the backend_properties.json.
 
 """
 
+import json
 from pathlib import Path
 import random
 import shutil
 import string
 import tempfile
+from types import SimpleNamespace
 
 import pytest
 
 from ansys.aedt.core.internal.filesystem import Scratch
+from tests import TESTS_VISUALIZATION_PATH
 from tests.backend.conftest import DEFAULT_CONFIG
 from tests.backend.conftest import read_local_config
 from tests.backend.conftest import setup_aedt_settings
@@ -94,3 +97,44 @@ def local_scratch(init_scratch):
     scratch = Scratch(tmp_path)
     yield scratch
     scratch.remove()
+
+
+@pytest.fixture(autouse=True)
+def user_cache_directory(tmp_path, monkeypatch):
+    """Keep the caches of the user, such as the mesh cache of the plotters, in a temporary folder."""
+    cache_dir = tmp_path / "user_cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+    monkeypatch.setenv("LOCALAPPDATA", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture()
+def rcs_files(tmp_path):
+    """Copy the example models to a temporary folder and write their metadata files.
+
+    Each test gets its own copy, so the files written by a test, such as caches or exports, do not leak into the
+    other tests.
+    """
+    data_dir = tmp_path / "rcs_files"
+    shutil.copytree(TESTS_VISUALIZATION_PATH / "example_models", data_dir)
+    model_info = {
+        "Polyline1": ["Polyline1.obj", [143, 175, 143], 1.0, "mm"],
+        "Polyline1_1": ["Polyline1_1.obj", [143, 0, 0], 1.0, "mm"],
+        "Polyline1_2": ["Polyline1_2.obj", [255, 255, 0], 1.0, "mm"],
+    }
+    files = {}
+    for name, monostatic_file, frequency_units in [
+        ("metadata_file", "rcs_data.h5", "GHz"),
+        ("metadata_file_no_data", None, None),
+    ]:
+        metadata = {
+            "solution": "Trihedral_RCS",
+            "monostatic_file": monostatic_file,
+            "model_units": "mm",
+            "frequency_units": frequency_units,
+            "model_info": model_info,
+        }
+        files[name] = data_dir / f"rcs_{name.replace('_file', '')}.json"
+        with files[name].open("w") as f:
+            json.dump(metadata, f)
+    return SimpleNamespace(data_dir=data_dir, **files)
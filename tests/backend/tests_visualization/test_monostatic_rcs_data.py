@@ -16,11 +16,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+import json
+import os
+from pathlib import Path
+import time
+import tracemalloc
 from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
 import pytest
+from scipy.interpolate import RegularGridInterpolator
+import tables
 
+from ansys.aedt.core.generic.general_methods import conversion_function
+from ansys.aedt.core.visualization.plot.matplotlib import ReportPlotter
+from ansys.aedt.toolkits.radar_explorer.rcs_library import export_rcs_library
 from ansys.aedt.toolkits.radar_explorer.rcs_visualization import MonostaticRCSData
+from ansys.aedt.toolkits.radar_explorer.rcs_visualization import MonostaticRCSPlotter
+from ansys.aedt.toolkits.radar_explorer.rcs_visualization import MonostaticRCSPolarizations
+from ansys.aedt.toolkits.radar_explorer.rcs_visualization import RCSProductCache
+from ansys.aedt.toolkits.radar_explorer.run_export import main as run_export
 
 FILE_PATH = "dummy.json"
 ERROR_MESSAGE = "JSON file does not exist."
@@ -30,3 +47,747 @@ ERROR_MESSAGE = "JSON file does not exist."
 def test_failure_with_non_existing_file(mock_is_file):
     with pytest.raises(FileNotFoundError, match="JSON file does not exist."):
         MonostaticRCSData(input_file=FILE_PATH)
+
+
+def test_rcs_resampling_operator(rcs_files):
+    rng = np.random.default_rng(0)
+    grid = (np.linspace(0.0, 1.0, 5), np.linspace(2.0, -2.0, 7), np.array([0.5]))
+    values = rng.random((5, 7, 1)) + 1j * rng.random((5, 7, 1))
+    points = (rng.uniform(-0.2, 1.2, (6, 4)), rng.uniform(-2.5, 2.5, (6, 4)), np.full((6, 4), 0.5))
+    for method in ["linear", "nearest"]:
+        for extrapolate in [True, False]:
+            interp = RegularGridInterpolator(
+                grid, values, method=method, bounds_error=False, fill_value=None if extrapolate else 0.0
+            )
+            operator = MonostaticRCSData.resampling_operator(grid, points, method, extrapolate)
+            result = (operator @ values.ravel()).reshape(points[0].shape)
+            assert result == pytest.approx(interp(points))
+
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    rcs_data_copy = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    assert rcs_data.resampling_cache is rcs_data_copy.resampling_cache
+    rcs_data.resampling_cache.clear()
+    isar_3d = rcs_data.isar_3d
+    assert rcs_data.resampling_cache.misses == 1
+    assert np.allclose(rcs_data_copy.isar_3d.data, isar_3d.data, equal_nan=True)
+    assert rcs_data.resampling_cache.hits == 1
+
+
+def test_rcs_resampling_operator_reuse(rcs_files):
+    # A grid large enough for the operator to be worth caching
+    frequencies = np.linspace(9.0, 11.0, 64)
+    phi = np.linspace(-30.0, 30.0, 61)
+    theta = np.linspace(75.0, 105.0, 31)
+    index = pd.MultiIndex.from_product([frequencies, phi, theta], names=["Freq", "IWavePhi", "IWaveTheta"])
+    rng = np.random.default_rng(0)
+    values = rng.random(index.size) + 1j * rng.random(index.size)
+    polarizations = {}
+    for name, scale in (("HH", 1.0), ("VV", 0.5 - 2j)):
+        frame = pd.DataFrame({name: values * scale}, index=index)
+        frame.to_hdf(rcs_files.data_dir / f"rcs_data_{name}.h5", key="df", format="table")
+        polarizations[name] = MonostaticRCSData(
+            input_file=_write_rcs_metadata(rcs_files, f"rcs_data_{name}.h5"), product_cache=RCSProductCache()
+        )
+        polarizations[name].upsample_range = 64
+        polarizations[name].upsample_azimuth = 64
+        polarizations[name].upsample_elevation = 32
+
+    resampling_cache = polarizations["HH"].resampling_cache
+    max_bytes = resampling_cache.max_bytes
+    resampling_cache.clear()
+    try:
+        isar_hh = polarizations["HH"].isar_3d
+        assert resampling_cache.misses == 1
+        assert len(resampling_cache) == 1
+        assert resampling_cache.nbytes > 10 * 1024**2
+        # Eight double weights with 32-bit indices per point
+        npoints = index.size
+        assert npoints * 8 * (8 + 4) < resampling_cache.nbytes < npoints * 8 * (8 + 8)
+        isar_vv = polarizations["VV"].isar_3d
+        assert resampling_cache.hits == 1
+        assert resampling_cache.misses == 1
+
+        # Operators beyond the budget are not built, and the data is interpolated directly
+        resampling_cache.clear()
+        resampling_cache.max_bytes = 1024**2
+        polarizations["VV"].product_cache.clear()
+        polarizations["VV"].stage_cache.clear()
+        with patch.object(MonostaticRCSData, "resampling_operator") as resampling_operator:
+            isar_direct = polarizations["VV"].isar_3d
+        resampling_operator.assert_not_called()
+        assert len(resampling_cache) == 0
+        assert np.allclose(isar_direct.data, isar_vv.data, equal_nan=True)
+    finally:
+        resampling_cache.max_bytes = max_bytes
+        resampling_cache.clear()
+    assert not np.allclose(isar_hh.data, isar_vv.data)
+
+
+def test_rcs_precision(rcs_files):
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    assert rcs_data.precision == "double"
+    assert rcs_data.peak_bytes is None
+    assert rcs_data.isar_2d is not None
+    assert rcs_data.peak_bytes is None
+    rcs_data.measure_peak_memory = "True"
+    assert not rcs_data.measure_peak_memory
+    rcs_data.measure_peak_memory = True
+    isar_3d = rcs_data.isar_3d
+    assert isar_3d.data.dtype == np.float64
+    peak_bytes = rcs_data.peak_bytes
+    assert peak_bytes > isar_3d.data.nbytes
+
+    rcs_data.precision = "half"
+    assert rcs_data.precision == "double"
+    rcs_data.precision = "single"
+    isar_3d_single = rcs_data.isar_3d
+    assert isar_3d_single.data.dtype == np.float32
+    assert rcs_data.peak_bytes < peak_bytes
+    assert isar_3d_single.data.max() == pytest.approx(isar_3d.data.max(), abs=1e-3)
+    assert rcs_data.isar_2d.data.dtype == np.float32
+    assert rcs_data.waterfall.data.dtype == np.float32
+    assert rcs_data.range_profile["Data"].dtype == np.float32
+
+    # The peak of a caller that is already tracing is kept
+    tracemalloc.start()
+    try:
+        block = np.ones(4 * peak_bytes // 8)
+        del block
+        _, caller_peak = tracemalloc.get_traced_memory()
+        rcs_data.window = "Hann"
+        assert rcs_data.isar_3d is not None
+        assert tracemalloc.get_traced_memory()[1] == caller_peak
+        assert rcs_data.peak_bytes > 0
+    finally:
+        tracemalloc.stop()
+
+
+def test_rcs_isar_3d_out_of_core(rcs_files):
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    rcs_data.upsample_range = 32
+    rcs_data.upsample_azimuth = 16
+    rcs_data.upsample_elevation = 16
+    isar_3d = rcs_data.isar_3d
+
+    scratch_directory = Path(rcs_files.metadata_file).parent / "scratch"
+    rcs_data.scratch_directory = scratch_directory
+    rcs_data.slab_bytes = 4096
+    rcs_data.out_of_core = "True"
+    assert not rcs_data.out_of_core
+    rcs_data.out_of_core = True
+    isar_3d_streamed = rcs_data.isar_3d
+    assert isinstance(isar_3d_streamed.data, np.memmap)
+    assert np.allclose(isar_3d_streamed.data, isar_3d.data, equal_nan=True)
+    assert isar_3d_streamed.nbytes < isar_3d.nbytes
+    assert len(list(scratch_directory.iterdir())) == 1
+
+    rcs_plotter = MonostaticRCSPlotter(rcs_data)
+    assert isinstance(rcs_plotter.plot_isar_3d(show=False, plane_cut="yz"), ReportPlotter)
+
+    # Without a conversion function, the streamed image is in dB10
+    rcs_data.data_conversion_function = None
+    isar_3d_db10 = rcs_data.isar_3d
+    assert not np.iscomplexobj(isar_3d_db10.data)
+    rcs_data.out_of_core = False
+    rcs_data.data_conversion_function = "dB10"
+    assert np.allclose(isar_3d_db10.data, rcs_data.isar_3d.data, equal_nan=True)
+
+    del isar_3d_streamed, isar_3d_db10, rcs_plotter
+    rcs_data.product_cache.clear()
+    gc.collect()
+    assert not list(scratch_directory.iterdir())
+
+    # The windowed data is written to the scratch file slab by slab, so it is never held in memory as a whole
+    index = pd.MultiIndex.from_product(
+        [np.linspace(9.0, 11.0, 64), np.linspace(-30.0, 30.0, 61), np.linspace(75.0, 105.0, 31)],
+        names=["Freq", "IWavePhi", "IWaveTheta"],
+    )
+    frame = pd.DataFrame({"HH": np.exp(1j * np.arange(index.size))}, index=index)
+    frame.to_hdf(rcs_files.data_dir / "rcs_data_large.h5", key="df", format="table")
+    large_data = MonostaticRCSData(
+        input_file=_write_rcs_metadata(rcs_files, "rcs_data_large.h5"), product_cache=RCSProductCache()
+    )
+    large_data.upsample_range = 64
+    large_data.upsample_azimuth = 64
+    large_data.upsample_elevation = 32
+    isar_3d = large_data.isar_3d
+    large_data.scratch_directory = scratch_directory
+    large_data.slab_bytes = 64 * 1024
+    large_data.out_of_core = True
+    large_data.measure_peak_memory = True
+    assert np.allclose(large_data.isar_3d.data, isar_3d.data, equal_nan=True)
+    assert large_data.peak_bytes < large_data.rcs_cube.nbytes / 2
+
+
+def test_rcs_fft_backend(rcs_files):
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    rcs_data.window_size = 1000
+    rcs_data.upsample_range = 50
+    rcs_data.upsample_azimuth = 50
+    rcs_data.upsample_elevation = 50
+    assert rcs_data.fft_backend == "numpy"
+    range_profile = rcs_data.range_profile
+    isar_2d = rcs_data.isar_2d
+    isar_3d = rcs_data.isar_3d
+
+    rcs_data.fft_backend = "cufft"
+    assert rcs_data.fft_backend == "numpy"
+    rcs_data.fft_workers = 0
+    assert rcs_data.fft_workers == -1
+    assert "scipy" in MonostaticRCSData.available_fft_backends()
+    rcs_data.fft_backend = "scipy"
+    rcs_data.fft_workers = 2
+    rcs_data.product_cache.clear()
+    assert np.allclose(rcs_data.range_profile["Data"], range_profile["Data"])
+    assert np.allclose(rcs_data.isar_2d.data, isar_2d.data, equal_nan=True)
+    assert np.allclose(rcs_data.isar_3d.data, isar_3d.data, equal_nan=True)
+
+    rcs_data.fast_length = "True"
+    assert not rcs_data.fast_length
+    rcs_data.fast_length = True
+    assert len(rcs_data.range_profile) == 1000
+    assert rcs_data.isar_3d.shape == (50, 50, 50)
+    rcs_data.window_size = 1001
+    rcs_data.upsample_range = 97
+    assert len(rcs_data.range_profile) == 1008
+    assert rcs_data.isar_3d.shape == (98, 50, 50)
+
+
+def test_rcs_chunked_storage(rcs_files):
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    assert not rcs_data.is_chunked
+    metadata_file = rcs_data.convert_to_chunked(chunk_shape=(1, 2, 2))
+    assert metadata_file.is_file()
+    assert (metadata_file.parent / "rcs_data_chunked.h5").is_file()
+
+    chunked_data = MonostaticRCSData(input_file=str(metadata_file))
+    assert chunked_data.is_chunked
+    assert chunked_data.name == rcs_data.name
+    assert chunked_data.frequencies == rcs_data.frequencies
+    assert chunked_data.rcs == rcs_data.rcs
+    assert chunked_data.rcs_active_frequency.equals(rcs_data.rcs_active_frequency)
+    assert chunked_data.rcs_active_theta.equals(rcs_data.rcs_active_theta)
+    assert chunked_data.rcs_active_phi.equals(rcs_data.rcs_active_phi)
+    assert chunked_data.range_profile.equals(rcs_data.range_profile)
+    assert np.array_equal(chunked_data.waterfall.data, rcs_data.waterfall.data)
+    assert not chunked_data.is_loaded
+
+    assert np.array_equal(chunked_data.isar_2d.data, rcs_data.isar_2d.data, equal_nan=True)
+    assert chunked_data.is_loaded
+    assert np.array_equal(chunked_data.rcs_cube, rcs_data.rcs_cube)
+    assert chunked_data.raw_data.shape[0] == chunked_data.rcs_cube.size
+
+
+def _write_rcs_metadata(rcs_files, monostatic_file):
+    with Path(rcs_files.metadata_file).open("r") as f:
+        metadata = json.load(f)
+    metadata["monostatic_file"] = monostatic_file
+    metadata_file = rcs_files.data_dir / f"{Path(monostatic_file).stem}.json"
+    with metadata_file.open("w") as f:
+        json.dump(metadata, f)
+    return str(metadata_file)
+
+
+def test_rcs_storage_formats(rcs_files):
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    raw_data = rcs_data.raw_data
+    raw_data.to_hdf(rcs_files.data_dir / "rcs_data_fixed.h5", key="df", format="fixed")
+    fixed_data = MonostaticRCSData(input_file=_write_rcs_metadata(rcs_files, "rcs_data_fixed.h5"))
+    assert fixed_data.name == rcs_data.name
+    assert fixed_data.frequencies == rcs_data.frequencies
+    assert np.array_equal(fixed_data.available_incident_wave_phi, rcs_data.available_incident_wave_phi)
+    assert np.array_equal(fixed_data.available_incident_wave_theta, rcs_data.available_incident_wave_theta)
+    assert np.array_equal(fixed_data.rcs_cube, rcs_data.rcs_cube)
+
+    # A table with more rows than the first block, in which theta changes the fastest
+    frequencies = np.linspace(9.0, 11.0, 3)
+    phi = np.linspace(-60.0, 60.0, 41)
+    theta = np.linspace(0.0, 180.0, 61)
+    index = pd.MultiIndex.from_product([frequencies, phi, theta], names=["Freq", "IWavePhi", "IWaveTheta"])
+    values = np.arange(index.size) * (1 + 1j)
+    frame = pd.DataFrame({rcs_data.name: values}, index=index)
+    frame.to_hdf(rcs_files.data_dir / "rcs_data_grid.h5", key="df", format="table")
+    frame.sample(frac=1.0, random_state=0).to_hdf(rcs_files.data_dir / "rcs_data_shuffled.h5", key="df", format="table")
+
+    with patch.object(pd.HDFStore, "select_column", side_effect=AssertionError("full column scan")):
+        grid_data = MonostaticRCSData(input_file=_write_rcs_metadata(rcs_files, "rcs_data_grid.h5"))
+    assert grid_data.frequencies == frequencies.tolist()
+    assert np.array_equal(grid_data.available_incident_wave_phi, phi)
+    assert np.array_equal(grid_data.available_incident_wave_theta, theta)
+    assert np.array_equal(grid_data.rcs_cube.ravel(), values)
+
+    shuffled_data = MonostaticRCSData(input_file=_write_rcs_metadata(rcs_files, "rcs_data_shuffled.h5"))
+    assert shuffled_data.frequencies == frequencies.tolist()
+    assert np.array_equal(shuffled_data.available_incident_wave_phi, phi)
+    assert np.array_equal(shuffled_data.rcs_cube.ravel(), values)
+
+
+def test_rcs_binary_cache(rcs_files):
+    cache_file = Path(rcs_files.metadata_file).parent / "rcs_data.h5.cube.npy"
+    header_file = cache_file.with_suffix(".json")
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    assert not rcs_data.binary_cache
+    assert rcs_data.binary_cache_file == cache_file
+    rcs_cube = rcs_data.rcs_cube
+    raw_data = rcs_data.raw_data
+    assert not cache_file.is_file()
+
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file), binary_cache=True)
+    assert not isinstance(rcs_data.rcs_cube, np.memmap)
+    assert cache_file.is_file()
+    assert header_file.is_file()
+    assert not list(cache_file.parent.glob("*.tmp"))
+
+    # The samples are not hashed on load
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file), binary_cache=True)
+    with patch("hashlib.sha256", side_effect=AssertionError("checksum on load")):
+        assert isinstance(rcs_data.rcs_cube, np.memmap)
+    assert np.array_equal(rcs_data.rcs_cube, rcs_cube)
+    assert rcs_data.raw_data.equals(raw_data)
+    assert rcs_data.range_profile is not None
+    assert rcs_data.verify_binary_cache()
+    del rcs_data
+    gc.collect()
+
+    # A header that does not match the sidecar is rejected
+    with header_file.open("r") as f:
+        header = json.load(f)
+    header["cache"]["size"] += 1
+    with header_file.open("w") as f:
+        json.dump(header, f)
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file), binary_cache=True)
+    assert not rcs_data.verify_binary_cache()
+    assert not isinstance(rcs_data.rcs_cube, np.memmap)
+    assert np.array_equal(rcs_data.rcs_cube, rcs_cube)
+    del rcs_data
+    gc.collect()
+
+    # A modified sidecar is rejected on load, and every sample is part of the checksum
+    cube = np.load(cache_file, mmap_mode="r+")
+    cube[-1, -1, -1] += 1.0
+    cube.flush()
+    del cube
+    gc.collect()
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file), binary_cache=True)
+    assert not isinstance(rcs_data.rcs_cube, np.memmap)
+    assert np.array_equal(rcs_data.rcs_cube, rcs_cube)
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file), binary_cache=True)
+    assert isinstance(rcs_data.rcs_cube, np.memmap)
+    assert rcs_data.verify_binary_cache()
+    stat = cache_file.stat()
+    del rcs_data
+    gc.collect()
+    cube = np.load(cache_file, mmap_mode="r+")
+    cube[-1, -1, -1] += 1.0
+    cube.flush()
+    del cube
+    gc.collect()
+    os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert not MonostaticRCSData(input_file=str(rcs_files.metadata_file), binary_cache=True).verify_binary_cache()
+
+
+def test_rcs_converted_cube(rcs_files):
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    rcs_data.data_conversion_function = "dB20"
+    converted_cube = rcs_data.converted_cube
+    assert np.array_equal(converted_cube, 20 * np.log10(np.abs(rcs_data.rcs_cube)))
+    assert not converted_cube.flags.writeable
+    rcs_data.data_conversion_function = "abs"
+    assert np.array_equal(rcs_data.converted_cube, np.abs(rcs_data.rcs_cube))
+    rcs_data.data_conversion_function = "dB20"
+    assert rcs_data.converted_cube is converted_cube
+
+    rcs_active_phi = rcs_data.rcs_active_phi
+    assert np.array_equal(rcs_data.rcs_active_phi_converted["Data"], 20 * np.log10(np.abs(rcs_active_phi["Data"])))
+    rcs_active_theta = rcs_data.rcs_active_theta
+    assert np.array_equal(rcs_data.rcs_active_theta_converted["Data"], 20 * np.log10(np.abs(rcs_active_theta["Data"])))
+    rcs_data.data_conversion_function = "norm"
+    assert rcs_data.rcs_active_frequency["Data"].max() == 1.0
+    assert rcs_data.rcs_active_phi_converted["Data"].max() == 1.0
+
+    # Without a conversion function, the data is converted to dB10
+    rcs_data.data_conversion_function = None
+    converted_cube = rcs_data.converted_cube
+    assert np.array_equal(converted_cube, 10 * np.log10(np.abs(rcs_data.rcs_cube)))
+    rcs_data.data_conversion_function = "dB10"
+    assert rcs_data.converted_cube is converted_cube
+    rcs_data.data_conversion_function = None
+    assert np.array_equal(rcs_data.rcs_active_phi_converted["Data"], 10 * np.log10(np.abs(rcs_active_phi["Data"])))
+    assert not np.iscomplexobj(rcs_data.range_profile["Data"])
+    chunked_data = MonostaticRCSData(input_file=str(rcs_data.convert_to_chunked()))
+    chunked_data.data_conversion_function = None
+    assert np.allclose(chunked_data.rcs_active_theta_converted["Data"], 10 * np.log10(np.abs(rcs_active_theta["Data"])))
+    assert not chunked_data.is_loaded
+
+    # A converted cube beyond the memory budget is not computed to get one block
+    small_data = MonostaticRCSData(
+        input_file=str(rcs_files.metadata_file), product_cache=RCSProductCache(max_bytes=rcs_data.rcs_cube.size)
+    )
+    small_data.rcs_cube
+    with patch(
+        "ansys.aedt.toolkits.radar_explorer.rcs_visualization.conversion_function", wraps=conversion_function
+    ) as convert:
+        rcs_active_phi_converted = small_data.rcs_active_phi_converted
+    assert convert.call_args.args[0].size == rcs_active_phi["Data"].size
+    assert np.array_equal(rcs_active_phi_converted["Data"], 20 * np.log10(np.abs(rcs_active_phi["Data"])))
+    assert len(small_data.product_cache) == 0
+
+
+def test_rcs_range_profile_cube(rcs_files):
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    rcs_data.window = "Hann"
+    rcs_data.window_size = 256
+    range_profile_cube = rcs_data.range_profile_cube
+    assert range_profile_cube.shape == (
+        256,
+        rcs_data.available_incident_wave_phi.size,
+        rcs_data.available_incident_wave_theta.size,
+    )
+    assert list(range_profile_cube.axes) == ["Range", "IWavePhi", "IWaveTheta"]
+    assert rcs_data.range_profile_cube is range_profile_cube
+
+    rcs_data.incident_wave_phi = rcs_data.available_incident_wave_phi[1]
+    rcs_data.incident_wave_theta = rcs_data.available_incident_wave_theta[2]
+    range_profile = rcs_data.range_profile
+    assert np.allclose(range_profile_cube.axes["Range"], range_profile["Range"])
+    assert np.allclose(range_profile_cube.data[:, 1, 2], range_profile["Data"])
+
+    output_file = Path(rcs_files.metadata_file).parent / "range_profiles" / "rcs_data_range_profiles.npy"
+    rcs_data.slab_bytes = 1
+    exported_cube = rcs_data.export_range_profile_cube(output_file)
+    assert isinstance(exported_cube.data, np.memmap)
+    assert np.allclose(exported_cube.data, range_profile_cube.data)
+    with output_file.with_suffix(".json").open("r") as f:
+        header = json.load(f)
+    assert header["window"] == "Hann"
+    assert np.allclose(header["axes"]["Range"], range_profile_cube.axes["Range"])
+
+    # Without a conversion function, the range profiles are exported in dB10
+    rcs_data.data_conversion_function = None
+    db10_cube = rcs_data.export_range_profile_cube(output_file)
+    assert not np.iscomplexobj(db10_cube.data)
+    assert np.allclose(db10_cube.data, rcs_data.range_profile_cube.data)
+    del exported_cube, db10_cube
+    gc.collect()
+
+    assert not MonostaticRCSData(input_file=str(rcs_files.metadata_file_no_data)).export_range_profile_cube(output_file)
+
+
+def test_rcs_library_export(rcs_files):
+    library_file = Path(rcs_files.metadata_file).parent / "library" / "rcs_library.h5"
+    settings = {"window": "Hann", "window_size": 64, "upsample_range": 32}
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    put = RCSProductCache.put
+    stored = []
+
+    def store(cache, key, value):
+        stored.append(put(cache, key, value) and cache is not rcs_data.resampling_cache)
+        return stored[-1]
+
+    start_time = time.perf_counter()
+    with patch.object(RCSProductCache, "put", autospec=True, side_effect=store):
+        report = export_rcs_library(rcs_files.metadata_file, library_file, settings=settings, block_size=1, processes=1)
+    elapsed = time.perf_counter() - start_time
+    # The one-off images are not cached
+    assert stored
+    assert not any(stored)
+    nphi = rcs_data.available_incident_wave_phi.size
+    ntheta = rcs_data.available_incident_wave_theta.size
+    assert report["range_profile"]["images"] == nphi * ntheta
+    assert report["isar_2d"]["images"] == ntheta
+    assert report["isar_2d"]["images_per_second"] > 0.0
+    # Each product is timed on its own
+    assert 0.0 < report["range_profile"]["seconds"]
+    assert 0.0 < report["isar_2d"]["seconds"]
+    assert report["range_profile"]["seconds"] + report["isar_2d"]["seconds"] <= elapsed
+    for values in report.values():
+        assert values["images_per_second"] == pytest.approx(values["images"] / values["seconds"])
+
+    for name, value in settings.items():
+        setattr(rcs_data, name, value)
+    rcs_data.incident_wave_theta = rcs_data.available_incident_wave_theta[1]
+    with tables.open_file(library_file, mode="r") as h5:
+        assert h5.root._v_attrs["name"] == "HH"
+        assert h5.root.range_profile.data.shape == (nphi, ntheta, 64)
+        assert h5.root.range_profile.data.filters.complevel == 5
+        assert np.allclose(h5.root.range_profile.data[:], np.moveaxis(rcs_data.range_profile_cube.data, 0, -1))
+        assert h5.root.isar_2d._v_attrs["cut"] == "IWaveTheta"
+        assert np.allclose(h5.root.isar_2d.data[1], rcs_data.isar_2d.data, equal_nan=True)
+        assert np.allclose(h5.root.isar_2d.Down_range[:], rcs_data.isar_2d.axes["Down-range"])
+
+    report = export_rcs_library(rcs_files.metadata_file, library_file, settings=settings, block_size=1)
+    assert report["range_profile"]["images"] == 0
+    with tables.open_file(library_file, mode="a") as h5:
+        h5.root.isar_2d.done[2] = False
+        h5.root.range_profile.data[0] = 0.0
+        h5.root.range_profile.done[0] = False
+    convert_to_chunked = MonostaticRCSData.convert_to_chunked
+    with patch.object(
+        MonostaticRCSData, "convert_to_chunked", autospec=True, side_effect=convert_to_chunked
+    ) as convert:
+        report = export_rcs_library(rcs_files.metadata_file, library_file, settings=settings, block_size=1, processes=2)
+    # The processes read a temporary chunked copy of the table
+    convert.assert_called_once()
+    assert sorted(path.name for path in library_file.parent.iterdir()) == ["rcs_library.h5"]
+    assert report["isar_2d"]["images"] == 1
+    assert report["range_profile"]["images"] == ntheta
+    with tables.open_file(library_file, mode="r") as h5:
+        assert np.all(h5.root.range_profile.done[:])
+        range_profiles = np.moveaxis(rcs_data.range_profile_cube.data[:, 0], 0, -1)
+        assert np.allclose(h5.root.range_profile.data[0], range_profiles)
+        rcs_data.incident_wave_theta = rcs_data.available_incident_wave_theta[2]
+        assert np.allclose(h5.root.isar_2d.data[2], rcs_data.isar_2d.data, equal_nan=True)
+
+    # A library of other input files is not resumed
+    monostatic_file = Path(rcs_files.metadata_file).parent / "rcs_data.h5"
+    os.utime(monostatic_file, ns=(monostatic_file.stat().st_atime_ns, monostatic_file.stat().st_mtime_ns + 10**9))
+    assert not export_rcs_library(rcs_files.metadata_file, library_file, settings=settings, block_size=1)
+    assert not export_rcs_library(rcs_files.metadata_file, library_file, block_size=1)
+    assert not export_rcs_library(rcs_files.metadata_file, library_file, settings={"invented": 1})
+    assert not export_rcs_library(rcs_files.metadata_file, library_file, products=("isar_3d",))
+    assert (
+        run_export([str(rcs_files.metadata_file), str(library_file), "--products", "range_profile", "--restart"]) == 0
+    )
+    with tables.open_file(library_file, mode="r") as h5:
+        assert "isar_2d" not in h5.root
+
+
+def test_rcs_polarizations(rcs_files):
+    data_dir = Path(rcs_files.metadata_file).parent
+    raw_data = pd.read_hdf(data_dir / "rcs_data.h5")
+    levels = list(raw_data.index.names)
+    vv_data = raw_data.rename(columns={"HH": "VV"}) * (0.5 - 2j)
+    vv_data.to_hdf(data_dir / "rcs_data_vv.h5", key="df", format="table", data_columns=levels)
+    raw_data.loc[raw_data.index.get_level_values("IWavePhi") > -40.0].rename(columns={"HH": "HV"}).to_hdf(
+        data_dir / "rcs_data_hv.h5", key="df", format="table", data_columns=levels
+    )
+    metadata_files = {}
+    for name in ("vv", "hv"):
+        with Path(rcs_files.metadata_file).open("r") as f:
+            metadata = json.load(f)
+        metadata["monostatic_file"] = f"rcs_data_{name}.h5"
+        metadata_files[name] = data_dir / f"rcs_metadata_{name}.json"
+        with metadata_files[name].open("w") as f:
+            json.dump(metadata, f)
+
+    with pytest.raises(ValueError):
+        MonostaticRCSPolarizations([str(rcs_files.metadata_file), str(rcs_files.metadata_file)])
+    with pytest.raises(ValueError):
+        MonostaticRCSPolarizations([str(rcs_files.metadata_file), str(metadata_files["hv"])])
+
+    polarizations = MonostaticRCSPolarizations([str(rcs_files.metadata_file), str(metadata_files["vv"])])
+    assert len(polarizations) == 2
+    assert polarizations.polarizations == ["HH", "VV"]
+    assert polarizations.solution == "Trihedral_RCS"
+    assert polarizations.rcs_cube.shape == polarizations["HH"].rcs_cube.shape + (2,)
+    assert polarizations.rcs_cube is polarizations.rcs_cube
+    assert not polarizations.rcs_cube.flags.writeable
+
+    # The stacked data is kept within the budget of the product cache and released with the polarizations
+    cache = RCSProductCache()
+    cached_polarizations = MonostaticRCSPolarizations(
+        [str(rcs_files.metadata_file), str(metadata_files["vv"])], product_cache=cache
+    )
+    rcs_cube = cached_polarizations.rcs_cube
+    assert len(cache) == 1
+    assert cache.nbytes == rcs_cube.nbytes
+    cache.max_bytes = rcs_cube.nbytes - 1
+    assert cached_polarizations.rcs_cube is not rcs_cube
+    assert np.array_equal(cached_polarizations.rcs_cube, rcs_cube)
+    assert len(cache) == 0
+    cache.max_bytes = rcs_cube.nbytes
+    assert cached_polarizations.rcs_cube is cached_polarizations.rcs_cube
+    assert len(cache) == 1
+    del cached_polarizations
+    gc.collect()
+    assert len(cache) == 0
+    assert not polarizations.update_settings(invented=1)
+    assert polarizations.update_settings(window="Hann", upsample_range=64, upsample_azimuth=32)
+    assert polarizations["VV"].window == "Hann"
+
+    range_profiles = polarizations.range_profile
+    waterfalls = polarizations.waterfall
+    isar_2d = polarizations.isar_2d
+    assert polarizations.isar_2d["VV"] is isar_2d["VV"]
+    polarizations.update_settings(upsample_elevation=16)
+    isar_3d = polarizations.isar_3d
+    for name in polarizations:
+        rcs_data = polarizations[name]
+        assert np.allclose(range_profiles[name]["Data"], rcs_data.range_profile["Data"])
+        assert np.allclose(waterfalls[name].data, rcs_data.waterfall.data)
+        assert np.allclose(isar_2d[name].data, rcs_data.isar_2d.data, equal_nan=True)
+        assert np.allclose(isar_3d[name].data, rcs_data.isar_3d.data, equal_nan=True)
+
+
+def test_rcs_window_bank(rcs_files):
+    for window in MonostaticRCSData.available_windows():
+        win, win_sum = MonostaticRCSData.window_function(window, 33)
+        assert win.shape == (33,)
+        assert np.isclose(win.max(), 1.0)
+        assert np.isclose(win_sum, win.sum())
+        # The cached coefficients are not modified through the returned copy
+        win[:] = 0.0
+        assert np.isclose(MonostaticRCSData.window_function(window, 33)[0].max(), 1.0)
+
+    taylor_20, _ = MonostaticRCSData.window_function("Taylor", 64, nbar=4, sll=20.0)
+    taylor_40, _ = MonostaticRCSData.window_function("Taylor", 64, sll=40.0)
+    assert taylor_40[0] < taylor_20[0]
+    kaiser, _ = MonostaticRCSData.window_function("Kaiser", 16, beta=5.0)
+    assert np.allclose(kaiser, np.kaiser(16, 5.0))
+    kaiser, _ = MonostaticRCSData.window_function("Kaiser", 16, beta=0)
+    assert np.allclose(kaiser, 1.0)
+
+    tensor, tensor_sum = MonostaticRCSData.window_tensor("Hann", (5, 4, 3))
+    assert tensor.shape == (5, 4, 3)
+    assert np.allclose(tensor, np.einsum("i,j,k->ijk", np.hanning(5), np.hanning(4), np.hanning(3)))
+    assert np.isclose(tensor_sum, tensor.sum())
+
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    rcs_data.window = "invented"
+    assert rcs_data.window == "Flat"
+    assert rcs_data.window_parameters == {}
+    rcs_data.window = "Chebyshev"
+    assert rcs_data.window_parameters == {"at": 60.0}
+    isar_2d = rcs_data.isar_2d
+    rcs_data.window_parameters = {"beta": 1.0}
+    rcs_data.window_parameters = {"at": -1.0}
+    assert rcs_data.window_parameters == {"at": 60.0}
+    assert rcs_data.isar_2d is isar_2d
+    rcs_data.window_parameters = {"at": 80}
+    assert rcs_data.window_parameters == {"at": 80.0}
+    assert rcs_data.isar_2d is not isar_2d
+    rcs_data.window = "Kaiser"
+    rcs_data.window_parameters = {"beta": 0}
+    assert rcs_data.window_parameters == {"beta": 0.0}
+    rcs_data.window_parameters = {"beta": -1.0}
+    assert rcs_data.window_parameters == {"beta": 0.0}
+    rcs_data.window = "Taylor"
+    rcs_data.window_parameters = {"nbar": 0}
+    assert rcs_data.window_parameters == {"nbar": 4, "sll": 30.0}
+    rcs_data.window_parameters = {"nbar": 5}
+    assert rcs_data.window_parameters == {"nbar": 5, "sll": 30.0}
+    assert rcs_data.range_profile is not None
+    assert rcs_data.isar_3d is not None
+
+
+def test_rcs_phase_shift(rcs_files):
+    data = np.ones((4, 5, 3), dtype=np.complex128)
+    shifted = MonostaticRCSData.phase_shift(data.copy(), 1, 8, 5)
+    d_arg = np.pi / 8
+    expected = np.exp(1j * (np.floor(-0.5 * 5) + np.arange(5)) * d_arg)
+    assert shifted[2, :, 1] == pytest.approx(expected)
+    assert shifted[0, :, 0] == pytest.approx(expected)
+
+    # Odd number of points after the FFT leaves the data untouched
+    assert np.array_equal(MonostaticRCSData.phase_shift(data.copy(), 0, 7, 4), data)
+
+    single = MonostaticRCSData.phase_shift(data.astype(np.complex64), 2, 4, 3)
+    assert single.dtype == np.complex64
+
+
+def test_rcs_product_cache(rcs_files):
+    # The instances share one cache by default and keep their products apart
+    rcs_data_hh = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    rcs_data_copy = MonostaticRCSData(input_file=str(rcs_files.metadata_file))
+    assert isinstance(rcs_data_hh.product_cache, RCSProductCache)
+    assert rcs_data_hh.product_cache is rcs_data_copy.product_cache
+    assert rcs_data_hh.range_profile is not rcs_data_copy.range_profile
+
+    cache = RCSProductCache()
+    stage_cache = RCSProductCache()
+    rcs_data = MonostaticRCSData(input_file=str(rcs_files.metadata_file), product_cache=cache, stage_cache=stage_cache)
+    assert rcs_data.product_cache is cache
+    assert rcs_data.stage_cache is stage_cache
+
+    # Product, then complex image and resampled data
+    isar_3d = rcs_data.isar_3d
+    assert cache.misses == 1
+    assert stage_cache.misses == 2
+    assert rcs_data.isar_3d is isar_3d
+    assert cache.hits == 1
+
+    # The resampled data does not depend on the window
+    rcs_data.window = "Hann"
+    assert rcs_data.isar_3d is not isar_3d
+    assert cache.misses == 2
+    assert stage_cache.misses == 3
+    assert stage_cache.hits == 1
+    rcs_data.window = "Flat"
+    assert rcs_data.isar_3d is isar_3d
+    assert cache.hits == 2
+
+    range_profile = rcs_data.range_profile
+    rcs_data.incident_wave_phi = rcs_data.available_incident_wave_phi[1]
+    assert rcs_data.range_profile is not range_profile
+    rcs_data.incident_wave_phi = rcs_data.available_incident_wave_phi[0]
+    assert rcs_data.range_profile is range_profile
+    assert len(cache) == 4
+    assert len(stage_cache) == 3
+    assert cache.nbytes > 0
+
+    cache.max_bytes = RCSProductCache.sizeof(range_profile)
+    assert len(cache) == 1
+    assert rcs_data.range_profile is range_profile
+
+    cache.max_bytes = 0
+    assert len(cache) == 0
+    assert not cache.put("key", range_profile)
+    cache.clear()
+    assert cache.hits == cache.misses == 0
+
+    # The products of a collected instance are released
+    cache.max_bytes = 512 * 1024**2
+    assert rcs_data.isar_3d is not None
+    assert len(cache) == 1
+    assert len(stage_cache) == 3
+    cache.put(("other",), range_profile)
+    del rcs_data, isar_3d
+    gc.collect()
+    assert len(cache) == 1
+    assert len(stage_cache) == 0
+    assert cache.discard("other") == 1
+    assert len(cache) == 0
+
+
+def test_rcs_isar_stages(rcs_files):
+    rcs_data = MonostaticRCSData(
+        input_file=str(rcs_files.metadata_file), product_cache=RCSProductCache(), stage_cache=RCSProductCache()
+    )
+    cache = rcs_data.product_cache
+    stage_cache = rcs_data.stage_cache
+    assert stage_cache is not cache
+    assert MonostaticRCSData(input_file=str(rcs_files.metadata_file)).stage_cache.max_bytes == 1024**3
+    rcs_data.upsample_range = 64
+    rcs_data.upsample_azimuth = 32
+    rcs_data.upsample_elevation = 16
+    for product in ["isar_2d", "isar_3d"]:
+        rcs_data.data_conversion_function = "dB20"
+        image_db = getattr(rcs_data, product).data
+        misses = cache.misses
+        stage_misses = stage_cache.misses
+        rcs_data.data_conversion_function = "abs"
+        image_abs = getattr(rcs_data, product).data
+        # Only the conversion stage is computed again
+        assert cache.misses == misses + 1
+        assert stage_cache.misses == stage_misses
+        assert np.allclose(image_db, 20 * np.log10(image_abs), equal_nan=True)
+
+        rcs_data.upsample_range = 128
+        assert getattr(rcs_data, product).data.shape[0] == 128
+        # The resampled data is reused
+        assert cache.misses == misses + 2
+        assert stage_cache.misses == stage_misses + 1
+        rcs_data.upsample_range = 64
+
+    # The stages are cached even if they do not fit in the budget of the product cache
+    cache.clear()
+    cache.max_bytes = 1
+    stage_misses = stage_cache.misses
+    rcs_data.data_conversion_function = "dB20"
+    assert np.allclose(rcs_data.isar_3d.data, image_db)
+    assert not len(cache)
+    assert stage_cache.misses == stage_misses
+
+    rcs_data.out_of_core = True
+    rcs_data.data_conversion_function = "dB20"
+    assert np.allclose(rcs_data.isar_3d.data, image_db)
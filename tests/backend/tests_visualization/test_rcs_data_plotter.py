@@ -16,24 +16,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import json
 from pathlib import Path
 import shutil
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
 import warnings
 
+import numpy as np
 import pandas as pd
 import pytest
+from scipy.spatial import cKDTree
 
 from ansys.aedt.core.internal.checks import ERROR_GRAPHICS_REQUIRED
 from ansys.aedt.core.internal.checks import check_graphics_available
 from ansys.aedt.core.visualization.plot.matplotlib import ReportPlotter
 from ansys.aedt.toolkits.radar_explorer.rcs_visualization import MonostaticRCSData
 from ansys.aedt.toolkits.radar_explorer.rcs_visualization import MonostaticRCSPlotter
+from ansys.aedt.toolkits.radar_explorer.rcs_visualization import MonostaticRCSResult
+from ansys.aedt.toolkits.radar_explorer.rcs_visualization import SceneLODSwitcher
+from ansys.aedt.toolkits.radar_explorer.rcs_visualization import SceneMeshObject
 from tests import TESTS_VISUALIZATION_PATH
 
 try:
     check_graphics_available()
 
+    import pyvista as pv
+
     from ansys.tools.visualization_interface import Plotter
 except ImportError:  # pragma: no cover
     warnings.warn(ERROR_GRAPHICS_REQUIRED)
@@ -112,7 +123,13 @@ class TestClass:
             MonostaticRCSData(input_file=str(self.metadata_file_fake))
 
         rcs_data = MonostaticRCSData(input_file=str(self.metadata_file))
+        assert not rcs_data.is_loaded
+        assert rcs_data.name == "HH"
+        assert len(rcs_data.frequencies) == 3
+        assert rcs_data.incident_wave_theta == rcs_data.available_incident_wave_theta[0]
+        assert not rcs_data.is_loaded
         assert isinstance(rcs_data.raw_data, pd.DataFrame)
+        assert rcs_data.is_loaded
 
         assert isinstance(rcs_data.metadata, dict)
 
@@ -121,6 +138,11 @@ class TestClass:
         assert Path(rcs_data.input_file).is_file()
         assert rcs_data.frequency_units == "GHz"
         assert len(rcs_data.frequencies) == 3
+        assert rcs_data.rcs_cube.shape == (
+            3,
+            rcs_data.available_incident_wave_phi.size,
+            rcs_data.available_incident_wave_theta.size,
+        )
 
         assert rcs_data.available_incident_wave_theta.size == 3
         assert rcs_data.incident_wave_theta == rcs_data.available_incident_wave_theta[0]
@@ -151,6 +173,19 @@ class TestClass:
         rcs_data.frequency = 8.0
         assert rcs_data.frequency == rcs_data.frequencies[2]
 
+        rcs_data.frequency = f"{rcs_data.frequencies[1] * 1e3 + 1e-6}MHz"
+        assert rcs_data.frequency == rcs_data.frequencies[1]
+        rcs_data.incident_wave_theta = rcs_data.available_incident_wave_theta[2] + 1e-9
+        assert rcs_data.incident_wave_theta == rcs_data.available_incident_wave_theta[2]
+        rcs_data.snap_tolerance = 0
+        rcs_data.incident_wave_theta = rcs_data.available_incident_wave_theta[1] + 1e-9
+        assert rcs_data.incident_wave_theta == rcs_data.available_incident_wave_theta[2]
+        rcs_data.snap_tolerance = -1.0
+        assert rcs_data.snap_tolerance == 0.0
+        rcs_data.snap_tolerance = 1e-3
+        rcs_data.incident_wave_theta = rcs_data.available_incident_wave_theta[1]
+        rcs_data.frequency = rcs_data.frequencies[2]
+
         assert rcs_data.data_conversion_function == "dB20"
         rcs_data.data_conversion_function = "abs"
         assert rcs_data.data_conversion_function == "abs"
@@ -205,6 +240,10 @@ class TestClass:
         assert rcs_data.upsample_elevation == 2
 
         assert isinstance(rcs_data.rcs, complex)
+        raw_value = rcs_data.raw_data.loc[
+            (rcs_data.frequency, rcs_data.incident_wave_phi, rcs_data.incident_wave_theta), rcs_data.name
+        ]
+        assert rcs_data.rcs == raw_value
 
         assert isinstance(rcs_data.rcs_active_theta_phi, pd.DataFrame)
         assert isinstance(rcs_data.rcs_active_frequency, pd.DataFrame)
@@ -212,28 +251,46 @@ class TestClass:
         assert isinstance(rcs_data.rcs_active_phi, pd.DataFrame)
 
         assert isinstance(rcs_data.range_profile, pd.DataFrame)
-        assert isinstance(rcs_data.waterfall, pd.DataFrame)
-
-        assert isinstance(rcs_data.isar_2d, pd.DataFrame)
+        assert isinstance(rcs_data.waterfall, MonostaticRCSResult)
+        incident_wave_theta = rcs_data.incident_wave_theta
+        waterfall = rcs_data.waterfall
+        assert rcs_data.incident_wave_theta == incident_wave_theta
+        range_profile = rcs_data.range_profile
+        theta_idx = list(waterfall.axes["IWaveTheta"]).index(incident_wave_theta)
+        assert waterfall.data[theta_idx] == pytest.approx(range_profile["Data"].to_numpy())
+        assert waterfall.axes["Range"] == pytest.approx(range_profile["Range"].to_numpy())
+        waterfall_df = waterfall.to_dataframe()
+        assert list(waterfall_df.columns) == ["IWaveTheta", "Range", "Data"]
+        assert len(waterfall_df) == waterfall.data.size
+
+        assert isinstance(rcs_data.isar_2d, MonostaticRCSResult)
         rcs_data.aspect_range = "Horizontal"
-        assert isinstance(rcs_data.isar_2d, pd.DataFrame)
+        assert isinstance(rcs_data.isar_2d, MonostaticRCSResult)
         rcs_data.gridsize = "Inside"
-        assert isinstance(rcs_data.isar_2d, pd.DataFrame)
+        assert isinstance(rcs_data.isar_2d, MonostaticRCSResult)
 
         rcs_data.upsample_range = 2
-        assert isinstance(rcs_data.isar_2d, pd.DataFrame)
+        assert isinstance(rcs_data.isar_2d, MonostaticRCSResult)
+        isar_2d = rcs_data.isar_2d
+        assert isar_2d.shape == (isar_2d.axes["Down-range"].size, isar_2d.axes["Cross-range"].size)
+        isar_2d_df = isar_2d.to_dataframe()
+        assert list(isar_2d_df.columns) == ["Down-range", "Cross-range", "Data"]
+        assert isar_2d_df["Data"].to_numpy().reshape(isar_2d.shape) == pytest.approx(isar_2d.data)
+        assert isar_2d_df["Down-range"].unique() == pytest.approx(isar_2d.axes["Down-range"])
+        with pytest.raises(ValueError):
+            MonostaticRCSResult(isar_2d.data, {"Down-range": isar_2d.axes["Down-range"]})
 
         rcs_data.gridsize = "Inside"
-        assert isinstance(rcs_data.isar_3d, pd.DataFrame)
+        assert isinstance(rcs_data.isar_3d, MonostaticRCSResult)
         rcs_data.gridsize = "Outside"
-        assert isinstance(rcs_data.isar_3d, pd.DataFrame)
+        assert isinstance(rcs_data.isar_3d, MonostaticRCSResult)
         rcs_data.gridsize = "Middle"
-        assert isinstance(rcs_data.isar_3d, pd.DataFrame)
+        assert isinstance(rcs_data.isar_3d, MonostaticRCSResult)
 
         rcs_data.upsample_range = 0
         rcs_data.upsample_azimuth = 0
         rcs_data.upsample_elevation = 0
-        assert isinstance(rcs_data.isar_3d, pd.DataFrame)
+        assert isinstance(rcs_data.isar_3d, MonostaticRCSResult)
 
         assert rcs_data.window_function("Hann")
         assert rcs_data.window_function("Hamming")
@@ -426,6 +483,247 @@ class TestClass:
             rcs_plotter.rcs_data.aspect_range = "invented"
             rcs_plotter.add_isar_2d("Projection")
 
+    def test_rcs_plotter_projection(self):
+        find_nearest_neighbors = MonostaticRCSPlotter._MonostaticRCSPlotter__find_nearest_neighbors
+        rng = np.random.default_rng(0)
+        grid_origin = np.array([-1.0, -2.0, 0.5])
+        u, v, w = np.array([0.1, 0.0, 0.0]), np.array([0.0, 0.2, 0.05]), np.array([0.0, 0.0, 0.3])
+        target_points = rng.uniform(-3.0, 3.0, (1000, 3))
+        expected_3d, expected_2d = [], []
+        n = np.cross(u, v) / np.linalg.norm(np.cross(u, v))
+        for point in target_points:
+            i, j, k = np.round(np.linalg.pinv(np.column_stack((u, v, w))) @ (point - grid_origin)).astype(int)
+            expected_3d.append((i % 7) * 30 + (j % 6) * 5 + k % 5)
+            projected = point - np.dot(point - grid_origin, n) * n
+            i, j = np.round(np.linalg.pinv(np.column_stack((u, v))) @ (projected - grid_origin)).astype(int)
+            expected_2d.append((i % 7) * 6 + j % 6)
+        indices_3d = find_nearest_neighbors(None, target_points, grid_origin, u, v, w, (7, 6, 5), chunk_size=64)
+        indices_2d = find_nearest_neighbors(None, target_points, grid_origin, u, v, None, (7, 6), chunk_size=64)
+        assert np.array_equal(indices_3d, expected_3d)
+        assert np.array_equal(indices_2d, expected_2d)
+
+        # Without grid geometry, the k-d tree search matches a brute-force search
+        orig_points = rng.uniform(-3.0, 3.0, (200, 3))
+        expected = np.argmin(((orig_points[:, np.newaxis] - target_points) ** 2).sum(axis=2), axis=0)
+        indices = find_nearest_neighbors(orig_points, target_points, chunk_size=64)
+        assert np.array_equal(indices, expected)
+        indices = find_nearest_neighbors(cKDTree(orig_points), target_points, chunk_size=300, workers=2)
+        assert np.array_equal(indices, expected)
+
+        scalars = []
+        for threads, chunk_size in [(1, 262144), (3, 5)]:
+            rcs_data = MonostaticRCSData(input_file=str(self.metadata_file))
+            rcs_plotter = MonostaticRCSPlotter(rcs_data=rcs_data)
+            rcs_plotter.projection_threads = threads
+            rcs_plotter.projection_chunk_size = chunk_size
+            assert rcs_plotter.projection_threads == threads
+            rcs_plotter.add_isar_2d("Projection")
+            rcs_plotter.add_isar_3d(plot_type="projection")
+            rcs_plotter.add_range_profile(plot_type="projection")
+            results = rcs_plotter.all_scene_actors["results"]
+            scalars.append(
+                [
+                    results[product][f"{product}_0"].custom_object.mesh[rcs_data.data_conversion_function]
+                    for product in ["isar_2d", "isar_3d", "range_profile"]
+                ]
+            )
+        for scalars_1, scalars_3 in zip(*scalars):
+            assert np.array_equal(scalars_1, scalars_3)
+
+        # Re-plotting on the same grid reuses the index maps, and the model meshes keep their data
+        projection_cache = rcs_plotter._MonostaticRCSPlotter__projection_cache
+        entries = len(projection_cache)
+        model_meshes = [actor.custom_object.mesh for actor in rcs_plotter.all_scene_actors["model"].values()]
+        assert all(rcs_data.data_conversion_function not in mesh.point_data for mesh in model_meshes)
+        rcs_data.data_conversion_function = "abs"
+        rcs_plotter.add_isar_2d("Projection")
+        assert len(projection_cache) == entries
+        isar_objects = rcs_plotter.all_scene_actors["results"]["isar_2d"]
+        assert np.allclose(
+            10 ** (isar_objects["isar_2d_0"].custom_object.mesh["dB20"] / 20),
+            isar_objects["isar_2d_1"].custom_object.mesh["abs"],
+        )
+        # Editing a model mesh invalidates its index maps
+        model_meshes[0].points = model_meshes[0].points + 1.0
+        rcs_plotter.add_isar_2d("Projection")
+        assert len(projection_cache) == entries + 2
+
+        rcs_plotter.projection_threads = 0
+        rcs_plotter.projection_chunk_size = -1
+        assert rcs_plotter.projection_threads == 3
+        assert rcs_plotter.projection_chunk_size == 5
+
+    def test_rcs_plotter_lod_meshes(self, rcs_files):
+        data_dir = Path(rcs_files.metadata_file).parent
+        sphere = pv.Sphere(radius=100.0, theta_resolution=120, phi_resolution=120)
+        sphere.save(str(data_dir / "geometry" / "Sphere.obj"))
+        with Path(rcs_files.metadata_file).open("r") as f:
+            metadata = json.load(f)
+        metadata["model_info"]["Sphere"] = ["Sphere.obj", [0, 0, 255], 1.0, "mm"]
+        metadata_file = data_dir / "rcs_metadata_lod.json"
+        with metadata_file.open("w") as f:
+            json.dump(metadata, f)
+
+        cache_dir = data_dir / "mesh_cache"
+        rcs_data = MonostaticRCSData(input_file=str(metadata_file))
+        rcs_plotter = MonostaticRCSPlotter(rcs_data=rcs_data, mesh_cache_directory=cache_dir)
+        rcs_plotter.lod_min_cells = 1000
+        model_objects = {name: actor.custom_object for name, actor in rcs_plotter.all_scene_actors["model"].items()}
+        sphere_object = model_objects["Sphere"]
+        n_cells = sphere_object.mesh.n_cells
+
+        # The levels are only built when a mesh exceeds the number of cells
+        assert not list(cache_dir.glob("*_lod*.vtp"))
+        assert sphere_object.get_lod_mesh() is sphere_object.mesh
+        assert sphere_object.get_lod_mesh(n_cells) is sphere_object.mesh
+        assert not list(cache_dir.glob("*_lod*.vtp"))
+        lod_mesh = sphere_object.get_lod_mesh(n_cells // 2)
+        assert lod_mesh is sphere_object.lod_meshes[0]
+        assert model_objects["Polyline1"].lod_meshes == []
+        assert [lod_mesh.n_cells for lod_mesh in sphere_object.lod_meshes] == pytest.approx(
+            [n_cells * 0.1, n_cells * 0.01], rel=0.2
+        )
+        assert not list((data_dir / "geometry").glob("*.lod*"))
+        assert len(list(cache_dir.glob("*_lod0.1_v*.vtp"))) == 1
+        assert len(list(cache_dir.glob("*_lod0.01_v*.vtp"))) == 1
+
+        assert sphere_object.get_lod_mesh(n_cells // 20) is sphere_object.lod_meshes[1]
+        assert sphere_object.get_lod_mesh(1) is sphere_object.lod_meshes[1]
+        assert rcs_plotter.build_lod_meshes()
+        assert len(sphere_object.lod_meshes) == 2
+
+        # The levels are read from the cache files
+        rcs_plotter_cached = MonostaticRCSPlotter(rcs_data=rcs_data, mesh_cache_directory=cache_dir)
+        rcs_plotter_cached.lod_min_cells = 1000
+        with patch("pyvista.PolyData.decimate") as decimate:
+            lod_meshes = rcs_plotter_cached.all_scene_actors["model"]["Sphere"].custom_object.lod_meshes
+        decimate.assert_not_called()
+        for lod_mesh, lod_mesh_cached in zip(sphere_object.lod_meshes, lod_meshes):
+            assert np.allclose(lod_mesh.points, lod_mesh_cached.points)
+        assert "lod_source" not in lod_meshes[0].field_data
+
+        # The levels are still built if the cache cannot be written
+        for lod_file in cache_dir.glob("*_lod*.vtp"):
+            lod_file.unlink()
+        rcs_plotter_read_only = MonostaticRCSPlotter(rcs_data=rcs_data, mesh_cache_directory=cache_dir)
+        rcs_plotter_read_only.lod_min_cells = 1000
+        with patch("tempfile.mkstemp", side_effect=OSError("read-only")):
+            assert rcs_plotter_read_only.build_lod_meshes()
+        assert len(rcs_plotter_read_only.all_scene_actors["model"]["Sphere"].custom_object.lod_meshes) == 2
+        assert not list(cache_dir.glob("*_lod*.vtp"))
+
+        # Without the mesh cache, the levels are decimated in memory
+        rcs_plotter_no_cache = MonostaticRCSPlotter(rcs_data=rcs_data, mesh_cache=False)
+        rcs_plotter_no_cache.lod_min_cells = 1000
+        assert len(rcs_plotter_no_cache.all_scene_actors["model"]["Sphere"].custom_object.lod_meshes) == 2
+
+        rcs_plotter.lod_fractions = [0.5, 1.5]
+        rcs_plotter.lod_min_cells = -1
+        assert rcs_plotter.lod_fractions == (0.1, 0.01)
+        assert rcs_plotter.lod_min_cells == 1000
+
+    def test_rcs_scene_lod_switcher(self):
+        switcher = SceneLODSwitcher(facet_budget=2000, interactive_facet_budget=200)
+        assert switcher.ratios(0) == (1.0, 1.0)
+        assert switcher.ratios(1000) == (1.0, 0.2)
+        assert switcher.ratios(4000) == (0.5, 0.05)
+
+        # The levels of detail are built in the background and the first one waits for a release
+        release = threading.Event()
+        model_object = SceneMeshObject()
+        model_object.mesh = pv.Sphere(theta_resolution=60, phi_resolution=60)
+        n_cells = model_object.mesh.n_cells
+        model_object.lod_loader = lambda: release.wait(10) and [model_object.mesh.triangulate().decimate(0.9)]
+        actor = SimpleNamespace(mapper=SimpleNamespace(dataset=model_object.mesh))
+        assert not switcher.add(actor, model_object, model_object.mesh, n_cells)
+        assert switcher.add(actor, model_object, model_object.mesh, n_cells // 5, np.diag([2.0, 2.0, 2.0, 1.0]))
+        assert len(switcher) == 1
+
+        # The idle mesh is kept while the interactive mesh is not ready
+        assert not switcher.start_interaction()
+        assert actor.mapper.dataset is model_object.mesh
+        assert not switcher.end_interaction()
+        release.set()
+        assert switcher.wait(10)
+        assert switcher.start_interaction()
+        interactive_mesh = actor.mapper.dataset
+        assert interactive_mesh.n_cells < n_cells // 5
+        assert np.allclose(interactive_mesh.bounds, 2 * np.asarray(model_object.lod_meshes[0].bounds))
+        assert switcher.end_interaction()
+        assert actor.mapper.dataset is model_object.mesh
+
+        # A mesh without a coarser level is not swapped
+        flat_object = SceneMeshObject()
+        flat_object.mesh = pv.Plane()
+        flat_actor = SimpleNamespace(mapper=SimpleNamespace(dataset=flat_object.mesh))
+        switcher.clear()
+        assert len(switcher) == 0
+        assert switcher.add(flat_actor, flat_object, flat_object.mesh, 1)
+        assert switcher.wait(10)
+        assert not switcher.start_interaction()
+        assert flat_actor.mapper.dataset is flat_object.mesh
+
+    def test_rcs_plotter_mesh_cache(self, rcs_files):
+        data_dir = Path(rcs_files.metadata_file).parent
+        cache_dir = data_dir / "mesh_cache"
+        with Path(rcs_files.metadata_file).open("r") as f:
+            metadata = json.load(f)
+        metadata["model_info"]["Polyline1_2"][3] = "meter"
+        metadata_file = data_dir / "rcs_metadata_units.json"
+        with metadata_file.open("w") as f:
+            json.dump(metadata, f)
+        rcs_data = MonostaticRCSData(input_file=str(metadata_file))
+
+        rcs_plotter_obj = MonostaticRCSPlotter(rcs_data=rcs_data, mesh_cache=False)
+        assert not rcs_plotter_obj.mesh_cache
+        assert "radar_explorer" in str(rcs_plotter_obj.mesh_cache_directory)
+        rcs_plotter = MonostaticRCSPlotter(rcs_data=rcs_data, mesh_cache_directory=cache_dir)
+        assert rcs_plotter.mesh_cache_directory == cache_dir
+        digest = hashlib.sha256((data_dir / "geometry" / "Polyline1.obj").read_bytes()).hexdigest()
+        assert list(cache_dir.glob(f"{digest}_1_v*.vtp"))
+        assert len(list(cache_dir.glob("*.json"))) == 3
+
+        # Indexed files are neither hashed nor parsed
+        with (
+            patch("hashlib.sha256", wraps=hashlib.sha256) as sha256,
+            patch("pyvista.read", wraps=pv.read) as read,
+        ):
+            rcs_plotter_cached = MonostaticRCSPlotter(rcs_data=rcs_data, mesh_cache_directory=cache_dir)
+        assert all(len(call.args) == 1 for call in sha256.call_args_list)
+        assert all(Path(call.args[0]).suffix == ".vtp" for call in read.call_args_list)
+
+        obj_meshes = rcs_plotter_obj.all_scene_actors["model"]
+        for plotter in [rcs_plotter, rcs_plotter_cached]:
+            for name, actor in plotter.all_scene_actors["model"].items():
+                assert np.allclose(actor.custom_object.mesh.points, obj_meshes[name].custom_object.mesh.points)
+                assert np.array_equal(actor.custom_object.mesh.faces, obj_meshes[name].custom_object.mesh.faces)
+                assert "mesh_source" not in actor.custom_object.mesh.field_data
+
+        # The meshes are scaled to the units of the first model
+        mesh = obj_meshes["Polyline1_2"].custom_object.mesh
+        mesh_obj = pv.read(str(data_dir / "geometry" / "Polyline1_2.obj"))
+        assert np.allclose(mesh.points, mesh_obj.points * 1000.0)
+        assert np.allclose(
+            obj_meshes["Polyline1"].custom_object.mesh.points,
+            pv.read(str(data_dir / "geometry" / "Polyline1.obj")).points,
+        )
+
+        # A cache file of another mesh is not used
+        mesh_file = next(cache_dir.glob(f"{digest}_1_v*.vtp"))
+        pv.Sphere().save(str(mesh_file))
+        rcs_plotter_cached = MonostaticRCSPlotter(rcs_data=rcs_data, mesh_cache_directory=cache_dir)
+        mesh = rcs_plotter_cached.all_scene_actors["model"]["Polyline1"].custom_object.mesh
+        assert np.allclose(mesh.points, obj_meshes["Polyline1"].custom_object.mesh.points)
+
+        # The least recently used files are removed first
+        nbytes = sum(file.stat().st_size for file in cache_dir.iterdir())
+        rcs_plotter_cached.mesh_cache_max_bytes = nbytes - 1
+        assert sum(file.stat().st_size for file in cache_dir.iterdir()) < nbytes
+        rcs_plotter_cached.mesh_cache_max_bytes = -1
+        assert rcs_plotter_cached.mesh_cache_max_bytes == nbytes - 1
+        rcs_plotter_cached.mesh_cache_max_bytes = 0
+        assert not list(cache_dir.iterdir())
+
     def test_rcs_plotter_add_isar_3d(self):
         rcs_data = MonostaticRCSData(input_file=str(self.metadata_file))
         rcs_plotter = MonostaticRCSPlotter(rcs_data=rcs_data)
@@ -435,10 +733,25 @@ class TestClass:
         plot = rcs_plotter.plot_scene(show=False)
         assert isinstance(plot, Plotter)
 
+        # Only the color map changes, so the iso-surfaces are reused
+        rcs_plotter.add_isar_3d(color_bar="viridis")
+        isar_objects = rcs_plotter.all_scene_actors["results"]["isar_3d"]
+        mesh_0 = isar_objects["isar_3d_0"].custom_object.mesh
+        mesh_1 = isar_objects["isar_3d_1"].custom_object.mesh
+        assert mesh_1 is not mesh_0
+        assert np.array_equal(mesh_1.points, mesh_0.points)
+        assert isar_objects["isar_3d_1"].custom_object.color_map == "viridis"
+
         rcs_plotter.add_isar_3d(plot_type="point cloud")
         plot = rcs_plotter.plot_scene(show=False)
         assert isinstance(plot, Plotter)
 
+        # Without a conversion function, the image is in dB10
+        rcs_data.data_conversion_function = None
+        rcs_plotter.add_isar_3d(plot_type="point cloud")
+        assert rcs_plotter.all_scene_actors["results"]["isar_3d"]["isar_3d_3"].custom_object.opacity == "geom"
+        rcs_data.data_conversion_function = "dB20"
+
         rcs_plotter.add_isar_3d(plot_type="plane cut", plane_cut="xy", plane_offset=0)
         plot = rcs_plotter.plot_scene(show=False)
         assert isinstance(plot, Plotter)